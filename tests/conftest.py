@@ -1 +1,82 @@
 from __future__ import annotations
+
+import sys
+import textwrap
+
+import pytest
+
+PROJECT = "xodex_testgame"
+
+PROJECT_FILES = {
+    "__init__.py": "",
+    "settings.py": f"""
+        PROJECT = "{PROJECT}"
+        WINDOW_SIZE = (64, 48)
+        TITLE = "Test Game"
+        ICON_PATH = None
+        FPS = 0
+        FULLSCREEN = False
+        SHOW_FPS = False
+        MAIN_SCENE = "TestScene"
+    """,
+    "objects.py": "",
+    "scenes.py": """
+        from xodex.scene import Scene
+        from xodex.scene import register
+
+
+        @register(name="TestScene")
+        class TestScene(Scene):
+            def _generate_objects_(self):
+                yield from ()
+    """,
+}
+
+
+@pytest.fixture
+def make_project(tmp_path, monkeypatch):
+    """
+    Write a throwaway project and configure the settings for it, headless.
+
+    Call as ``make_project(files=None, **settings)``; `files` adds or replaces project
+    modules (``{"entities.py": source}``) and the keyword arguments override settings.
+    """
+    from xodex.conf import settings
+    from xodex.game import Game
+    from xodex.object import ObjectsManager
+    from xodex.scene import SceneManager
+
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    monkeypatch.setenv("SDL_AUDIODRIVER", "dummy")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    def make(files=None, **options):
+        package = tmp_path / PROJECT
+        package.mkdir()
+        for name, source in {**PROJECT_FILES, **(files or {})}.items():
+            (package / name).write_text(textwrap.dedent(source))
+        settings.configure(default_settings=f"{PROJECT}.settings", **options)
+
+    yield make
+
+    game = Game._instances.pop(Game, None)
+    if game is not None and game._watchdog is not None:
+        game._watchdog.stop()
+    SceneManager().clear()
+    SceneManager().clear_registry()
+    ObjectsManager().clear()
+    settings._settings = None
+    for module in [module for module in sys.modules if module.split(".")[0] == PROJECT]:
+        del sys.modules[module]
+
+
+@pytest.fixture
+def make_game(make_project):
+    """Build a headless Game for a throwaway project; takes the arguments of ``make_project``."""
+    from xodex.game import Game
+
+    def make(files=None, **options):
+        make_project(files, **options)
+        return Game()
+
+    return make
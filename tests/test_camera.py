@@ -0,0 +1,86 @@
+import pygame
+import pytest
+
+from xodex.object.base import DrawableObject
+from xodex.scene.camera import Camera
+
+
+class Box(DrawableObject):
+    def __init__(self, pos=(0, 0), size=(10, 10)):
+        self.rect = pygame.Rect(pos, size)
+
+    def perform_draw(self, surface, *args, **kwargs):
+        surface.fill((255, 0, 0), self.rect.move(kwargs.get("view_offset", (0, 0))))
+
+
+def test_follow_centres_target_and_clamps_to_bounds():
+    camera = Camera((100, 100), bounds=(0, 0, 1000, 100))
+    player = Box((500, 50))
+    camera.follow(player)
+    camera.update(16)
+    assert (camera.x, camera.y) == (455, 0)
+    player.rect.x = 990
+    camera.update(16)
+    assert camera.x == 900
+    assert camera.view == pygame.Rect(900, 0, 100, 100)
+
+
+def test_smoothing_and_deadzone():
+    camera = Camera((100, 100))
+    player = Box((200, 45))
+    camera.follow(player, smoothing=100)
+    camera.update(16)
+    assert 0 < camera.x < 155
+    camera = Camera((100, 100))
+    camera.follow(Box((40, 40)), deadzone=(25, 25, 50, 50))
+    camera.update(16)
+    assert (camera.x, camera.y) == (0, 0)
+
+
+def test_screen_world_conversion():
+    camera = Camera((100, 100))
+    camera.move_to(30, 40)
+    assert camera.to_screen((30, 40)) == (0, 0)
+    assert camera.to_world((5, 5)) == (35, 45)
+    assert camera.apply((30, 40, 10, 10)) == pygame.Rect(0, 0, 10, 10)
+    assert camera.is_visible((125, 135, 10, 10))
+    assert not camera.is_visible((130, 140, 10, 10))
+
+
+def test_shake_fades_and_can_be_disabled():
+    camera = Camera((100, 100))
+    camera.shake(10, 100)
+    camera.update(50)
+    assert all(abs(value) <= 5 for value in camera.offset)
+    assert camera.view.width > 100
+    camera.update(60)
+    assert camera.offset == (0, 0)
+    camera = Camera((100, 100), shake_enabled=False)
+    camera.shake(10, 100)
+    camera.update(50)
+    assert camera.offset == (0, 0)
+    assert camera.view.width == 100
+
+
+def test_blit_scaled_applies_view_offset():
+    image = pygame.Surface((20, 20))
+    surface = pygame.Surface((100, 100))
+    box = Box()
+    assert box.blit_scaled(surface, image, (40, 40), offset=(-30, -30)) == pygame.Rect(10, 10, 20, 20)
+    assert box.blit_scaled(surface, image, (40, 40), 0.5, offset=(-20, -20)) == pygame.Rect(10, 10, 10, 10)
+
+
+def test_invisible_objects_are_not_drawn():
+    surface = pygame.Surface((20, 20))
+    box = Box()
+    box.set_visible(False)
+    box.draw_xodex_object(surface)
+    assert surface.get_at((5, 5)) == pygame.Color(0, 0, 0)
+    box.set_visible(True)
+    box.draw_xodex_object(surface, view_offset=(5, 5))
+    assert surface.get_at((2, 2)) == pygame.Color(0, 0, 0)
+    assert surface.get_at((7, 7)) == pygame.Color(255, 0, 0)
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", "--tb=short", __file__])
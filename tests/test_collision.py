@@ -0,0 +1,71 @@
+import random
+
+import pygame
+import pytest
+
+from xodex.object.base import CollidableObject
+from xodex.object.base import LogicalObject
+from xodex.scene.collision import CollisionSystem
+from xodex.scene.collision import NUMPY_AVAILABLE
+
+
+class Body(LogicalObject, CollidableObject):
+    def __init__(self, x, y, w=10, h=10, layer=1, mask=-1):
+        self.rect = pygame.Rect(x, y, w, h)
+        self.collision_layer = layer
+        self.collision_mask = mask
+        self.hits = []
+
+    def perform_update(self, deltatime, *args, **kwargs):
+        pass
+
+    def on_collision(self, other):
+        self.hits.append(other)
+
+
+def brute_force(bodies):
+    return {
+        frozenset((a, b))
+        for i, a in enumerate(bodies)
+        for b in bodies[i + 1 :]
+        if a.rect.colliderect(b.rect) and (a.collision_mask & b.collision_layer or b.collision_mask & a.collision_layer)
+    }
+
+
+def test_layers_decide_who_is_notified():
+    player = Body(0, 0, layer=0b01, mask=0b10)
+    enemy = Body(5, 5, layer=0b10, mask=0)
+    ghost = Body(5, 5, layer=0b100, mask=0)
+    pairs = CollisionSystem(use_numpy=False).step([player, enemy, ghost])
+    assert [frozenset(pair) for pair in pairs] == [frozenset((player, enemy))]
+    assert player.hits == [enemy]
+    assert enemy.hits == []
+
+
+def test_pixel_masks_refine_rect_overlap():
+    first, second = Body(0, 0, 10, 10), Body(5, 5, 10, 10)
+    first.mask = pygame.mask.Mask((10, 10))
+    first.mask.set_at((0, 0))
+    assert CollisionSystem(use_numpy=False).find_pairs([first, second]) == []
+    first.mask.set_at((9, 9))
+    assert len(CollisionSystem(use_numpy=False).find_pairs([first, second])) == 1
+
+
+@pytest.mark.parametrize(
+    "use_numpy", [False, pytest.param(True, marks=pytest.mark.skipif(not NUMPY_AVAILABLE, reason="needs numpy"))]
+)
+def test_broadphase_matches_brute_force(use_numpy):
+    rng = random.Random(3)
+    bodies = []
+    for _ in range(300):
+        body = Body(rng.randrange(600), rng.randrange(400), rng.randrange(1, 40), rng.randrange(1, 40))
+        body.collision_layer = rng.choice((1, 2, 4))
+        body.collision_mask = rng.choice((0, 1, 3, -1))
+        bodies.append(body)
+    pairs = CollisionSystem(use_numpy=use_numpy).find_pairs(bodies)
+    assert {frozenset(pair) for pair in pairs} == brute_force(bodies)
+    assert len(pairs) == len(brute_force(bodies))
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", "--tb=short", __file__])
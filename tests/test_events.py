@@ -0,0 +1,64 @@
+import pygame
+import pytest
+
+from xodex.game.events import coalesce_events
+
+
+def motion(rel, pos=(0, 0)):
+    return pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=rel, buttons=(0, 0, 0))
+
+
+def test_consecutive_motion_merges_rel():
+    events = coalesce_events([motion((1, 2), (1, 2)), motion((3, 4), (4, 6))])
+    assert len(events) == 1
+    assert events[0].rel == (4, 6)
+    assert events[0].pos == (4, 6)
+
+
+def test_merged_events_keep_oldest_timestamp():
+    first, second = motion((1, 0)), motion((2, 0))
+    first.xodex_timestamp, second.xodex_timestamp = 1.0, 2.0
+    axes = [pygame.event.Event(pygame.JOYAXISMOTION, instance_id=0, axis=0, value=v) for v in (0.1, 0.2)]
+    axes[0].xodex_timestamp, axes[1].xodex_timestamp = 3.0, 4.0
+    resizes = [pygame.event.Event(pygame.VIDEORESIZE, size=(w, 10), w=w, h=10) for w in (10, 20)]
+    resizes[0].xodex_timestamp, resizes[1].xodex_timestamp = 5.0, 6.0
+    events = coalesce_events([first, second, *axes, *resizes])
+    assert [event.xodex_timestamp for event in events] == [1.0, 3.0, 5.0]
+    assert events[0].rel == (3, 0) and events[1].value == 0.2 and events[2].w == 20
+
+
+def test_discrete_events_keep_order():
+    click = pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(0, 0))
+    events = coalesce_events([motion((1, 0)), click, motion((1, 0)), motion((2, 0))])
+    assert [event.type for event in events] == [pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEMOTION]
+    assert events[2].rel == (3, 0)
+
+
+def test_joystick_axes_merge_per_axis():
+    def axis(axis, value):
+        return pygame.event.Event(pygame.JOYAXISMOTION, instance_id=0, axis=axis, value=value)
+
+    events = coalesce_events([axis(0, 0.1), axis(0, 0.5), axis(1, 0.2)])
+    assert [(event.axis, event.value) for event in events] == [(0, 0.5), (1, 0.2)]
+
+
+def test_only_last_resize_is_kept():
+    key = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a)
+    events = coalesce_events(
+        [
+            pygame.event.Event(pygame.VIDEORESIZE, size=(100, 100)),
+            key,
+            pygame.event.Event(pygame.VIDEORESIZE, size=(200, 200)),
+        ]
+    )
+    assert [event.type for event in events] == [pygame.KEYDOWN, pygame.VIDEORESIZE]
+    assert events[1].size == (200, 200)
+
+
+def test_types_not_listed_pass_through():
+    events = [motion((1, 0)), motion((1, 0))]
+    assert coalesce_events(events, types=()) == events
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", "--tb=short", __file__])
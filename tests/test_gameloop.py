@@ -0,0 +1,238 @@
+import pygame
+import pytest
+
+from xodex.object import ObjectsManager
+from xodex.object.base import DrawableObject
+from xodex.object.base import LogicalObject
+from xodex.scene import SceneManager
+from xodex.scene.camera import Camera
+
+
+class UpdateError(Exception): ...
+
+
+class Box(DrawableObject):
+    def __init__(self):
+        self.rect = pygame.Rect(0, 0, 4, 4)
+
+    def perform_draw(self, surface, *args, **kwargs):
+        surface.fill((255, 0, 0), self.rect)
+
+
+class Tile(DrawableObject):
+    def __init__(self, pos, log):
+        self.rect = pygame.Rect(pos, (4, 4))
+        self.log = log
+
+    def perform_draw(self, surface, *args, **kwargs):
+        self.log.append(self)
+
+
+class Mover(Tile, LogicalObject):
+    def perform_update(self, deltatime, *args, **kwargs):
+        self.rect.x += 100
+
+
+class Overlay(Tile):
+    def __init__(self, log):
+        self.rect = None
+        self.log = log
+
+
+def count_draws(game, scene):
+    """Record the frame of every draw_scene call on `scene`."""
+    draws = []
+    draw_scene = scene.draw_scene
+
+    def counted(*args, **kwargs):
+        draws.append(game.frame)
+        return draw_scene(*args, **kwargs)
+
+    scene.draw_scene = counted
+    return draws
+
+
+def test_pipelined_loop_raises_error_of_last_update(make_game):
+    game = make_game(PIPELINED_FRAMES=True)
+    scene = SceneManager().current
+    updates = []
+
+    def update_scene(deltatime, *args, **kwargs):
+        updates.append(deltatime)
+        if len(updates) == 4:  # The update submitted while presenting the third frame
+            raise UpdateError
+
+    scene.update_scene = update_scene
+    with pytest.raises(UpdateError):
+        game.main_loop(max_frames=3)
+    assert game.frame == 3 and len(updates) == 4
+
+
+def test_draw_direct_matches_scene_surface_and_falls_back(make_game):
+    make_game()
+    scene = SceneManager().current
+    scene.objects.append(Box())
+    display = pygame.Surface(scene.size)
+    assert scene.can_draw_direct(display)
+    assert scene.draw_direct(display) is display and scene.dirty_rects is None
+    assert pygame.image.tobytes(display, "RGB") == pygame.image.tobytes(scene.draw_scene(), "RGB")
+
+    assert not scene.can_draw_direct(pygame.Surface((10, 10)))
+    scene._render_scale = 0.5
+    assert not scene.can_draw_direct(display)
+    scene._render_scale = 1.0
+    scene.direct_draw = False
+    assert not scene.can_draw_direct(display)
+
+    class Effects(type(scene)):
+        def draw_scene(self, *args, **kwargs):
+            return super().draw_scene(*args, **kwargs)
+
+    assert not Effects().can_draw_direct(display)
+
+
+def test_direct_rendering_skips_scene_surface_when_allowed(make_game):
+    game = make_game(DIRECT_RENDERING=True)
+    scene = SceneManager().current
+    draws = count_draws(game, scene)
+    game.main_loop(max_frames=2)
+    assert draws == []
+    scene.direct_draw = False
+    game.main_loop(max_frames=4)
+    assert draws == [2, 3]
+
+
+def test_camera_draws_indexed_hits_and_rebuckets_only_movers(make_game, monkeypatch):
+    make_game()
+    scene = SceneManager().current
+    log = []
+    tiles = [Tile((x * 100, 0), log) for x in range(50)]
+    tiles[0].z_index = 1
+    mover, overlay = Mover((-100, 0), log), Overlay(log)
+    scene.objects.extend([*tiles, mover, overlay])
+    scene.set_camera(Camera(scene.size))
+    scene.draw_scene()
+    assert log == [overlay, tiles[0]]
+
+    grid = scene.spatial
+    updated = []
+    monkeypatch.setattr(grid, "sync", None)
+    monkeypatch.setattr(grid, "update", lambda objects, update=grid.update: updated.append(objects) or update(objects))
+    scene.update_scene(16)
+    log.clear()
+    scene.draw_scene()
+    assert updated == [[mover]]
+    assert log == [mover, overlay, tiles[0]]
+
+
+def test_scene_span_args_are_built_only_while_profiling(make_game, monkeypatch):
+    game = make_game()
+    profiler = game._profiler
+    span_args = []
+    span = profiler.span
+    monkeypatch.setattr(profiler, "span", lambda name, args=None: span_args.append((name, args)) or span(name, args))
+    game.main_loop(max_frames=1)
+    assert ("update", None) in span_args and ("draw", None) in span_args
+
+    span_args.clear()
+    profiler.enable()
+    game.main_loop(max_frames=2)
+    assert ("draw", {"scene": "TestScene"}) in span_args and ("update", {"scene": "TestScene"}) in span_args
+
+
+def test_fixed_steps_carry_leftover_time_as_alpha(make_game):
+    game = make_game(FIXED_TIMESTEP=True, UPDATE_RATE=100, MAX_UPDATE_STEPS=3)
+    steps = []
+    SceneManager().current.update_scene = lambda deltatime, *args, **kwargs: steps.append(deltatime)
+    process_logic = game._Game__process_all_logic
+
+    assert process_logic(4) == pytest.approx(0.4) and steps == []
+    assert process_logic(7) == pytest.approx(0.1) and steps == [10]
+    assert process_logic(25) == pytest.approx(0.6) and steps == [10] * 3
+    assert process_logic(4) == 0 and steps == [10] * 4
+
+
+def test_fixed_steps_are_capped_and_drop_the_backlog(make_game):
+    game = make_game(FIXED_TIMESTEP=True, UPDATE_RATE=100, MAX_UPDATE_STEPS=3)
+    consume_fixed_steps = game._Game__consume_fixed_steps
+
+    assert consume_fixed_steps(35) == 3 and game._accumulator == pytest.approx(5)
+    assert consume_fixed_steps(1000) == 3 and game._accumulator == pytest.approx(5)
+    assert consume_fixed_steps(25) == 3 and game._accumulator == 0
+
+
+def test_on_demand_scene_idles_until_event_or_dirty_mark(make_game):
+    game = make_game(ON_DEMAND_RENDERING=True, ON_DEMAND_TIMEOUT=1)
+    scene = SceneManager().current
+    scene.render_on_demand = True
+    box = Box()
+    scene.objects.append(box)
+    draws = count_draws(game, scene)
+    game.main_loop(max_frames=2)  # The first frames present the new scene
+    draws.clear()
+
+    game.main_loop(max_frames=5)
+    assert draws == []
+    box.mark_dirty()
+    game.main_loop(max_frames=8)
+    assert draws == [5]
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a))
+    game.main_loop(max_frames=11)
+    assert draws == [5, 8]
+
+
+def test_idle_wait_is_left_out_of_the_next_delta(make_game):
+    game = make_game(ON_DEMAND_RENDERING=True, ON_DEMAND_TIMEOUT=50)
+    scene = SceneManager().current
+    scene.render_on_demand = True
+    deltas = []
+    scene.update_scene = lambda deltatime, *args, **kwargs: deltas.append(deltatime)
+    game.main_loop(max_frames=2)  # The first frames present the new scene
+    deltas.clear()
+
+    game.main_loop(max_frames=5)  # Frames 2 to 4 each wait out the timeout
+    assert len(deltas) == 3 and max(deltas[1:]) < 25
+
+
+ENTITIES = """
+    from xodex.object import LogicalObject
+    from xodex.object import register
+
+
+    @register(name="Enemy")
+    class Enemy(LogicalObject):
+        def perform_update(self, deltatime, *args, **kwargs): ...
+"""
+
+LEVELS = """
+    from xodex.scene import Scene
+    from xodex.scene import register
+
+
+    @register(name="Level")
+    class Level(Scene):
+        def _generate_objects_(self):
+            yield from ()
+"""
+
+
+def test_soft_restart_rebuilds_registrations_of_all_project_modules(make_game):
+    files = {
+        "__init__.py": "from . import levels",
+        "entities.py": ENTITIES,
+        "objects.py": "from . import entities",
+        "levels.py": LEVELS,
+    }
+    game = make_game(files=files)
+    objects, scenes = ObjectsManager(), SceneManager()
+    enemy, level, main = objects.get_object("Enemy"), scenes.get_scene_class("Level"), scenes.current
+
+    game.restart_game(soft=True)
+    assert objects.is_registered("Enemy") and objects.get_object("Enemy") is not enemy
+    assert scenes.is_registered("Level") and scenes.get_scene_class("Level") is not level
+    assert scenes.is_registered("TestScene") and scenes.current is not main
+    assert game.ready
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", "--tb=short", __file__])
@@ -0,0 +1,47 @@
+import pygame
+import pytest
+
+from xodex.object.base import EventfulObject
+from xodex.utils.latency import LatencyTracker
+
+
+class Button(EventfulObject):
+    def handle_event(self, event, *args, **kwargs):
+        pass
+
+
+@pytest.fixture
+def tracker():
+    tracker = LatencyTracker()
+    tracker.clear()
+    tracker.enable()
+    yield tracker
+    tracker.disable()
+    tracker.clear()
+
+
+def test_handled_events_are_sampled_on_present(tracker):
+    key = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a)
+    ignored = pygame.event.Event(pygame.MOUSEMOTION, rel=(1, 1))
+    tracker.stamp([key, ignored], timestamp=1.0)
+    Button().handle_xodex_event(key)
+    tracker.presented(timestamp=1.012)
+
+    assert tracker.samples(pygame.KEYDOWN) == [pytest.approx(12.0)]
+    assert tracker.samples(pygame.MOUSEMOTION) == []
+    entry = tracker.histogram()[pygame.event.event_name(pygame.KEYDOWN)]
+    assert entry["count"] == 1
+    assert entry["buckets"]["<=16 ms"] == 1
+
+
+def test_disabled_tracker_ignores_events(tracker):
+    tracker.disable()
+    key = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a)
+    tracker.stamp([key], timestamp=1.0)
+    Button().handle_xodex_event(key)
+    tracker.presented(timestamp=2.0)
+    assert tracker.report() == ""
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", "--tb=short", __file__])
@@ -0,0 +1,326 @@
+import pygame
+import pytest
+
+from xodex.object.base import DrawableObject
+from xodex.object.base import EventfulObject
+from xodex.object.base import LogicalObject
+from xodex.object.objects import Objects
+
+
+class Box(DrawableObject):
+    def __init__(self, pos=(0, 0), size=(10, 10), color=(255, 0, 0)):
+        self.rect = pygame.Rect(pos, size)
+        self.color = color
+
+    def perform_draw(self, surface, *args, **kwargs):
+        surface.fill(self.color, self.rect)
+
+
+class Listener(EventfulObject):
+    def __init__(self, log, event_types=None):
+        self.log = log
+        self.event_types = event_types
+
+    def handle_event(self, event, *args, **kwargs):
+        self.log.append((self, event.type))
+
+
+@pytest.fixture
+def objects():
+    objs = Objects()
+    objs.extend([Box((0, 0)), Box((50, 50), color=(0, 255, 0))])
+    return objs
+
+
+def test_dirty_requires_full_redraw_first(objects):
+    surface = pygame.Surface((100, 100))
+    assert objects.draw_dirty_object(surface, (0, 0, 0)) is None
+
+
+def test_dirty_reports_only_moved_object(objects):
+    surface = pygame.Surface((100, 100))
+    objects.reset_dirty_rects()
+    objects.draw_object(surface)
+    assert objects.draw_dirty_object(surface, (0, 0, 0)) == []
+
+    objects[0].rect.x = 20
+    rects = objects.draw_dirty_object(surface, (0, 0, 0))
+    assert rects == [pygame.Rect(0, 0, 10, 10), pygame.Rect(20, 0, 10, 10)]
+    assert surface.get_at((5, 5))[:3] == (0, 0, 0)
+    assert surface.get_at((25, 5))[:3] == (255, 0, 0)
+
+
+def test_dirty_erases_removed_object(objects):
+    surface = pygame.Surface((100, 100))
+    objects.reset_dirty_rects()
+    objects.draw_object(surface)
+    objects.remove(objects[1])
+    assert objects.draw_dirty_object(surface, (0, 0, 0)) == [pygame.Rect(50, 50, 10, 10)]
+    assert surface.get_at((55, 55))[:3] == (0, 0, 0)
+
+
+def test_clear_forces_full_redraw(objects):
+    surface = pygame.Surface((100, 100))
+    objects.reset_dirty_rects()
+    objects.clear()
+    assert objects.draw_dirty_object(surface, (0, 0, 0)) is None
+
+
+def test_blit_scaled_draws_at_render_scale():
+    box = Box()
+    image = pygame.Surface((20, 20))
+    image.fill((0, 0, 255))
+    surface = pygame.Surface((50, 50))
+    rect = box.blit_scaled(surface, image, (40, 40), 0.5)
+    assert rect == pygame.Rect(20, 20, 10, 10)
+    cached = box._scaled_cache[2]
+    box.blit_scaled(surface, image, (0, 0), 0.5)
+    assert box._scaled_cache[2] is cached
+    box.mark_dirty()
+    assert box._scaled_cache is None
+
+
+def test_supports_render_scale_requires_every_drawable(objects):
+    assert not objects.supports_render_scale()
+    for box in objects:
+        box.supports_render_scale = True
+    assert objects.supports_render_scale()
+
+
+def test_events_dispatched_by_type_in_order():
+    log = []
+    objs = Objects()
+    keys = Listener(log, (pygame.KEYDOWN,))
+    catch_all = Listener(log)
+    mouse = Listener(log, (pygame.MOUSEMOTION,))
+    objs.extend([keys, catch_all, mouse])
+
+    objs.handle_object(pygame.event.Event(pygame.MOUSEMOTION))
+    objs.handle_object(pygame.event.Event(pygame.KEYDOWN))
+    objs.handle_object(pygame.event.Event(pygame.QUIT))
+    assert log == [
+        (catch_all, pygame.MOUSEMOTION),
+        (mouse, pygame.MOUSEMOTION),
+        (keys, pygame.KEYDOWN),
+        (catch_all, pygame.KEYDOWN),
+        (catch_all, pygame.QUIT),
+    ]
+    assert objs.event_types() is None
+
+    objs.remove(catch_all)
+    assert objs.event_types() == {pygame.KEYDOWN, pygame.MOUSEMOTION}
+    log.clear()
+    objs.insert(0, Listener(log, (pygame.KEYDOWN,)))
+    objs.handle_object(pygame.event.Event(pygame.KEYDOWN))
+    assert [entry[0] for entry in log] == [objs[0], keys]
+
+
+def test_type_views_follow_container_changes(objects):
+    first, second = objects
+    listener = Listener([])
+    objects.append(listener)
+    assert objects.drawable == [first, second]
+    assert objects.eventful == [listener]
+    assert objects.logical == []
+
+    third = Box()
+    objects.insert(0, third)
+    assert objects.drawable == [third, first, second]
+    objects.pop(1)
+    objects.reverse()
+    assert objects.drawable == [second, third]
+    objects.remove(listener)
+    assert objects.eventful == []
+    objects.clear()
+    assert objects.drawable == []
+
+
+def test_draw_order_follows_z_index(objects):
+    first, second = objects
+    top = Box()
+    top.z_index = 5
+    objects.insert(0, top)
+    back = Box()
+    objects.append(back)
+    assert objects.draw_order == [first, second, back, top]
+
+    first.z_index = 10
+    back.z_index = -1
+    assert objects.draw_order == [back, second, top, first]
+    first.z_index = 0
+    assert objects.draw_order == [back, first, second, top]
+
+    objects.remove(top)
+    top.z_index = -5
+    assert objects.draw_order == [back, first, second]
+
+
+def test_insert_updates_views_in_place(objects):
+    first, second = objects
+    views = objects.drawable
+    log = []
+    late, early = Listener(log, (pygame.KEYDOWN,)), Listener(log, (pygame.KEYDOWN,))
+    objects.append(late)
+    objects.handle_object(pygame.event.Event(pygame.KEYDOWN))
+    middle, front = Box(), Box()
+    objects.insert(1, middle)
+    objects.insert(-10, front)
+    objects.insert(3, early)
+    assert objects.drawable is views
+    assert views == [front, first, middle, second]
+    assert objects.draw_order == [front, first, middle, second]
+    log.clear()
+    objects.handle_object(pygame.event.Event(pygame.KEYDOWN))
+    assert [entry[0] for entry in log] == [early, late]
+
+    for offset in range(80):  # Exhausts the precision between two order keys
+        objects.insert(2 + offset, Box())
+    assert objects.drawable == [item for item in objects if isinstance(item, Box)]
+    assert objects.draw_order == objects.drawable
+
+
+def test_objects_are_added_once_and_failures_change_nothing(objects):
+    first, second = objects
+    assert objects.draw_order == [first, second]
+    extra = Box()
+    for add in (
+        lambda: objects.append(first),
+        lambda: objects.insert(0, second),
+        lambda: objects.extend([extra, extra]),
+    ):
+        with pytest.raises(ValueError):
+            add()
+    with pytest.raises(ValueError):
+        objects += [extra, first]
+    assert objects == [first, second] and objects.drawable == [first, second]
+    assert objects.draw_order == [first, second]
+
+    objects.despawn(first)
+    objects.spawn(first)
+    objects.flush()
+    assert objects == [second, first] and objects.draw_order == [second, first]
+
+
+class Counter(LogicalObject):
+    def __init__(self, log):
+        self.log = log
+
+    def perform_update(self, deltatime, *args, **kwargs):
+        self.log.append("update")
+        if deltatime < 0:
+            raise ValueError(deltatime)
+
+    def on_update_error(self, exc):
+        self.log.append("error")
+
+
+class HookedCounter(Counter):
+    def before_update(self):
+        self.log.append("before")
+
+
+def test_dispatch_skips_hooks_only_when_not_overridden():
+    assert Counter._update_dispatch_ is not LogicalObject.update_xodex_object
+    assert HookedCounter._update_dispatch_ is LogicalObject.update_xodex_object
+    assert Box._draw_dispatch_ is not DrawableObject.draw_xodex_object
+    assert Listener._event_dispatch_ is not EventfulObject.handle_xodex_event
+
+    log = []
+    objs = Objects()
+    plain, hooked = Counter(log), HookedCounter(log)
+    objs.extend([plain, hooked])
+    objs.update_object(16)
+    assert log == ["update", "before", "update"]
+
+    log.clear()
+    hooked.disable_update()
+    objs.update_object(-1)
+    assert log == ["update", "error"]
+
+
+def test_dispatch_falls_back_to_wrapper_when_profiling(monkeypatch):
+    spans = []
+    counter = Counter([])
+    counter.update_profile = True
+    monkeypatch.setattr(Counter, "on_update_profile", lambda self, elapsed, *a, **k: spans.append(elapsed))
+    counter._update_dispatch_(16)
+    assert len(spans) == 1
+    box = Box()
+    box.set_visible(False)
+    surface = pygame.Surface((10, 10))
+    box._draw_dispatch_(surface)
+    assert surface.get_at((0, 0)) == pygame.Color(0, 0, 0)
+
+
+def test_handles_are_stable_and_generational(objects):
+    first, second = objects
+    handle = objects.handle_of(first)
+    assert objects.handle_of(first) == handle
+    assert objects.get(handle) is first
+    objects.remove(first)
+    assert objects.get(handle) is None
+    third = Box()
+    objects.append(third)
+    reused = objects.handle_of(third)
+    assert reused & 0xFFFFFFFF == handle & 0xFFFFFFFF and reused != handle
+    assert objects.get(handle) is None and objects.get(reused) is third
+
+
+def test_spawn_and_despawn_are_applied_on_flush(objects):
+    first, second = objects
+    log = []
+
+    class Spawner(LogicalObject):
+        def perform_update(self, deltatime, *args, **kwargs):
+            objects.despawn(first, log.append)
+            objects.despawn(self)
+            log.append(objects.spawn(Box))
+
+    spawner = Spawner()
+    objects.append(spawner)
+    objects.update_object(16)
+    assert objects == [first, second, spawner] and log == [log[0]]
+
+    objects.flush()
+    spawned = objects.get(log[0])
+    assert objects == [second, spawned]
+    assert objects.drawable == objects.draw_order == [second, spawned]
+    assert objects.logical == []
+    assert log[1] is first and first._z_owners == ()
+    objects.despawn(log[0])
+    objects.despawn(log[0])
+    objects.flush()
+    assert objects == [second] and objects.get(log[0]) is None
+
+
+def test_tag_and_name_indexes_follow_changes(objects):
+    first, second = objects
+    first.tags = {"enemy"}
+    first.name = "boss"
+    assert objects.tagged("enemy") == [first] and objects.named("boss") is first
+
+    second.add_tag("enemy", "flying")
+    assert objects.tagged("enemy") == [first, second] and objects.tagged("flying") == [second]
+    second.remove_tag("enemy")
+    assert objects.tagged("enemy") == [first] and not first.has_tag("flying")
+
+    third = Box()
+    third.name = "boss"
+    with pytest.raises(ValueError):
+        objects.append(third)
+    with pytest.raises(ValueError):
+        second.name = "boss"
+    first.name = "king"
+    assert objects.named("boss") is None and objects.named("king") is first
+
+    objects.remove(first)
+    assert objects.tagged("enemy") == [] and objects.named("king") is None
+    first.add_tag("enemy")
+    assert objects.tagged("enemy") == []
+    del objects[0]
+    second.add_tag("enemy")
+    assert objects.tagged("enemy") == []
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", "--tb=short", __file__])
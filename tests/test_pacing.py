@@ -0,0 +1,35 @@
+import time
+
+import pytest
+
+from xodex.game.pacing import FramePacer
+
+
+def test_tick_limits_to_budget():
+    pacer = FramePacer(spin_window=2)
+    pacer.tick(100)
+    start = time.perf_counter()
+    for _ in range(10):
+        pacer.tick(100)
+    assert time.perf_counter() - start >= 0.099
+    assert pacer.budget == pytest.approx(10)
+
+
+def test_uncapped_tick_does_not_wait():
+    pacer = FramePacer()
+    pacer.tick(100)
+    pacer.tick(0)
+    assert pacer.budget == 0
+    assert pacer.get_time() < 5
+
+
+def test_percentiles_and_jitter():
+    pacer = FramePacer()
+    pacer.budget = 10.0
+    pacer._frame_times.extend([10.0] * 95 + [12.0] * 4 + [30.0])
+    assert pacer.percentiles() == {"p50": 10.0, "p95": 10.0, "p99": 12.0}
+    assert pacer.jitter() == {"p50": 0.0, "p95": 0.0, "p99": 2.0}
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", "--tb=short", __file__])
@@ -0,0 +1,90 @@
+import pygame
+import pytest
+
+from xodex.core.exceptions import ObjectError
+from xodex.object import ObjectPool
+from xodex.object import ObjectsManager
+from xodex.object.base import DrawableObject
+from xodex.object.base import LogicalObject
+from xodex.object.objects import Objects
+
+
+class Bullet(LogicalObject, DrawableObject):
+    created = 0
+
+    def __init__(self):
+        Bullet.created += 1
+        self.rect = pygame.Rect(0, 0, 2, 2)
+        self.velocity = (0, 0)
+
+    def reset(self, pos=(0, 0), velocity=(0, 0)):
+        self.rect.topleft = pos
+        self.velocity = velocity
+
+    def perform_update(self, deltatime, *args, **kwargs):
+        self.rect.move_ip(self.velocity)
+
+    def perform_draw(self, surface, *args, **kwargs):
+        surface.fill((255, 255, 255), self.rect)
+
+
+class Plain(LogicalObject):
+    def perform_update(self, deltatime, *args, **kwargs): ...
+
+
+@pytest.fixture
+def manager():
+    manager = ObjectsManager()
+    manager.register(Bullet, "Bullet")
+    yield manager
+    manager.unregister("Bullet")
+
+
+def test_spawn_and_despawn_reuse_instances(manager):
+    Bullet.created = 0
+    pool = manager.create_pool("Bullet", size=2)
+    assert manager.get_pool("Bullet") is pool
+    objects = Objects()
+
+    first = pool.spawn(objects, pos=(5, 5), velocity=(1, 0))
+    second = pool.spawn(objects, pos=(9, 9))
+    assert objects == []
+    objects.flush()
+    assert objects == [first, second] and objects.drawable == [first, second]
+    assert first.rect.topleft == (5, 5)
+
+    pool.despawn(first)
+    with pytest.raises(ObjectError):
+        pool.despawn(first)
+    assert len(pool) == 0
+    objects.flush()
+    assert objects == [second] and objects.logical == [second]
+    third = pool.spawn(objects, pos=(1, 1))
+    assert third is first and third.rect.topleft == (1, 1) and third.velocity == (0, 0)
+    pool.spawn(objects)
+    assert Bullet.created == 3
+    assert manager.pool_stats()["Bullet"] == {"hits": 3, "misses": 1, "hit_rate": 0.75, "free": 0, "in_use": 3}
+
+
+def test_release_checks_ownership_and_max_size(manager):
+    pool = manager.create_pool("Bullet", size=4, max_size=1)
+    assert len(pool) == 1
+    first, second = pool.acquire(), pool.acquire()
+    pool.release(first)
+    pool.release(second)
+    assert len(pool) == 1
+    with pytest.raises(ObjectError):
+        pool.release(first)
+    with pytest.raises(ObjectError):
+        ObjectPool(Plain)
+
+
+def test_unregister_drops_pool(manager):
+    manager.create_pool("Bullet", size=1)
+    manager.unregister("Bullet")
+    manager.register(Bullet, "Bullet")
+    assert len(manager.get_pool("Bullet")) == 0
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", "--tb=short", __file__])
@@ -0,0 +1,80 @@
+import pygame
+import pytest
+
+from xodex.contrib.objects import Animator
+from xodex.contrib.objects import Anime
+from xodex.contrib.objects.image import Image
+from xodex.core.exceptions import AlreadyRegistered
+from xodex.core.exceptions import NotRegistered
+from xodex.object import ObjectsManager
+from xodex.object.objects import Objects
+
+
+class Enemy(Image):
+    def __init__(self, surface, pos=(0, 0)):
+        super().__init__(surface, pos)
+        self.path = [(0, 0), (10, 0)]
+        self.speed = 2
+
+
+@pytest.fixture
+def manager():
+    manager = ObjectsManager()
+    surface = pygame.Surface((8, 8))
+    surface.fill((0, 255, 0))
+    prototype = Enemy(surface, (1, 1))
+    prototype.tags = {"enemy"}
+    prototype.name = "template"
+    manager.register_prefab("Goblin", prototype)
+    yield manager
+    manager.unregister_prefab("Goblin")
+
+
+def test_spawn_shares_surfaces_and_copies_state(manager):
+    prototype = manager.get_prefab("Goblin")
+    goblin = manager.spawn("Goblin", position=(20, 30), speed=5)
+    assert type(goblin) is Enemy
+    assert goblin.image is prototype.image
+    assert goblin.position == (20, 30) and prototype.position == (1, 1)
+    assert goblin.speed == 5 and prototype.speed == 2
+    goblin.path.append((5, 5))
+    assert prototype.path == [(0, 0), (10, 0)]
+    assert goblin.tags == {"enemy"} and goblin.name is None
+
+    objects = Objects()
+    objects.extend([manager.spawn("Goblin"), manager.spawn("Goblin")])
+    assert len(objects.tagged("enemy")) == 2
+    assert prototype._lookup_owners == ()
+
+
+def test_in_place_edits_copy_shared_surface(manager):
+    prototype = manager.get_prefab("Goblin")
+    goblin = manager.spawn("Goblin")
+    goblin.set_pixel(0, 0, (255, 0, 0))
+    assert goblin.image is not prototype.image
+    assert prototype.get_pixel(0, 0) == pygame.Color(0, 255, 0)
+    assert goblin.get_pixel(0, 0) == pygame.Color(255, 0, 0)
+
+
+def test_prefab_registration_errors(manager):
+    with pytest.raises(AlreadyRegistered):
+        manager.register_prefab("Goblin", manager.get_prefab("Goblin"))
+    with pytest.raises(NotRegistered):
+        manager.spawn("Orc")
+
+
+def test_anime_clone_plays_its_own_animators():
+    frames = [pygame.Surface((4, 4)) for _ in range(3)]
+    anime = Anime({"run": Animator(frames), "idle": Animator(frames[:1])}, default="run")
+    clone = anime.clone(position=(7, 7))
+    assert clone.current is not anime.current
+    assert clone.current.get_image() is anime.current.get_image()
+
+    clone.current.step(2)
+    clone.current = "idle"
+    assert anime.current.get_frame() == 0 and anime.position == (0, 0)
+    assert clone.animators["run"].get_frame() == 2 and clone.animators["run"].position == (7, 7)
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", "--tb=short", __file__])
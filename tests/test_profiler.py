@@ -0,0 +1,56 @@
+import pytest
+
+from xodex.utils.profiler import FrameProfiler
+
+
+@pytest.fixture
+def profiler():
+    profiler = FrameProfiler()
+    profiler.configure(True, 100)
+    profiler.clear()
+    yield profiler
+    profiler.configure(False)
+    profiler.clear()
+
+
+def test_disabled_records_nothing(profiler):
+    profiler.disable()
+    with profiler.span("update"):
+        pass
+    profiler.record("Box.update", 0.001)
+    assert profiler.spans == []
+
+
+def test_ring_buffer_keeps_latest_spans(profiler):
+    profiler.configure(True, 3)
+    for frame in range(5):
+        profiler.begin_frame(frame)
+        with profiler.span("update"):
+            pass
+    spans = profiler.spans
+    assert len(spans) == 3
+    assert spans[-1][0] == "update"
+    assert spans[-1][4] == 4
+
+
+def test_summary_aggregates_by_name(profiler):
+    profiler.add_span("draw", 0.0, 0.002)
+    profiler.add_span("draw", 1.0, 0.004)
+    summary = profiler.summary()["draw"]
+    assert summary["count"] == 2
+    assert summary["max_ms"] == pytest.approx(4.0)
+    assert summary["avg_ms"] == pytest.approx(3.0)
+
+
+def test_chrome_trace_events(profiler):
+    profiler.begin_frame(7)
+    with profiler.span("update", {"scene": "MainScene"}):
+        pass
+    (event,) = profiler.to_chrome_trace()["traceEvents"]
+    assert event["ph"] == "X"
+    assert event["name"] == "update"
+    assert event["args"] == {"frame": 7, "scene": "MainScene"}
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", "--tb=short", __file__])
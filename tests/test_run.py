@@ -0,0 +1,23 @@
+import json
+import pstats
+
+import pytest
+
+from xodex.core.management.commands.run import Command
+from xodex.game import Game
+
+
+def test_headless_run_writes_profile_and_trace(make_project, tmp_path):
+    make_project()
+    profile, trace = tmp_path / "run.pstats", tmp_path / "trace.json"
+    argv = ["xodex", "run", "--headless", "--frames", "5", "--uncapped"]
+    Command().execute([*argv, "--profile", str(profile), "--trace", str(trace)])
+
+    assert Game._instances[Game].frame == 5
+    assert pstats.Stats(str(profile)).total_calls > 0
+    events = json.loads(trace.read_text())["traceEvents"]
+    assert {event["args"]["frame"] for event in events if event["name"] == "tick"} == set(range(5))
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", "--tb=short", __file__])
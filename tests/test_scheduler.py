@@ -0,0 +1,56 @@
+import asyncio
+import time
+
+import pytest
+
+from xodex.game.scheduler import FrameScheduler
+
+
+def test_idle_generator_resumes_until_exhausted():
+    scheduler = FrameScheduler(fps=0)
+    done = []
+
+    def job():
+        for i in range(3):
+            done.append(i)
+            yield
+
+    scheduler.call_idle(job())
+    scheduler.call_idle(done.append, "once")
+    while scheduler.pending:
+        scheduler.run_idle_jobs()
+    assert done == [0, "once", 1, 2]
+
+
+def test_idle_jobs_respect_budget():
+    scheduler = FrameScheduler(fps=0, idle_budget=1)
+    for _ in range(10):
+        scheduler.call_idle(time.sleep, 0.002)
+    assert scheduler.run_idle_jobs() == 1
+    assert scheduler.pending == 9
+
+
+def test_other_coroutines_run_between_frames():
+    scheduler = FrameScheduler(fps=100)
+    ticks = []
+
+    async def background():
+        while True:
+            ticks.append(time.perf_counter())
+            await asyncio.sleep(0.001)
+
+    async def frames():
+        task = asyncio.create_task(background())
+        start = time.perf_counter()
+        for _ in range(5):
+            await scheduler.wait_for_frame()
+        task.cancel()
+        return time.perf_counter() - start
+
+    elapsed = asyncio.run(frames())
+    assert elapsed >= 0.04
+    assert len(ticks) > 5
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", "--tb=short", __file__])
@@ -0,0 +1,68 @@
+import random
+
+import pygame
+import pytest
+
+from xodex.scene.spatial import SpatialGrid
+
+
+class Thing:
+    def __init__(self, x, y, w=10, h=10):
+        self.rect = pygame.Rect(x, y, w, h)
+
+
+@pytest.fixture
+def things():
+    return [Thing(0, 0), Thing(100, 100), Thing(60, 0, 80, 20), Thing(300, 0)]
+
+
+@pytest.fixture
+def grid(things):
+    grid = SpatialGrid(cell_size=32)
+    grid.sync(things + [object()])
+    return grid
+
+
+def test_point_rect_and_radius_queries(grid, things):
+    a, b, wide, far = things
+    assert len(grid) == 4
+    assert grid.query_point((5, 5)) == [a]
+    assert grid.query_point((130, 10)) == [wide]
+    assert grid.query_point((500, 500)) == []
+    assert set(grid.query_rect((0, 0, 101, 101))) == {a, b, wide}
+    assert set(grid.query_radius((15, 15), 8)) == {a}
+    assert set(grid.query_radius((50, 10), 10)) == {wide}
+
+
+def test_sync_moves_and_removes(grid, things):
+    a, b, wide, far = things
+    a.rect.topleft = (400, 400)
+    grid.sync([a, b, wide])
+    assert grid.query_point((405, 405)) == [a]
+    assert grid.query_point((5, 5)) == []
+    assert far not in grid
+
+
+def test_raycast_returns_hits_nearest_first(grid, things):
+    a, b, wide, far = things
+    hits = grid.raycast((-50, 5), (1, 0), 1000)
+    assert [obj for _, obj in hits] == [a, wide, far]
+    assert hits[0][0] == pytest.approx(50)
+    assert grid.raycast((-50, 5), (1, 0), 40) == []
+    assert [obj for _, obj in grid.raycast((0, 0), (1, 1), 200)] == [a, b]
+
+
+def test_queries_match_linear_scan():
+    rng = random.Random(7)
+    things = [
+        Thing(rng.randrange(1000), rng.randrange(1000), rng.randrange(1, 80), rng.randrange(1, 80)) for _ in range(300)
+    ]
+    grid = SpatialGrid(cell_size=50)
+    grid.sync(things)
+    area = pygame.Rect(200, 300, 250, 120)
+    assert set(grid.query_rect(area)) == {t for t in things if t.rect.colliderect(area)}
+    assert set(grid.query_point((420, 420))) == {t for t in things if t.rect.collidepoint(420, 420)}
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", "--tb=short", __file__])
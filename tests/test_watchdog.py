@@ -0,0 +1,50 @@
+import json
+import time
+
+import pytest
+
+from xodex.game.watchdog import StallWatchdog
+
+
+def stalled_update():
+    time.sleep(0.05)
+
+
+def run_frames(watchdog, *frames):
+    watchdog.start()
+    for frame, work in frames:
+        watchdog.mark(frame)
+        work()
+    watchdog.mark(None)
+    time.sleep(0.01)
+    watchdog.stop()
+
+
+def test_long_frame_is_logged_with_stack(tmp_path):
+    log = tmp_path / "hitches.jsonl"
+    watchdog = StallWatchdog(threshold=10, interval=2, log_path=str(log))
+    run_frames(watchdog, (0, lambda: None), (1, stalled_update), (2, lambda: None))
+
+    (entry,) = [json.loads(line) for line in log.read_text().splitlines()]
+    assert entry["frame"] == 1
+    assert entry["duration_ms"] >= 50
+    assert any("stalled_update" in sample["stack"][-1] for sample in entry["samples"])
+
+
+def test_idle_waits_are_not_hitches(tmp_path):
+    log = tmp_path / "hitches.jsonl"
+    watchdog = StallWatchdog(threshold=10, interval=2, log_path=str(log))
+    run_frames(watchdog, (None, stalled_update))
+    assert not log.exists()
+
+
+def test_log_keeps_most_recent_entries(tmp_path):
+    log = tmp_path / "hitches.jsonl"
+    log.write_text('{"frame": -1}\n')
+    watchdog = StallWatchdog(threshold=10, interval=2, log_path=str(log), log_size=2)
+    run_frames(watchdog, (1, stalled_update), (2, stalled_update))
+    assert [json.loads(line)["frame"] for line in log.read_text().splitlines()] == [1, 2]
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", "--tb=short", __file__])
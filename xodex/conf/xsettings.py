@@ -4,3 +4,35 @@ by the XODEX_SETTINGS_MODULE environment variable.
 """
 
 DEBUG = True
+
+# --- Game Loop ---
+FIXED_TIMESTEP = False  # Update scenes at a constant rate and interpolate drawing
+UPDATE_RATE = 60  # Logic updates per second when FIXED_TIMESTEP is enabled
+MAX_UPDATE_STEPS = 5  # Maximum catch-up updates per frame before dropping time
+DIRTY_RECTS = False  # Redraw and present only the screen regions that changed
+DIRECT_RENDERING = False  # Draw scenes straight onto the display surface when possible
+PIPELINED_FRAMES = False  # Run the next frame's update on a worker thread while presenting
+ON_DEMAND_RENDERING = False  # Skip drawing paused or static scenes until something changes
+ON_DEMAND_TIMEOUT = 100  # Milliseconds to wait for an event while idle before updating again
+ASYNC_IDLE_BUDGET = 4  # Milliseconds per frame for idle jobs in the async loop
+FRAME_PACING = False  # Use the sleep-then-spin frame pacer instead of pygame's Clock
+FRAME_BUDGET = None  # Target frame time in milliseconds; overrides FPS when set
+PACING_SPIN_WINDOW = 2  # Milliseconds before a frame deadline the pacer busy-waits
+DYNAMIC_RESOLUTION = False  # Lower scene resolution when drawing exceeds its target time
+DYNAMIC_RESOLUTION_TARGET = 8  # Target scene draw time in milliseconds
+DYNAMIC_RESOLUTION_MIN_SCALE = 0.5  # Lowest render scale relative to the window
+EVENT_FILTERING = False  # Let SDL queue only the event types objects subscribe to
+EVENT_COALESCING = False  # Merge redundant motion and resize events each frame
+COALESCED_EVENTS = ("MOUSEMOTION", "JOYAXISMOTION", "VIDEORESIZE")  # Event types merged by EVENT_COALESCING
+ENABLE_COLLISIONS = False  # Detect collisions between CollidableObjects after each update
+ENABLE_SCREEN_SHAKE = True  # Let Camera.shake offset the view
+
+# --- Debugging & Development ---
+ENABLE_PROFILER = False  # Record per-phase frame timings (see xodex.utils.profiler)
+PROFILER_CAPACITY = 10000  # Number of most recent profiler spans kept
+MEASURE_INPUT_LATENCY = False  # Record input-to-present latency per event type (see xodex.utils.latency)
+HITCH_DETECTION = False  # Sample the stack of frames that exceed HITCH_THRESHOLD (see xodex.game.watchdog)
+HITCH_THRESHOLD = 50  # Frame time in milliseconds that counts as a hitch
+HITCH_SAMPLE_INTERVAL = 5  # Milliseconds between stack samples during a hitch
+HITCH_LOG = "hitches.jsonl"  # JSON-lines file hitches are written to
+HITCH_LOG_SIZE = 100  # Number of most recent hitches kept in HITCH_LOG
@@ -54,6 +54,8 @@ class Animator(DrawableObject, EventfulObject, LogicalObject):
         _speed_scale (float): Speed scaling factor.
     """
 
+    supports_render_scale = True
+
     def __init__(
         self,
         frames: list[Image | Surface | str],
@@ -160,6 +162,7 @@ class Animator(DrawableObject, EventfulObject, LogicalObject):
         self._time_accum = 0
         self._finished = False
         self._paused = False
+        self.mark_dirty()
 
     def get_image(self) -> Image | None:
         """Get the current frame's image."""
@@ -212,6 +215,7 @@ class Animator(DrawableObject, EventfulObject, LogicalObject):
         """Set the current frame index."""
         if 0 <= frame_idx < len(self._frames):
             self._current_frame = frame_idx
+            self.mark_dirty()
 
     def get_frame(self) -> int:
         """Get the current frame index."""
@@ -269,10 +273,12 @@ class Animator(DrawableObject, EventfulObject, LogicalObject):
     def step(self, steps: int = 1):
         """Step forward or backward by a number of frames."""
         self._current_frame = (self._current_frame + steps * self._direction) % len(self._frames)
+        self.mark_dirty()
 
     def skip_to_end(self):
         """Skip to the last frame."""
         self._current_frame = len(self._frames) - 1 if self._direction == 1 else 0
+        self.mark_dirty()
 
     def toggle_reverse(self):
         """Toggle reverse/forward playback."""
@@ -287,7 +293,7 @@ class Animator(DrawableObject, EventfulObject, LogicalObject):
         """
         image = self.get_image()
         image.rect = self.rect
-        image.perform_draw(surface)
+        image.perform_draw(surface, *args, **kwargs)
 
     def perform_update(self, deltatime: float, *args, **kwargs) -> None:
         """
@@ -329,6 +335,8 @@ class Animator(DrawableObject, EventfulObject, LogicalObject):
                         self._current_frame = max(0, min(self._current_frame, len(self._frames) - 1))
             if frame_changed and self._on_frame:
                 self._on_frame(self._current_frame)
+        if frame_changed:
+            self.mark_dirty()
 
     def handle_event(self, event: pygame.event.Event, *args, **kwargs) -> None:
         """Handle pygame events (stub for extension)."""
@@ -354,6 +362,8 @@ class Animator(DrawableObject, EventfulObject, LogicalObject):
 class Anime(DrawableObject, LogicalObject, EventfulObject):  # dino
     """Anime"""
 
+    supports_render_scale = True
+
     def __init__(self, animation: dict[str, Animator] = None, default: str = None):
         self._animations: dict[str, Animator] = {}
         self._current: str = None
@@ -374,6 +384,10 @@ class Anime(DrawableObject, LogicalObject, EventfulObject):  # dino
         """Return a string representation of the Animator."""
         return f"{self.__class__.__name__}()"
 
+    def _cloned_(self, original: Anime) -> None:
+        # Each clone plays its own animators; their frames are shared.
+        self._animations = {name: animator.clone() for name, animator in original._animations.items()}
+
     @property
     def current(self) -> Animator:
         """Current Animator."""
@@ -387,6 +401,7 @@ class Anime(DrawableObject, LogicalObject, EventfulObject):  # dino
         """Current Animator."""
         if anime in self._animations:
             self._current = anime
+            self.mark_dirty()
 
     @property
     def animators(self):
@@ -444,7 +459,11 @@ class Anime(DrawableObject, LogicalObject, EventfulObject):  # dino
         Args:
             deltatime (float): Time since last update in ms.
         """
-        self.current.perform_update(deltatime, *args, **kwargs)
+        current = self.current
+        current.perform_update(deltatime, *args, **kwargs)
+        if current.dirty:
+            current.dirty = False
+            self.mark_dirty()
 
     def handle_event(self, event: pygame.event.Event, *args, **kwargs) -> None:
         """Handle pygame events (stub for extension)."""
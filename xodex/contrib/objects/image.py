@@ -29,8 +29,12 @@ class Image(DrawableObject):
     Attributes:
         _image (Surface): The underlying pygame surface.
         _img_rect (pygame.Rect): The rectangle representing the image's position and size.
+        _image_shared (bool): The surface is shared with clones and is copied before in-place edits.
     """
 
+    supports_render_scale = True
+    _image_shared = False
+
     def __init__(
         self,
         image: str | Surface = None,
@@ -71,6 +75,15 @@ class Image(DrawableObject):
     def __deepcopy__(self, memo) -> Image:
         return Image(self._image.copy(), self.position)
 
+    def _cloned_(self, original: Image) -> None:
+        self._image_shared = original._image_shared = True
+
+    def _own_image_(self) -> None:
+        """Copy the surface before an in-place edit if clones share it."""
+        if self._image_shared:
+            self._image = self._image.copy()
+            self._image_shared = False
+
     @property
     def image(self) -> Surface:
         """Return the underlying pygame.Surface."""
@@ -138,6 +151,7 @@ class Image(DrawableObject):
         topleft = self._img_rect.topleft
         self._img_rect = self._image.get_rect()
         self._img_rect.topleft = topleft
+        self.mark_dirty()
         return self
 
     def smoothscale(self, x: float, y: float) -> Image:
@@ -155,6 +169,7 @@ class Image(DrawableObject):
         topleft = self._img_rect.topleft
         self._img_rect = self._image.get_rect()
         self._img_rect.topleft = topleft
+        self.mark_dirty()
         return self
 
     def flip(self, flip_x: bool, flip_y: bool) -> Image:
@@ -172,6 +187,7 @@ class Image(DrawableObject):
         topleft = self._img_rect.topleft
         self._img_rect = self._image.get_rect()
         self._img_rect.topleft = topleft
+        self.mark_dirty()
         return self
 
     def blur(self, blur_count: float = 5) -> Image:
@@ -187,6 +203,7 @@ class Image(DrawableObject):
         impil = PIL.Image.frombytes("RGBA", self._img_rect.size, pygame.image.tobytes(self._image, "RGBA"))
         impil = impil.filter(PIL.ImageFilter.GaussianBlur(radius=blur_count))
         self._image = pygame.image.frombytes(impil.tobytes(), impil.size, "RGBA").convert()
+        self.mark_dirty()
         return self
 
     def crop(self, rect: pygame.Rect) -> Image:
@@ -227,6 +244,7 @@ class Image(DrawableObject):
         Returns:
             Image: Self for chaining.
         """
+        self._own_image_()
         arr = pygame.surfarray.pixels3d(self._image)
         r1, g1, b1 = from_color.r, from_color.g, from_color.b
         r2, g2, b2 = to_color.r, to_color.g, to_color.b
@@ -235,6 +253,7 @@ class Image(DrawableObject):
         arr[:, :, 1][mask] = g2
         arr[:, :, 2][mask] = b2
         del arr
+        self.mark_dirty()
         return self
 
     def tint(self, color: Color, alpha: int = 128) -> Image:
@@ -250,7 +269,9 @@ class Image(DrawableObject):
         """
         tint_surface = pygame.Surface(self._image.get_size(), pygame.SRCALPHA)
         tint_surface.fill((*color, alpha))
+        self._own_image_()
         self._image.blit(tint_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+        self.mark_dirty()
         return self
 
     def rotate(self, angle: float) -> Image:
@@ -267,6 +288,7 @@ class Image(DrawableObject):
         topleft = self._img_rect.topleft
         self._img_rect = self._image.get_rect()
         self._img_rect.topleft = topleft
+        self.mark_dirty()
         return self
 
     def set_alpha(self, alpha: int) -> Image:
@@ -279,7 +301,9 @@ class Image(DrawableObject):
         Returns:
             Image: Self for chaining.
         """
+        self._own_image_()
         self._image.set_alpha(alpha)
+        self.mark_dirty()
         return self
 
     def set_colorkey(self, colorkey: Color) -> Image:
@@ -292,7 +316,9 @@ class Image(DrawableObject):
         Returns:
             Image: Self for chaining.
         """
+        self._own_image_()
         self._image.set_colorkey(colorkey)
+        self.mark_dirty()
         return self
 
     def get_pixel(self, x: int, y: int) -> Color:
@@ -317,7 +343,9 @@ class Image(DrawableObject):
             y (int): Y coordinate.
             color (Color): Color to set.
         """
+        self._own_image_()
         self._image.set_at((x, y), color)
+        self.mark_dirty()
 
     def save(self, filename: str):
         """
@@ -338,6 +366,7 @@ class Image(DrawableObject):
         pil_img = PIL.Image.frombytes("RGBA", self._img_rect.size, pygame.image.tobytes(self._image, "RGBA"))
         pil_img = PIL.ImageOps.grayscale(pil_img).convert("RGBA")
         self._image = pygame.image.frombytes(pil_img.tobytes(), pil_img.size, "RGBA").convert()
+        self.mark_dirty()
         return self
 
     def filter_invert(self) -> Image:
@@ -350,6 +379,7 @@ class Image(DrawableObject):
         pil_img = PIL.Image.frombytes("RGBA", self._img_rect.size, pygame.image.tobytes(self._image, "RGBA"))
         pil_img = PIL.ImageOps.invert(pil_img.convert("RGB")).convert("RGBA")
         self._image = pygame.image.frombytes(pil_img.tobytes(), pil_img.size, "RGBA").convert()
+        self.mark_dirty()
         return self
 
     def filter_sharpen(self) -> Image:
@@ -362,6 +392,7 @@ class Image(DrawableObject):
         pil_img = PIL.Image.frombytes("RGBA", self._img_rect.size, pygame.image.tobytes(self._image, "RGBA"))
         pil_img = pil_img.filter(PIL.ImageFilter.SHARPEN)
         self._image = pygame.image.frombytes(pil_img.tobytes(), pil_img.size, "RGBA").convert()
+        self.mark_dirty()
         return self
 
     def filter_edge_enhance(self) -> Image:
@@ -374,6 +405,7 @@ class Image(DrawableObject):
         pil_img = PIL.Image.frombytes("RGBA", self._img_rect.size, pygame.image.tobytes(self._image, "RGBA"))
         pil_img = pil_img.filter(PIL.ImageFilter.EDGE_ENHANCE)
         self._image = pygame.image.frombytes(pil_img.tobytes(), pil_img.size, "RGBA").convert()
+        self.mark_dirty()
         return self
 
     def perform_draw(self, surface: Surface, *args, **kwargs) -> None:
@@ -383,7 +415,9 @@ class Image(DrawableObject):
         Args:
             surface (Surface): The target surface.
         """
-        surface.blit(self.image, self._img_rect)
+        self.blit_scaled(
+            surface, self.image, self._img_rect, kwargs.get("render_scale", 1), kwargs.get("view_offset", (0, 0))
+        )
 
 
 class MovingImage(Image):
@@ -419,6 +453,11 @@ class MovingImage(Image):
         self.win_width = win_width
         self.win_height = win_height
 
+    def get_bounds(self) -> pygame.Rect:
+        """Cover both the current and the next rect, since the image moves while drawing."""
+        rect = pygame.Rect(self._img_rect)
+        return rect.union(rect.move(self.vel_x if self.move_x else 0, self.vel_y if self.move_y else 0))
+
     def perform_draw(self, surface, *args, **kwargs):
         # Move and bounce off edges
         if self.move_x:
@@ -431,6 +470,8 @@ class MovingImage(Image):
             if self._img_rect.top < 0 or self._img_rect.bottom > self.win_height:
                 self.vel_y = -self.vel_y
                 self._img_rect.y += self.vel_y
+        # The image moves on every draw, so it must be redrawn every frame.
+        self.mark_dirty()
         return super().perform_draw(surface, *args, **kwargs)
 
     @property
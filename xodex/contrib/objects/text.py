@@ -9,6 +9,8 @@ from xodex.object.base import DrawableObject
 class XodexText(DrawableObject):
     """Enhanced XodexText with customizable font, color, and dynamic updates."""
 
+    supports_render_scale = True
+
     def __init__(
         self,
         text: str,
@@ -44,9 +46,16 @@ class XodexText(DrawableObject):
         self._surface = self._font.render(self._text, self._antialias, self._color)
         if self._alpha < 255:
             self._surface.set_alpha(self._alpha)
+        self.mark_dirty()
+
+    def get_bounds(self) -> pygame.Rect:
+        """Return the area covered by the rendered text."""
+        return self._surface.get_rect(topleft=self._position)
 
     def perform_draw(self, surface, *args, **kwargs) -> None:
-        surface.blit(self._surface, self._surface.get_rect(topleft=self._position))
+        self.blit_scaled(
+            surface, self._surface, self._position, kwargs.get("render_scale", 1), kwargs.get("view_offset", (0, 0))
+        )
 
     @property
     def text(self):
@@ -66,6 +75,15 @@ class XodexText(DrawableObject):
         self._color = value
         self._render_text()
 
+    @property
+    def position(self) -> tuple[int, int]:
+        """Get or Set the (x, y) position of the text."""
+        return self._position
+
+    @position.setter
+    def position(self, value: tuple[int, int]):
+        self._position = value
+
     def set_position(self, position: tuple[int, int]):
         self._position = position
 
@@ -28,6 +28,9 @@ class BlurScene(BaseScene, ABC):
     """
     Scene with animated blur effect.
 
+    Supports dynamic resolution scaling: the blurred surface is scaled down
+    with the scene surface.
+
     Features:
         - Supports multiple blur types (gaussian, box, motion, custom)
         - Adjustable blur region (full, rect, mask)
@@ -49,6 +52,8 @@ class BlurScene(BaseScene, ABC):
         scene = GaussianBlurScene(surface, blur_count=3, blur_duration=1.5)
     """
 
+    direct_draw = False  # Composites the blurred backdrop on its own surface
+
     def __init__(
         self,
         blur_surface: Surface,
@@ -126,8 +131,17 @@ class BlurScene(BaseScene, ABC):
         Returns:
             pygame.Surface: The updated scene surface.
         """
-        self._screen.blit(self._blur_surface, self._screen.get_rect())
-        self._objects.draw_object(self._screen, *args, **kwargs)
+        if self._render_scale == 1:
+            self._screen.blit(self._blur_surface, self._screen.get_rect())
+        else:
+            # Rendering below full resolution (dynamic resolution scaling).
+            width, height = self._blur_surface.get_size()
+            size = (max(1, round(width * self._render_scale)), max(1, round(height * self._render_scale)))
+            if size == self._screen.get_size():
+                pygame.transform.scale(self._blur_surface, size, self._screen)
+            else:
+                self._screen.blit(pygame.transform.scale(self._blur_surface, size), (0, 0))
+        self._draw_objects_(self._screen, *args, **kwargs)
         return self._screen
 
     def reset_blur(self):
@@ -1,5 +1,7 @@
 """Management"""
 
+from __future__ import annotations
+
 import argparse
 import importlib
 import os
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import os
+import time
+
 from xodex.core.management.command import BaseCommand
 
 try:
@@ -24,7 +27,7 @@ def cprint(text, color=None):
 class Command(BaseCommand):
     def __init__(self):
         super().__init__(
-            description="Command description",
+            description="Run the current project.",
             usage="%(prog)s command [options]",
         )
 
@@ -53,8 +56,78 @@ class Command(BaseCommand):
             type=str,
             help="Path to a custom config file.",
         )
+        parser.add_argument(
+            "--headless",
+            action="store_true",
+            help="Run without a display or audio device (SDL dummy drivers).",
+        )
+        parser.add_argument(
+            "--frames",
+            type=int,
+            metavar="N",
+            help="Exit after N frames.",
+        )
+        parser.add_argument(
+            "--uncapped",
+            action="store_true",
+            help="Ignore settings.FPS and run as fast as possible.",
+        )
+        parser.add_argument(
+            "--profile",
+            type=str,
+            metavar="FILE",
+            help="Profile the game loop with cProfile and write the stats to FILE (e.g. out.pstats).",
+        )
+        parser.add_argument(
+            "--trace",
+            type=str,
+            metavar="FILE",
+            help="Record per-phase frame timings and write a Chrome trace to FILE (e.g. trace.json).",
+        )
 
     def handle(self, options):
         """
         Handle the command logic for 'run'.
         """
+        if options.frames is not None and options.frames < 1:
+            cprint("--frames must be a positive integer.", "red")
+            return
+        if options.headless:
+            # Must be set before pygame initialises the display and mixer.
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+        from xodex.game import Game
+        from xodex.game import run
+        from xodex.utils.latency import LatencyTracker
+
+        profiler = None
+        if options.profile:
+            import cProfile
+
+            profiler = cProfile.Profile()
+
+        start = time.perf_counter()
+        try:
+            if profiler:
+                profiler.enable()
+            run(
+                project=options.project,
+                max_frames=options.frames,
+                uncapped=options.uncapped,
+                trace=options.trace,
+            )
+        finally:
+            elapsed = time.perf_counter() - start
+            if profiler:
+                profiler.disable()
+                profiler.dump_stats(options.profile)
+                cprint(f"Profile written to {options.profile}", "green")
+            if options.trace:
+                cprint(f"Trace written to {options.trace}", "green")
+            game = Game._instances.get(Game)
+            if game is not None and game.frame:
+                cprint(f"{game.frame} frames in {elapsed:.2f}s ({game.frame / elapsed:.1f} FPS)", "green")
+            latency = LatencyTracker().report()
+            if latency:
+                cprint("Input-to-present latency:\n" + latency, "green")
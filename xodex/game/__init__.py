@@ -7,11 +7,24 @@ event handling, and robust configuration reloading.
 
 Key Features:
 - Main game loop (sync and async) with update/draw hooks.
+- Optional sleep-then-spin frame pacing with jitter statistics.
+- Deadline-paced asyncio loop that runs other coroutines and idle jobs between frames.
+- Optional fixed-timestep updates with interpolated drawing.
+- Optional dirty-rectangle presentation of changed screen regions.
+- Dynamic resolution scaling of scenes that exceed their draw-time target.
+- Optional direct-to-display scene drawing without an intermediate surface.
+- Optional on-demand rendering that idles on ``pygame.event.wait`` while nothing changes.
+- Optional pipelined frames: next frame's logic runs while the current one presents.
+- Optional coalescing of mouse/joystick motion and resize events.
+- Optional SDL-level event filtering to the types scenes subscribe to.
+- Optional input-to-present latency histograms per event type.
+- Optional stall watchdog that samples the stack during long frames.
+- Per-phase frame profiling with Chrome trace export (``ENABLE_PROFILER``).
 - Dynamic (re)configuration and hot-reloading support.
 - Scene and object module auto-registration.
 - Window management: resize, fullscreen, caption, icon, screenshot.
 - Debug overlay and FPS display.
-- Clean exit and restart handling.
+- Clean exit, process restart and in-process soft restart.
 - Extensible via user-defined scenes and objects.
 - Detailed logging and error handling.
 
@@ -29,17 +42,28 @@ Author: djoezeke
 License: See LICENSE file.
 """
 
+from __future__ import annotations
+
 import logging
 import os
 import sys
 import time
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
 from importlib import import_module
 
 import pygame
 from pygame.event import Event
 
 from xodex.conf import settings
+from xodex.game.events import coalesce_events
+from xodex.game.pacing import FramePacer
+from xodex.game.scheduler import FrameScheduler
+from xodex.game.watchdog import StallWatchdog
+from xodex.object.manager import ObjectsManager
 from xodex.scene.manager import SceneManager
+from xodex.utils.latency import LatencyTracker
+from xodex.utils.profiler import FrameProfiler
 from xodex.utils.singleton import Singleton
 
 
@@ -54,9 +78,14 @@ class Game(Singleton):
     Features:
         - Scene and object auto-registration from user modules.
         - Main game loop with update/draw hooks.
+        - Optional fixed-timestep logic with render interpolation.
+        - Optional dirty-rect rendering via ``pygame.display.update(rects)``.
+        - Frame phase profiling through ``FrameProfiler``.
         - Pause, resume, and debug overlay.
         - Window management: resize, fullscreen, caption, icon, screenshot.
-        - FPS limiting and display.
+        - FPS limiting and display, or uncapped frame rate.
+        - Headless runs on the SDL dummy video driver.
+        - Fixed frame-count runs for benchmarking.
         - Async main loop support.
         - Custom event handler injection.
         - Clean exit and restart.
@@ -71,24 +100,38 @@ class Game(Singleton):
         _caption (str): Window title.
         _icon (str): Path to window icon.
         _fps (int): Target frames per second.
+        _fixed_timestep (bool): Update scenes in constant steps.
+        _update_step (float): Length of one fixed update step in milliseconds.
+        _max_update_steps (int): Catch-up limit for fixed updates per frame.
+        _accumulator (float): Unsimulated time carried between frames (ms).
+        _dirty_rendering (bool): Present only the regions the scene reports as changed.
+        _overlay_rects (list): Screen regions covered by overlays in the last frame.
+        _presented_scene: The scene shown in the last frame.
         _debug (bool): Debug mode flag.
         _fullscreen (bool): Fullscreen mode flag.
         _mainscene (str): Name of the main scene.
         _show_fps (bool): Show FPS overlay.
         _font (pygame.font.Font): Font for overlays.
         _debug_overlay (bool): Show debug overlay.
+        _frame (int): Number of frames completed by the main loop.
+        _profiler (FrameProfiler): Records per-phase frame timings when enabled.
+        _scheduler (FrameScheduler): Paces the async main loop and runs idle jobs.
+        _latency (LatencyTracker): Measures input-to-present latency when enabled.
+        _watchdog (StallWatchdog): Samples the stack during long frames when ``HITCH_DETECTION`` is on.
         _custom_event_handler (callable): Optional custom event handler.
 
     Methods:
         setup(on_success=None, on_failure=None): (Re)initialize configuration and modules.
-        main_loop(): Start the main game loop.
-        async_main_loop(): Start the async main game loop.
+        main_loop(max_frames=None): Start the main game loop.
+        async_main_loop(max_frames=None): Start the async main game loop.
+        set_fps(fps): Set the target frame rate (0 for uncapped).
+        set_frame_budget(budget): Set the target frame time in milliseconds.
         set_caption(caption): Set window caption.
         set_icon(icon_path): Set window icon.
         toggle_fullscreen(): Toggle fullscreen mode.
         save_screenshot(filename=None): Save a screenshot.
         exit_game(): Cleanly exit the game.
-        restart_game(): Restart the game process.
+        restart_game(soft=False): Restart the game process, or soft-restart in-process.
     """
 
     def __init__(self, **kwargs) -> None:
@@ -109,21 +152,41 @@ class Game(Singleton):
         self._size = settings.WINDOW_SIZE
         self._caption = settings.TITLE
         self._icon = settings.ICON_PATH
-        self._fps = settings.FPS
+        self._fps = 1000 / settings.FRAME_BUDGET if settings.FRAME_BUDGET else settings.FPS
         self._debug = settings.DEBUG
         self._fullscreen = settings.FULLSCREEN
         self._mainscene = settings.MAIN_SCENE
         self._show_fps = settings.SHOW_FPS
+        self._fixed_timestep = settings.FIXED_TIMESTEP
+        self._update_step = 1000 / settings.UPDATE_RATE
+        self._max_update_steps = settings.MAX_UPDATE_STEPS
+        self._accumulator = 0.0
+        self._dirty_rendering = settings.DIRTY_RECTS
+        self._event_filtering = settings.EVENT_FILTERING
+        self._allowed_events_key = None
+        self._coalesced_events = self._coalesced_event_types()
+        self._pipelined_frames = settings.PIPELINED_FRAMES
+        self._direct_rendering = settings.DIRECT_RENDERING
+        self._on_demand_timeout = settings.ON_DEMAND_TIMEOUT
+        self._waited_event: Event | None = None
+        self._idle_time = 0.0  # Milliseconds spent waiting for events, left out of the next delta
+        self._overlay_rects: list[pygame.Rect] = []
+        self._presented_scene = None
         self._font = pygame.font.SysFont("Arial", 18)
         self._debug_overlay = False
         self._custom_event_handler = None
-
-        flags = pygame.SCALED | pygame.RESIZABLE
-        if self._fullscreen:
-            flags |= pygame.FULLSCREEN
-        self.__screen = pygame.display.set_mode(self._size, flags=flags)
-
-        self.__clock = pygame.time.Clock()
+        self._frame = 0
+        self._profiler = FrameProfiler()
+        self._profiler.configure(settings.ENABLE_PROFILER, settings.PROFILER_CAPACITY)
+        self._scheduler = FrameScheduler(self._fps, settings.ASYNC_IDLE_BUDGET)
+        self._latency = LatencyTracker()
+        self._latency.enabled = settings.MEASURE_INPUT_LATENCY
+        self._watchdog: StallWatchdog | None = None
+
+        self.__display_mode = None
+        self.__set_display_mode()
+
+        self.__clock = self._create_clock()
         self.ready = self.objects_ready = self.scenes_ready = False
 
         pygame.display.set_caption(self._caption)
@@ -137,6 +200,90 @@ class Game(Singleton):
 
     # region Window/Display
 
+    @property
+    def frame(self) -> int:
+        """Number of frames completed by the main loop."""
+        return self._frame
+
+    @property
+    def scheduler(self) -> FrameScheduler:
+        """Frame scheduler of the async main loop; queue idle work with ``call_idle``."""
+        return self._scheduler
+
+    @property
+    def pacer(self) -> FramePacer | None:
+        """The frame pacer when ``FRAME_PACING`` is enabled; use it for jitter statistics."""
+        return self.__clock if isinstance(self.__clock, FramePacer) else None
+
+    def set_fps(self, fps: float) -> None:
+        """
+        Set the target frame rate.
+
+        Args:
+            fps (float): Frames per second; 0 disables frame limiting.
+        """
+        self._fps = fps
+        self._scheduler.set_fps(fps)
+
+    def set_frame_budget(self, budget: float) -> None:
+        """
+        Target a frame budget instead of a frame rate.
+
+        Args:
+            budget (float): Milliseconds per frame, e.g. 6.94 for 144 Hz; 0 disables frame limiting.
+        """
+        self.set_fps(1000 / budget if budget > 0 else 0)
+
+    def _coalesced_event_types(self) -> frozenset[int]:
+        """Return the event types to coalesce, from ``EVENT_COALESCING`` and ``COALESCED_EVENTS``."""
+        if not settings.EVENT_COALESCING:
+            return frozenset()
+        return frozenset(getattr(pygame, name) for name in settings.COALESCED_EVENTS)
+
+    def _create_clock(self) -> pygame.time.Clock | FramePacer:
+        """Return the frame limiter selected by ``FRAME_PACING``."""
+        if settings.FRAME_PACING:
+            return FramePacer(settings.PACING_SPIN_WINDOW)
+        return pygame.time.Clock()
+
+    def _configure_watchdog(self) -> None:
+        """Start or stop the stall watchdog according to ``HITCH_DETECTION``."""
+        if self._watchdog is not None:
+            self._watchdog.stop()
+            self._watchdog = None
+        if settings.HITCH_DETECTION:
+            self._watchdog = StallWatchdog(
+                settings.HITCH_THRESHOLD,
+                settings.HITCH_SAMPLE_INTERVAL,
+                settings.HITCH_LOG,
+                settings.HITCH_LOG_SIZE,
+            )
+            self._watchdog.start()
+
+    def __mark_frame(self, frame: int | None) -> None:
+        """Tell the stall watchdog a frame started, or that the loop is idle (``None``)."""
+        if self._watchdog is not None:
+            self._watchdog.mark(frame)
+
+    def _display_flags(self) -> int:
+        """Return the display mode flags for the current window settings."""
+        flags = pygame.RESIZABLE
+        # SCALED needs a renderer, which the dummy (headless) video driver lacks.
+        if pygame.display.get_driver() != "dummy":
+            flags |= pygame.SCALED
+        if self._fullscreen:
+            flags |= pygame.FULLSCREEN
+        return flags
+
+    def __set_display_mode(self) -> None:
+        """Create the display surface for the current window settings, unless it already matches."""
+        mode = (tuple(self._size), self._display_flags())
+        if mode == self.__display_mode:
+            return
+        self.__screen = pygame.display.set_mode(*mode)
+        self.__display_mode = mode
+        self._presented_scene = None
+
     def set_caption(self, caption: str):
         """
         Set the window caption/title.
@@ -164,10 +311,7 @@ class Game(Singleton):
     def toggle_fullscreen(self):
         """Toggle fullscreen/windowed mode."""
         self._fullscreen = not self._fullscreen
-        flags = pygame.SCALED | pygame.RESIZABLE
-        if self._fullscreen:
-            flags |= pygame.FULLSCREEN
-        self.__screen = pygame.display.set_mode(self._size, flags=flags)
+        self.__set_display_mode()
 
     def save_screenshot(self, filename: str = None):
         """
@@ -198,106 +342,374 @@ class Game(Singleton):
 
     def exit_game(self) -> None:
         """Cleanly exit the game."""
+        if self._watchdog is not None:
+            self._watchdog.stop()
         pygame.quit()
         raise SystemExit
 
-    def restart_game(self):
-        """Restart the game process."""
+    def restart_game(self, soft: bool = False):
+        """
+        Restart the game.
+
+        Args:
+            soft (bool): Restart in-process instead of replacing the process. The scene
+                stack and object/scene registrations are torn down and every loaded
+                project module except the settings is re-imported before ``setup``,
+                while the display, pygame and already loaded assets are kept.
+        """
+        if soft:
+            self.__soft_restart()
+            return
         pygame.quit()
         os.execl(sys.executable, sys.executable, *sys.argv)
 
     # endregion
 
-    def main_loop(self) -> None:
+    def main_loop(self, max_frames: int | None = None) -> None:
         """
         Start the main (synchronous) game loop.
 
         Handles event processing, logic updates, and drawing in a continuous loop.
+        With ``FIXED_TIMESTEP`` enabled, logic runs in constant steps and the
+        leftover fraction of a step is passed to drawing as ``alpha``.
+
+        Args:
+            max_frames (int, optional): Return after this many frames instead of
+                running until the game exits.
         """
-        while True:
-            delta = self.__clock.tick(self._fps)
-            self.__process_all_events()
-            self.__process_all_logic(delta)
-            self.__process_all_draw()
+        if self._pipelined_frames:
+            self.__pipelined_main_loop(max_frames)
+            return
+
+        profiler = self._profiler
+        while max_frames is None or self._frame < max_frames:
+            profiler.begin_frame(self._frame)
+            self.__mark_frame(None)
+            with profiler.span("tick"):
+                delta = self.__clock.tick(self._fps)
+            if self._idle_time:
+                # Logic does not catch up on the time spent idle.
+                delta = max(delta - self._idle_time, 0)
+                self._idle_time = 0.0
+            self.__mark_frame(self._frame)
+            with profiler.span("events"):
+                self.__process_all_events()
+            alpha = self.__process_all_logic(delta)
+            if self.__needs_redraw():
+                self.__process_all_draw(alpha)
+            else:
+                self.__mark_frame(None)
+                with profiler.span("idle"):
+                    self.__wait_for_event()
+            self._frame += 1
 
-    async def async_main_loop(self):
+    def __pipelined_main_loop(self, max_frames: int | None = None) -> None:
         """
-        Start the main asynchronous game loop.
+        Run the main loop with logic for the next frame overlapping presentation.
+
+        Once a frame's scene is drawn, the rendered surface is all presentation
+        needs, so the next ``update_scene`` runs on a worker thread while the main
+        thread blits, draws overlays and flips (which release the GIL). The main
+        thread waits for that update before handling events and drawing again.
+        The update uses the previous frame's delta, and input affects the frame
+        after next. The last update is joined before returning, so an exception
+        it raised still reaches the caller.
 
-        Handles event processing, logic updates, and drawing using async/await.
-        Useful for games with asynchronous logic or networking.
+        Args:
+            max_frames (int, optional): Return after this many frames.
+        """
+        profiler = self._profiler
+        pending: Future | None = None
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="xodex-logic") as executor:
+            try:
+                while max_frames is None or self._frame < max_frames:
+                    profiler.begin_frame(self._frame)
+                    self.__mark_frame(None)
+                    with profiler.span("tick"):
+                        delta = self.__clock.tick(self._fps)
+                    self.__mark_frame(self._frame)
+                    if pending is not None:
+                        with profiler.span("wait"):
+                            alpha = pending.result()
+                    with profiler.span("events"):
+                        self.__process_all_events()
+                    if pending is None:
+                        alpha = self.__process_all_logic(delta)
+                    rendered = self.__render_scene(alpha)
+                    pending = executor.submit(self.__process_all_logic, delta)
+                    self.__present_scene(*rendered)
+                    self._frame += 1
+            finally:
+                # Join the last update so an exception it raised reaches the caller.
+                if pending is not None:
+                    pending.result()
+
+    async def async_main_loop(self, max_frames: int | None = None):
         """
-        import asyncio
+        Start the main asynchronous game loop.
+
+        Frames are paced by ``FrameScheduler`` deadlines rather than a blocking
+        ``clock.tick``, so other coroutines (networking, async saves, asset
+        loading) run between frames, and queued idle jobs get up to
+        ``ASYNC_IDLE_BUDGET`` milliseconds per frame. Scene logic runs through
+        ``BaseScene.async_update_scene``.
 
-        while True:
-            delta = self.__clock.tick(self._fps)
-            await self.__process_all_events()
-            await self.__process_all_logic_async(delta)
-            await self.__process_all_draw_async()
-            await asyncio.sleep(0)
+        Args:
+            max_frames (int, optional): Return after this many frames instead of
+                running until the game exits.
+        """
+        profiler = self._profiler
+        while max_frames is None or self._frame < max_frames:
+            profiler.begin_frame(self._frame)
+            self.__mark_frame(None)
+            with profiler.span("tick"):
+                await self._scheduler.wait_for_frame()
+                # Measure only; pacing is done by the scheduler.
+                delta = self.__clock.tick()
+            self.__mark_frame(self._frame)
+            with profiler.span("events"):
+                self.__process_all_events()
+            alpha = await self.__process_all_logic_async(delta)
+            if self.__needs_redraw():
+                self.__process_all_draw(alpha)
+            self._frame += 1
 
     def __process_all_events(self) -> None:
         """Process all Pygame events for the current frame, including scene and exit events."""
-        for event in pygame.event.get():
+        if self._event_filtering:
+            self.__update_allowed_events()
+        events = pygame.event.get()
+        if self._latency.enabled:
+            self._latency.stamp(events)
+        if self._waited_event is not None:
+            events.insert(0, self._waited_event)
+            self._waited_event = None
+        if self._coalesced_events:
+            events = coalesce_events(events, self._coalesced_events)
+        for event in events:
             SceneManager().current.handle_scene(event)
             self.__process_exit_events(event)
             if event.type == pygame.VIDEORESIZE:
                 self._on_resize(event.size)
 
-    def __process_all_logic(self, delta: float) -> None:
+    def __needs_redraw(self) -> bool:
+        """Return whether this frame must be drawn (see ``BaseScene.needs_redraw``)."""
+        scene = SceneManager().current
+        return scene is not self._presented_scene or scene.needs_redraw()
+
+    def __wait_for_event(self) -> None:
+        """
+        Sleep until an event arrives or ``ON_DEMAND_TIMEOUT`` ms pass, keeping the last frame on screen.
+
+        The event is handled at the start of the next frame. The accumulated
+        fixed-timestep time is dropped and the waiting time is left out of the
+        next frame's delta, so idling does not cause a burst of updates or one
+        large update step.
+        """
+        start = time.perf_counter()
+        event = pygame.event.wait(self._on_demand_timeout)
+        self._idle_time += (time.perf_counter() - start) * 1000
+        if event.type != pygame.NOEVENT:
+            if self._latency.enabled:
+                self._latency.stamp((event,))
+            self._waited_event = event
+        self._accumulator = 0.0
+
+    def __update_allowed_events(self) -> None:
+        """
+        Let SDL queue only the event types the current scene subscribes to.
+
+        Recomputed when the scene or its objects' subscriptions change. Exit and
+        resize events are always allowed; everything is allowed while a custom
+        event handler is set or any subscriber takes all events.
+        """
+        scene = SceneManager().current
+        key = (scene, scene.objects.event_version, self._custom_event_handler)
+        if key == self._allowed_events_key:
+            return
+        self._allowed_events_key = key
+        types = None if self._custom_event_handler else scene.subscribed_event_types()
+        if types is None:
+            pygame.event.set_allowed(None)
+            return
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.VIDEORESIZE, *types])
+
+    def __process_all_logic(self, delta: float) -> float | None:
         """
         Update the current scene's logic.
 
+        In fixed-timestep mode the frame time is added to an accumulator which is
+        consumed in ``_update_step`` slices (see ``__consume_fixed_steps``).
+
         Args:
             delta (float): Time elapsed since the last frame in milliseconds.
+
+        Returns:
+            float | None: Interpolation alpha in ``[0, 1)`` between the last two
+            fixed updates, or None when fixed-timestep mode is disabled.
+        """
+        scene = SceneManager().current
+        profiler = self._profiler
+        args = {"scene": type(scene).__name__} if profiler.enabled else None
+        if not self._fixed_timestep:
+            with profiler.span("update", args):
+                scene.update_scene(delta)
+            return None
+
+        for _ in range(self.__consume_fixed_steps(delta)):
+            with profiler.span("update", args):
+                scene.update_scene(self._update_step)
+        return self._accumulator / self._update_step
+
+    async def __process_all_logic_async(self, delta: float) -> float | None:
         """
+        Asynchronously update the current scene's logic.
 
-        SceneManager().current.update_scene(delta)
+        Same stepping as ``__process_all_logic`` but awaits ``async_update_scene``.
 
-    def __process_all_draw(self) -> None:
-        """Draw the current scene and overlays to the screen."""
-        self.__screen.fill((255, 55, 23))
-        self.__screen.blit(SceneManager().current.draw_scene(), (0, 0))
-        if self._debug:
-            if self._show_fps:
-                fps = self.__clock.get_fps()
-                fps_surf = self._font.render(f"FPS: {fps:.1f}", True, (0, 0, 0))
-                self.__screen.blit(fps_surf, (10, 10))
-            if self._debug_overlay:
-                self._draw_debug_overlay()
-        pygame.display.flip()
+        Args:
+            delta (float): Time elapsed since the last frame in milliseconds.
 
-    async def __process_all_logic_async(self, delta: float):
+        Returns:
+            float | None: Interpolation alpha, or None when fixed-timestep mode is disabled.
         """
-        Asynchronously update the current scene's logic.
+        scene = SceneManager().current
+        profiler = self._profiler
+        args = {"scene": type(scene).__name__} if profiler.enabled else None
+        if not self._fixed_timestep:
+            with profiler.span("update", args):
+                await scene.async_update_scene(delta)
+            return None
+
+        for _ in range(self.__consume_fixed_steps(delta)):
+            with profiler.span("update", args):
+                await scene.async_update_scene(self._update_step)
+        return self._accumulator / self._update_step
+
+    def __consume_fixed_steps(self, delta: float) -> int:
+        """
+        Add `delta` to the accumulator and take out the fixed steps to run.
+
+        At most ``_max_update_steps`` steps are taken; any whole steps left
+        beyond that are dropped so a slow machine falls behind gracefully
+        instead of spiralling.
+
+        Returns:
+            int: Number of fixed updates to run this frame.
+        """
+        self._accumulator += delta
+        steps = min(int(self._accumulator // self._update_step), self._max_update_steps)
+        self._accumulator -= steps * self._update_step
+        if self._accumulator >= self._update_step:
+            self._accumulator %= self._update_step
+        return steps
+
+    def __process_all_draw(self, alpha: float | None = None) -> None:
+        """
+        Draw the current scene and overlays to the screen.
+
+        The scene's draw time drives its dynamic resolution; a scene rendering
+        below full resolution is upscaled to the window. With
+        ``DIRECT_RENDERING`` a scene that allows it draws onto the display itself.
 
         Args:
-            delta (float): Time elapsed since the last frame in milliseconds.
+            alpha (float, optional): Interpolation alpha from fixed-timestep updates,
+                forwarded to the scene's ``draw_scene``.
+        """
+        self.__present_scene(*self.__render_scene(alpha))
+
+    def __render_scene(self, alpha: float | None = None) -> tuple:
         """
-        SceneManager().current.update_scene(delta)
+        Draw the current scene to its surface.
 
-    async def __process_all_draw_async(self):
-        """Asynchronously draw the current scene and overlays to the screen."""
-        self.__screen.fill((255, 55, 23))
-        self.__screen.blit(SceneManager().current.draw_scene(), (0, 0))
+        Returns:
+            tuple: ``(scene, surface, dirty rects or None, render scale)``, everything
+            ``__present_scene`` needs without touching object state again.
+        """
+        scene = SceneManager().current
+        if scene is not self._presented_scene:
+            self._presented_scene = scene
+            scene.invalidate()
+        profiler = self._profiler
+        kwargs = {} if alpha is None else {"alpha": alpha}
+        render_scale = scene.render_scale
+        if render_scale != 1:
+            kwargs["render_scale"] = render_scale
+        direct = self._direct_rendering and not self._dirty_rendering and scene.can_draw_direct(self.__screen)
+        start = time.perf_counter()
+        with profiler.span("draw", {"scene": type(scene).__name__} if profiler.enabled else None):
+            if direct:
+                surface = scene.draw_direct(self.__screen, **kwargs)
+            else:
+                surface = scene.draw_scene(**kwargs)
+        scene.update_render_scale((time.perf_counter() - start) * 1000)
+        rects = scene.dirty_rects if self._dirty_rendering else None
+        return scene, surface, rects, render_scale
+
+    def __present_scene(self, scene, surface: pygame.Surface, rects: list | None, render_scale: float) -> None:
+        """Copy a rendered scene surface to the window, draw the overlays and flip."""
+        profiler = self._profiler
+        if rects is None:
+            with profiler.span("present"):
+                if surface is self.__screen:
+                    pass  # Drawn directly onto the display.
+                elif render_scale == 1:
+                    self.__screen.fill((255, 55, 23))
+                    self.__screen.blit(surface, (0, 0))
+                elif scene.size == self.__screen.get_size():
+                    pygame.transform.scale(surface, scene.size, self.__screen)
+                else:
+                    self.__screen.fill((255, 55, 23))
+                    self.__screen.blit(pygame.transform.scale(surface, scene.size), (0, 0))
+            with profiler.span("overlay"):
+                self._overlay_rects = self.__draw_overlays()
+            with profiler.span("flip"):
+                pygame.display.flip()
+            if self._latency.enabled:
+                self._latency.presented()
+            return
+
+        # Restore the scene under last frame's overlays along with the changed regions.
+        with profiler.span("present"):
+            for rect in rects + self._overlay_rects:
+                self.__screen.blit(surface, rect, rect)
+        with profiler.span("overlay"):
+            overlay_rects = self.__draw_overlays()
+        with profiler.span("flip"):
+            pygame.display.update(rects + self._overlay_rects + overlay_rects)
+        self._overlay_rects = overlay_rects
+        if self._latency.enabled:
+            self._latency.presented()
+
+    def __draw_overlays(self) -> list[pygame.Rect]:
+        """
+        Draw the FPS counter and debug overlay onto the screen.
+
+        Returns:
+            list[pygame.Rect]: Screen regions covered by the overlays.
+        """
+        rects = []
         if self._debug:
             if self._show_fps:
                 fps = self.__clock.get_fps()
                 fps_surf = self._font.render(f"FPS: {fps:.1f}", True, (0, 0, 0))
-                self.__screen.blit(fps_surf, (10, 10))
+                rects.append(self.__screen.blit(fps_surf, (10, 10)))
             if self._debug_overlay:
-                self._draw_debug_overlay()
-        pygame.display.flip()
+                rects.extend(self._draw_debug_overlay())
+        return rects
 
-    def _draw_debug_overlay(self):
+    def _draw_debug_overlay(self) -> list[pygame.Rect]:
         """Draw a debug information overlay (scene name, object count, etc.) on the screen."""
         info = [
             f"Scene: {type(SceneManager().current).__name__}",
             f"Objects: {len(getattr(SceneManager().current, '_objects', []))}",
         ]
+        rects = []
         for i, line in enumerate(info):
             surf = self._font.render(line, True, (0, 0, 0))
-            self.__screen.blit(surf, (10, 30 + i * 20))
+            rects.append(self.__screen.blit(surf, (10, 30 + i * 20)))
+        return rects
 
     def _on_resize(self, size):
         """
@@ -307,10 +719,7 @@ class Game(Singleton):
             size (tuple): The new window size as (width, height).
         """
         self._size = size
-        flags = pygame.SCALED | pygame.RESIZABLE
-        if self._fullscreen:
-            flags |= pygame.FULLSCREEN
-        self.__screen = pygame.display.set_mode(self._size, flags=flags)
+        self.__set_display_mode()
         if self._debug:
             print(f"Window resized to: {self._size}")
 
@@ -318,6 +727,35 @@ class Game(Singleton):
 
     # region Private
 
+    def __soft_restart(self) -> None:
+        """Tear down scenes and registrations, re-import the project's modules, and run ``setup``."""
+        start = time.perf_counter()
+        manager = SceneManager()
+        manager.clear()
+        manager.clear_registry()
+        ObjectsManager().clear()
+
+        # Any project module may register objects or scenes, so all of them are
+        # re-imported (in their original import order), except the settings.
+        project = settings.PROJECT
+        modules = [
+            module
+            for module in sys.modules
+            if (module == project or module.startswith(f"{project}.")) and module != settings.SETTINGS_MODULE
+        ]
+        for module in modules:
+            del sys.modules[module]
+        for module in modules:
+            if module not in sys.modules:
+                try:
+                    import_module(module)
+                except Exception as e:
+                    logging.warning(f"Failed to re-import {module}: {e}")
+
+        self._waited_event = None
+        self.setup()
+        logging.info(f"Soft restart finished in {(time.perf_counter() - start) * 1000:.1f} ms.")
+
     def setup(self, on_success=None, on_failure=None):
         """
         Load and (re)initialize game configuration, scenes, and objects.
@@ -351,17 +789,33 @@ class Game(Singleton):
             self._size = settings.WINDOW_SIZE
             self._caption = settings.TITLE
             self._icon = settings.ICON_PATH
-            self._fps = settings.FPS
+            self._fps = 1000 / settings.FRAME_BUDGET if settings.FRAME_BUDGET else settings.FPS
             self._debug = settings.DEBUG
             self._fullscreen = settings.FULLSCREEN
             self._mainscene = settings.MAIN_SCENE
             self._show_fps = settings.SHOW_FPS
+            self._fixed_timestep = settings.FIXED_TIMESTEP
+            self._update_step = 1000 / settings.UPDATE_RATE
+            self._max_update_steps = settings.MAX_UPDATE_STEPS
+            self._accumulator = 0.0
+            self._dirty_rendering = settings.DIRTY_RECTS
+            self._event_filtering = settings.EVENT_FILTERING
+            self._allowed_events_key = None
+            self._coalesced_events = self._coalesced_event_types()
+            self._pipelined_frames = settings.PIPELINED_FRAMES
+            self._direct_rendering = settings.DIRECT_RENDERING
+            self._on_demand_timeout = settings.ON_DEMAND_TIMEOUT
+            self._presented_scene = None
+            self._idle_time = 0.0
+            self._profiler.configure(settings.ENABLE_PROFILER, settings.PROFILER_CAPACITY)
+            self._scheduler.set_fps(self._fps)
+            self.__clock = self._create_clock()
+            self._scheduler.idle_budget = settings.ASYNC_IDLE_BUDGET
+            self._latency.enabled = settings.MEASURE_INPUT_LATENCY
+            self._configure_watchdog()
 
             # Update window properties
-            flags = pygame.SCALED | pygame.RESIZABLE
-            if self._fullscreen:
-                flags |= pygame.FULLSCREEN
-            self.__screen = pygame.display.set_mode(self._size, flags)
+            self.__set_display_mode()
             pygame.display.set_caption(self._caption)
             if self._icon:
                 self.set_icon(self._icon)
@@ -418,7 +872,15 @@ class Game(Singleton):
 # endregion
 
 
-def run(project=None, on_setup_success=None, on_setup_failure=None, async_mode=False):
+def run(
+    project=None,
+    on_setup_success=None,
+    on_setup_failure=None,
+    async_mode=False,
+    max_frames=None,
+    uncapped=False,
+    trace=None,
+):
     """
     Entry point to start the Xodex game loop.
 
@@ -428,10 +890,15 @@ def run(project=None, on_setup_success=None, on_setup_failure=None, async_mode=F
         on_setup_success (callable, optional): Called after successful setup.
         on_setup_failure (callable, optional): Called after failed setup.
         async_mode (bool, optional): If True, runs the async main loop.
+        max_frames (int, optional): Return after this many frames.
+        uncapped (bool, optional): If True, ignore ``settings.FPS`` and run as fast as possible.
+        trace (str, optional): Enable the frame profiler and write a Chrome trace to this path on exit.
 
     Usage:
         run("mygame")
         run(project="mygame", async_mode=True)
+        run("mygame", max_frames=600, uncapped=True)
+        run("mygame", trace="trace.json")
     """
 
     os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
@@ -441,9 +908,17 @@ def run(project=None, on_setup_success=None, on_setup_failure=None, async_mode=F
         settings._setup()
     game = Game()
     game.setup()
-    if async_mode:
-        import asyncio
-
-        asyncio.run(game.async_main_loop())
-    else:
-        game.main_loop()
+    if uncapped:
+        game.set_fps(0)
+    if trace:
+        game._profiler.enable()
+    try:
+        if async_mode:
+            import asyncio
+
+            asyncio.run(game.async_main_loop(max_frames))
+        else:
+            game.main_loop(max_frames)
+    finally:
+        if trace:
+            game._profiler.dump_chrome_trace(trace)
@@ -0,0 +1,84 @@
+"""Events
+
+Event coalescing for the Xodex game loop.
+
+- Consecutive MOUSEMOTION events merge into one with the summed ``rel``.
+- Consecutive JOYAXISMOTION events for the same joystick axis keep the latest value.
+- Only the last VIDEORESIZE of a frame is kept.
+- All other events pass through unchanged and in order.
+- A merged event keeps the ``xodex_timestamp`` of the oldest event it replaces,
+  so input latency is measured from the first input.
+
+Usage:
+    events = coalesce_events(pygame.event.get())
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+import pygame
+from pygame.event import Event
+
+__all__ = ("COALESCIBLE_EVENT_TYPES", "coalesce_events")
+
+COALESCIBLE_EVENT_TYPES = frozenset((pygame.MOUSEMOTION, pygame.JOYAXISMOTION, pygame.VIDEORESIZE))
+
+
+def _joystick_axis(event: Event) -> tuple:
+    """Return the (joystick, axis) an axis motion event belongs to."""
+    return getattr(event, "instance_id", getattr(event, "joy", None)), event.axis
+
+
+def _keep_timestamp(event: Event, older: Event) -> Event:
+    """Give `event` the latency timestamp of the `older` event it replaces, if stamped."""
+    if hasattr(older, "xodex_timestamp"):
+        event.xodex_timestamp = older.xodex_timestamp
+    return event
+
+
+def coalesce_events(events: Iterable[Event], types: Iterable[int] = COALESCIBLE_EVENT_TYPES) -> list[Event]:
+    """
+    Merge redundant high-frequency events.
+
+    Args:
+        events (Iterable[Event]): Events in queue order, e.g. from ``pygame.event.get()``.
+        types (Iterable[int]): Event types to coalesce; a subset of ``COALESCIBLE_EVENT_TYPES``.
+
+    Returns:
+        list[Event]: The coalesced events, in order.
+    """
+    types = frozenset(types)
+    result: list[Event] = []
+    resize_index = None
+    for event in events:
+        kind = event.type
+        if kind not in types:
+            result.append(event)
+            continue
+        previous = result[-1] if result else None
+
+        if kind == pygame.MOUSEMOTION:
+            if previous is not None and previous.type == pygame.MOUSEMOTION:
+                attrs = event.dict.copy()
+                attrs["rel"] = (previous.rel[0] + event.rel[0], previous.rel[1] + event.rel[1])
+                result[-1] = _keep_timestamp(Event(kind, attrs), previous)
+                continue
+        elif kind == pygame.JOYAXISMOTION:
+            if (
+                previous is not None
+                and previous.type == pygame.JOYAXISMOTION
+                and _joystick_axis(previous) == _joystick_axis(event)
+            ):
+                result[-1] = _keep_timestamp(event, previous)
+                continue
+        elif kind == pygame.VIDEORESIZE:
+            if resize_index is not None:
+                _keep_timestamp(event, result[resize_index])
+                result[resize_index] = None
+            resize_index = len(result)
+        result.append(event)
+
+    if resize_index is not None:
+        result = [event for event in result if event is not None]
+    return result
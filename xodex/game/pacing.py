@@ -0,0 +1,123 @@
+"""Pacing
+
+High-precision frame limiter for the Xodex game loop.
+
+- Hybrid limiter: sleeps until shortly before the frame deadline, then spins
+  for the last ``spin_window`` milliseconds to hit it precisely.
+- Deadlines advance by exactly one frame budget, so rates such as 144 Hz do
+  not drift or judder from millisecond rounding.
+- Keeps recent frame times and reports p50/p95/p99 frame time and jitter.
+- Drop-in for ``pygame.time.Clock`` in the game loop (``tick``, ``get_fps``, ``get_time``).
+
+Usage:
+    pacer = FramePacer(spin_window=2)
+    while True:
+        delta = pacer.tick(144)
+        ...
+    print(pacer.jitter())
+"""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+
+from xodex.utils.stats import percentile
+from xodex.utils.stats import percentiles
+
+__all__ = ("FramePacer",)
+
+
+class FramePacer:
+    """
+    Limits the frame rate with a sleep-then-spin wait and records frame times.
+
+    Attributes:
+        spin_window (float): Milliseconds before a deadline to stop sleeping and spin.
+        budget (float): Frame budget in milliseconds of the last limited tick; 0 if uncapped.
+    """
+
+    def __init__(self, spin_window: float = 2.0, history: int = 240):
+        self.spin_window = spin_window
+        self.budget = 0.0
+        self._last = time.perf_counter()
+        self._deadline = self._last
+        self._frame_times: deque[float] = deque(maxlen=history)
+
+    def tick(self, framerate: float = 0) -> float:
+        """
+        Wait until the next frame deadline and return the time since the last tick.
+
+        Args:
+            framerate (float): Target frames per second; 0 (or less) does not limit.
+
+        Returns:
+            float: Milliseconds elapsed since the previous call.
+        """
+        if framerate > 0:
+            budget = 1 / framerate
+            self.budget = budget * 1000
+            target = self._deadline + budget
+            self._wait_until(target)
+            now = time.perf_counter()
+            # Advance from the deadline rather than from now to keep an exact
+            # cadence; resynchronise once a frame ran more than a budget late.
+            self._deadline = target if now - target < budget else now
+        else:
+            self.budget = 0.0
+            now = time.perf_counter()
+            self._deadline = now
+
+        delta = (now - self._last) * 1000
+        self._last = now
+        self._frame_times.append(delta)
+        return delta
+
+    def _wait_until(self, target: float) -> None:
+        """Sleep until `spin_window` before `target`, then busy-wait until it."""
+        remaining = target - time.perf_counter() - self.spin_window / 1000
+        if remaining > 0:
+            time.sleep(remaining)
+        while time.perf_counter() < target:
+            pass
+
+    def get_time(self) -> float:
+        """Return the duration of the last frame in milliseconds."""
+        return self._frame_times[-1] if self._frame_times else 0.0
+
+    def get_fps(self) -> float:
+        """Return the frame rate averaged over the last ten frames."""
+        recent = list(self._frame_times)[-10:]
+        total = sum(recent)
+        return len(recent) * 1000 / total if total else 0.0
+
+    @property
+    def frame_times(self) -> list[float]:
+        """Recent frame times in milliseconds, oldest first."""
+        return list(self._frame_times)
+
+    def percentiles(self) -> dict[str, float]:
+        """
+        Return frame-time percentiles.
+
+        Returns:
+            dict: ``{"p50", "p95", "p99"}`` in milliseconds.
+        """
+        return percentiles(self._frame_times)
+
+    def jitter(self) -> dict[str, float]:
+        """
+        Return percentiles of how far frame times deviate from the target.
+
+        The target is the frame budget, or the median frame time when uncapped.
+
+        Returns:
+            dict: ``{"p50", "p95", "p99"}`` in milliseconds.
+        """
+        target = self.budget or percentile(sorted(self._frame_times), 50)
+        return percentiles([abs(value - target) for value in self._frame_times])
+
+    def reset(self) -> None:
+        """Forget recorded frame times and restart the deadline from now."""
+        self._frame_times.clear()
+        self._last = self._deadline = time.perf_counter()
@@ -0,0 +1,123 @@
+"""Scheduler
+
+Frame scheduler for the asyncio game loop.
+
+- Waits for frame deadlines with ``asyncio.sleep`` instead of blocking the
+  event loop, so network, storage and other coroutines run between frames.
+- Resynchronises after a long frame instead of bursting to catch up.
+- Runs queued idle jobs (callables or generators) before sleeping, within a
+  per-frame time budget.
+
+Usage:
+    scheduler = FrameScheduler(fps=60, idle_budget=4)
+    scheduler.call_idle(load_level_chunks())  # generator, resumed frame by frame
+    while True:
+        await scheduler.wait_for_frame()
+        ...
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+from xodex.utils.log import get_xodex_logger
+
+__all__ = ("FrameScheduler",)
+
+logger = get_xodex_logger(__name__)
+
+
+class FrameScheduler:
+    """
+    Paces an asyncio game loop using frame deadlines.
+
+    Attributes:
+        fps (int): Target frame rate; 0 means uncapped.
+        idle_budget (float): Maximum time in milliseconds spent on idle jobs per frame.
+    """
+
+    def __init__(self, fps: int = 60, idle_budget: float = 4):
+        self.fps = fps
+        self.idle_budget = idle_budget
+        self._deadline: float | None = None
+        self._jobs: deque[tuple[Callable | Any, tuple]] = deque()
+
+    @property
+    def pending(self) -> int:
+        """Number of idle jobs waiting to run."""
+        return len(self._jobs)
+
+    def set_fps(self, fps: int) -> None:
+        """
+        Set the target frame rate.
+
+        Args:
+            fps (int): Frames per second; 0 disables frame limiting.
+        """
+        self.fps = fps
+        self._deadline = None
+
+    def call_idle(self, job: Callable | Any, *args) -> None:
+        """
+        Queue work to run between frames.
+
+        Args:
+            job (callable | generator): A callable run once with `args`, or a
+                generator resumed once per slice until it is exhausted.
+            *args: Arguments for a callable job.
+        """
+        self._jobs.append((job, args))
+
+    def run_idle_jobs(self, until: float | None = None) -> int:
+        """
+        Run queued idle jobs until the budget or `until` is reached.
+
+        Args:
+            until (float, optional): ``time.perf_counter`` value to stop at.
+
+        Returns:
+            int: Number of job slices run.
+        """
+        start = time.perf_counter()
+        stop = start + self.idle_budget / 1000
+        if until is not None:
+            stop = min(stop, until)
+        ran = 0
+        # Always run one slice so queued work progresses even on late frames.
+        while self._jobs:
+            if ran and time.perf_counter() >= stop:
+                break
+            job, args = self._jobs.popleft()
+            ran += 1
+            try:
+                if inspect.isgenerator(job):
+                    next(job)
+                    self._jobs.append((job, args))
+                else:
+                    job(*args)
+            except StopIteration:
+                pass
+            except Exception as e:
+                logger.error(f"Error in idle job {job!r}: {e}")
+        return ran
+
+    async def wait_for_frame(self) -> None:
+        """
+        Run idle jobs, then yield to the event loop until the next frame deadline.
+
+        Other coroutines run while waiting. When a frame overran by more than a
+        whole frame interval the deadline is reset to now.
+        """
+        interval = 1 / self.fps if self.fps > 0 else 0.0
+        now = time.perf_counter()
+        if self._deadline is None or now - self._deadline > interval:
+            self._deadline = now
+        self._deadline += interval
+
+        self.run_idle_jobs(self._deadline if interval else None)
+        await asyncio.sleep(max(0.0, self._deadline - time.perf_counter()))
@@ -0,0 +1,145 @@
+"""Watchdog
+
+Long-frame (hitch) detector for the Xodex game loop.
+
+- The game loop marks the start of every frame; marking is a single attribute write.
+- A background thread wakes when the current frame passes the hitch threshold
+  and then samples the game thread's Python stack at a fixed interval
+  through ``sys._current_frames()``.
+- When the frame ends, its ID, duration and stack samples are appended to a
+  bounded JSON-lines hitch log that keeps the most recent entries.
+
+Usage:
+    watchdog = StallWatchdog(threshold=50, interval=5, log_path="hitches.jsonl")
+    watchdog.start()
+    while True:
+        watchdog.mark(frame)
+        ...
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+
+from xodex.utils.log import get_xodex_logger
+
+__all__ = ("StallWatchdog",)
+
+logger = get_xodex_logger(__name__)
+
+MAX_SAMPLES = 200  # Stack samples kept per hitch
+
+
+class StallWatchdog(threading.Thread):
+    """
+    Samples the game thread's stack while a frame runs longer than a threshold.
+
+    Attributes:
+        threshold (float): Frame time in milliseconds after which sampling starts.
+        interval (float): Milliseconds between stack samples during a hitch.
+        log_path (str): JSON-lines file the hitches are written to.
+        log_size (int): Number of most recent hitches kept in the log.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 50,
+        interval: float = 5,
+        log_path: str = "hitches.jsonl",
+        log_size: int = 100,
+        thread_id: int | None = None,
+    ):
+        super().__init__(name="xodex-watchdog", daemon=True)
+        self.threshold = threshold
+        self.interval = interval
+        self.log_path = log_path
+        self.log_size = log_size
+        self._thread_id = thread_id or threading.get_ident()
+        self._current: tuple[int | None, float] = (None, time.perf_counter())
+        self._hitch: dict | None = None
+        self._hitch_mark: tuple | None = None
+        self._stop_event = threading.Event()
+        self._entries: deque[str] = deque(self._read_log(), maxlen=log_size)
+
+    def mark(self, frame: int | None) -> None:
+        """
+        Mark the start of a frame in the game thread.
+
+        Args:
+            frame (int | None): Frame ID, or None while the loop waits on purpose
+                (e.g. for input), which is never reported as a hitch.
+        """
+        self._current = (frame, time.perf_counter())
+
+    def stop(self) -> None:
+        """Stop the thread and write any hitch still in progress."""
+        self._stop_event.set()
+        if self.is_alive() and threading.current_thread() is not self:
+            self.join()
+        if self._hitch is not None:
+            self._finish_hitch(time.perf_counter())
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self._next_wait()):
+            current = self._current
+            if self._hitch is not None and current is not self._hitch_mark:
+                self._finish_hitch(current[1])
+            frame, start = current
+            if frame is None or (time.perf_counter() - start) * 1000 < self.threshold:
+                continue
+            if self._hitch is None:
+                self._hitch = {"frame": frame, "samples": []}
+                self._hitch_mark = current
+            self._sample(start)
+
+    def _next_wait(self) -> float:
+        """Seconds to sleep: the sampling interval during a hitch, else until the threshold."""
+        frame, start = self._current
+        if self._hitch is not None or frame is None:
+            return self.interval / 1000
+        remaining = start + self.threshold / 1000 - time.perf_counter()
+        return max(self.interval / 1000, remaining)
+
+    def _sample(self, start: float) -> None:
+        """Record the game thread's current stack."""
+        samples = self._hitch["samples"]
+        if len(samples) >= MAX_SAMPLES:
+            return
+        frame = sys._current_frames().get(self._thread_id)
+        if frame is None:
+            return
+        stack = [f"{entry.filename}:{entry.lineno} in {entry.name}" for entry in traceback.extract_stack(frame)]
+        samples.append({"t_ms": round((time.perf_counter() - start) * 1000, 2), "stack": stack})
+
+    def _finish_hitch(self, end: float) -> None:
+        """Append the finished hitch to the log."""
+        hitch, self._hitch = self._hitch, None
+        hitch["duration_ms"] = round((end - self._hitch_mark[1]) * 1000, 2)
+        self._hitch_mark = None
+        logger.warning(f"Frame {hitch['frame']} took {hitch['duration_ms']} ms; stack samples in {self.log_path}")
+        self._entries.append(json.dumps(hitch))
+        self._write_log()
+
+    def _read_log(self) -> list[str]:
+        """Return the entries of an existing hitch log."""
+        try:
+            with open(self.log_path, encoding="utf-8") as log:
+                return [line.rstrip("\n") for line in log if line.strip()]
+        except OSError:
+            return []
+
+    def _write_log(self) -> None:
+        """Rewrite the log with the most recent `log_size` hitches."""
+        temporary = f"{self.log_path}.tmp"
+        try:
+            with open(temporary, "w", encoding="utf-8") as log:
+                log.writelines(f"{entry}\n" for entry in self._entries)
+            os.replace(temporary, self.log_path)
+        except OSError as e:
+            logger.error(f"Could not write hitch log {self.log_path}: {e}")
@@ -1,13 +1,17 @@
+from xodex.object.base import CollidableObject
 from xodex.object.base import DrawableObject
 from xodex.object.base import EventfulObject
 from xodex.object.base import LogicalObject
 from xodex.object.base import Object
 from xodex.object.manager import ObjectsManager
 from xodex.object.manager import register
+from xodex.object.pool import ObjectPool
 
 __all__ = (
     "make_xodex_object",
     "ObjectsManager",
+    "ObjectPool",
+    "CollidableObject",
     "DrawableObject",
     "EventfulObject",
     "LogicalObject",
@@ -4,6 +4,7 @@ Defines base classes for game objects:
 - LogicalObject: Updatable logic objects.
 - DrawableObject: Renderable objects.
 - EventfulObject: Objects that handle events.
+- CollidableObject: Objects taking part in scene collision detection.
 """
 
 from __future__ import annotations
@@ -11,18 +12,107 @@ from __future__ import annotations
 import time
 from abc import ABC
 from abc import abstractmethod
+from collections.abc import Iterable
 
+from pygame import Rect
 from pygame import Surface
+from pygame import transform
 from pygame.event import Event
+from pygame.mask import Mask
 
-__all__ = ("Object", "DrawableObject", "EventfulObject", "LogicalObject")
+from xodex.utils.latency import LatencyTracker
+from xodex.utils.profiler import FrameProfiler
+
+_latency_tracker = LatencyTracker()
+
+__all__ = ("Object", "DrawableObject", "EventfulObject", "LogicalObject", "CollidableObject")
+
+_CLONE_COPIED = (list, dict, set, Rect)  # Per-instance state copied by Object.clone; other values are shared
+_CLONE_DROPPED = ("_name", "_z_owners", "_lookup_owners", "_drawn_bounds")  # Not carried over to clones
 
 
 class BaseObject:
     """Base class for all game objects."""
 
 
-class Object(BaseObject): ...
+def _overrides(cls, base: type, *names: str) -> bool:
+    """Return True if `cls` overrides any of the methods `names` defined on `base`."""
+    return any(getattr(cls, name) is not getattr(base, name) for name in names)
+
+
+class Object(BaseObject):
+    """
+    Base class for scene objects.
+
+    Objects can carry tags and a unique name; containers index both, so scenes
+    can look objects up by tag or name without scanning.
+
+    ``clone`` makes cheap copies for prefab spawning (see ``ObjectsManager.register_prefab``).
+    """
+
+    _tags: frozenset[str] = frozenset()
+    _name: str | None = None
+    _lookup_owners: tuple = ()  # Containers indexing this object's tags and name, and taking redraw requests
+
+    @property
+    def tags(self) -> frozenset[str]:
+        """Tags of this object, e.g. ``{"enemy"}``."""
+        return self._tags
+
+    @tags.setter
+    def tags(self, value: Iterable[str]) -> None:
+        previous, self._tags = self._tags, frozenset(value)
+        for owner in self._lookup_owners:
+            owner._retag_(self, previous)
+
+    def add_tag(self, *tags: str) -> None:
+        """Add tags to this object."""
+        self.tags = self._tags.union(tags)
+
+    def remove_tag(self, *tags: str) -> None:
+        """Remove tags from this object, ignoring ones it does not have."""
+        self.tags = self._tags.difference(tags)
+
+    def has_tag(self, tag: str) -> bool:
+        """Return True if the object carries `tag`."""
+        return tag in self._tags
+
+    @property
+    def name(self) -> str | None:
+        """Name of this object, unique within each container; None if unnamed."""
+        return self._name
+
+    @name.setter
+    def name(self, value: str | None) -> None:
+        for owner in self._lookup_owners:
+            owner._check_name_(self, value)
+        previous, self._name = self._name, value
+        for owner in self._lookup_owners:
+            owner._rename_(self, previous)
+
+    def clone(self, **overrides):
+        """
+        Return a copy of this object without running ``__init__``.
+
+        Values such as surfaces and fonts are shared with this object; lists,
+        dicts, sets and rects are copied, so the clone can move and change them
+        on its own. The clone is in no container and has no name.
+
+        Args:
+            **overrides: Attributes or properties to set on the clone, e.g. ``position``.
+        """
+        clone = object.__new__(type(self))
+        state = clone.__dict__
+        for key, value in self.__dict__.items():
+            if key not in _CLONE_DROPPED:
+                state[key] = value.copy() if isinstance(value, _CLONE_COPIED) else value
+        clone._cloned_(self)
+        for key, value in overrides.items():
+            setattr(clone, key, value)
+        return clone
+
+    def _cloned_(self, original: Object) -> None:
+        """Hook run on a new clone of `original` before overrides are applied. Override to copy more state."""
 
 
 class LogicalObject(Object, ABC):
@@ -41,11 +131,20 @@ class LogicalObject(Object, ABC):
     - Enable/disable updating at runtime.
     - Optional update profiling.
     - Update error handling hook.
+    - Containers call ``_update_dispatch_``, which skips the hooks a class does
+      not override and profiling while ``update_profile`` is off.
     """
 
     update_enabled: bool = True  # Toggle updating on/off
     update_profile: bool = False  # Enable profiling of update time
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        if _overrides(cls, LogicalObject, "update_xodex_object", "before_update", "after_update"):
+            cls._update_dispatch_ = cls.update_xodex_object
+        else:
+            cls._update_dispatch_ = _update_fast
+
     def update_xodex_object(self, deltatime: float, *args, **kwargs) -> None:
         """
         Update the instance.
@@ -99,10 +198,12 @@ class LogicalObject(Object, ABC):
         """
         Hook called with elapsed time if update_profile is enabled.
 
+        Records an object span in the frame profiler by default.
+
         Args:
             elapsed (float): Time in seconds spent in update().
         """
-        # Override to log or collect update timing.
+        FrameProfiler().record(f"{type(self).__name__}.update", elapsed)
 
     def on_update_error(self, exc: Exception):
         """Hook called if an exception occurs during update."""
@@ -126,11 +227,43 @@ class DrawableObject(Object, ABC):
     - Optional draw profiling.
     - Draw error handling hook.
     - Supports visibility toggling.
+    - Reports changed screen regions for dirty-rect rendering.
+    - Optional reduced-resolution drawing for dynamic resolution scaling.
+    - ``z_index`` layering; containers reposition the object when it changes.
+    - Containers call ``_draw_dispatch_``, which skips the hooks a class does
+      not override and profiling while ``draw_profile`` is off.
     """
 
     visible: bool = True
     draw_enabled: bool = True  # Toggle drawing on/off
     draw_profile: bool = False  # Enable profiling of draw time
+    dirty: bool = False  # Force a redraw in dirty-rect mode
+    _drawn_bounds: Rect | None = None  # Bounds at the last dirty-rect collection
+    supports_render_scale: bool = False  # Honours the render_scale draw kwarg
+    _scaled_cache: tuple | None = None  # (source, scale, scaled surface) of blit_scaled
+    _z_index: float = 0
+    _z_owners: tuple = ()  # Containers keeping this object in z order
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        if _overrides(cls, DrawableObject, "draw_xodex_object", "before_draw", "after_draw"):
+            cls._draw_dispatch_ = cls.draw_xodex_object
+        else:
+            cls._draw_dispatch_ = _draw_fast
+
+    @property
+    def z_index(self) -> float:
+        """Drawing layer; higher values are drawn on top, equal values in container order."""
+        return self._z_index
+
+    @z_index.setter
+    def z_index(self, value: float) -> None:
+        if value == self._z_index:
+            return
+        previous = self._z_index
+        self._z_index = value
+        for owner in self._z_owners:
+            owner._reorder_(self, previous)
 
     def draw_xodex_object(self, surface: Surface, *args, **kwargs) -> None:
         """
@@ -139,10 +272,17 @@ class DrawableObject(Object, ABC):
         Args:
             surface (Surface): The Pygame surface to draw on.
             *args: Additional positional arguments.
-            **kwargs: Additional keyword arguments.
+            **kwargs: Additional keyword arguments. When the game runs with a
+                fixed timestep this includes ``alpha``, the fraction of an update
+                step elapsed since the last update, for interpolating positions.
+                With dynamic resolution it includes ``render_scale``, the factor
+                by which `surface` is smaller than the window; objects with
+                ``supports_render_scale`` draw scaled accordingly. In a scene with
+                a camera it includes ``view_offset``, the ``(dx, dy)`` to add to
+                world positions.
         """
 
-        if not getattr(self, "draw_enabled", True):
+        if not getattr(self, "draw_enabled", True) or not self.visible:
             return
         start_time = time.perf_counter() if getattr(self, "draw_profile", False) else None
         try:
@@ -177,6 +317,74 @@ class DrawableObject(Object, ABC):
         """
         self.visible = visible
 
+    def get_bounds(self) -> Rect | None:
+        """
+        Return the area this object covers on its surface.
+
+        Defaults to a copy of the object's ``rect`` attribute. Override when the
+        object draws outside its rect or has no rect at all.
+
+        Returns:
+            Rect | None: The covered area, or None if it is unknown.
+        """
+        rect = getattr(self, "rect", None)
+        return Rect(rect) if rect is not None else None
+
+    def mark_dirty(self) -> None:
+        """
+        Flag the object for redraw, e.g. after its image changed in place.
+
+        Redraws the object's area in dirty-rect mode and wakes an idle on-demand scene.
+        """
+        self.dirty = True
+        self._scaled_cache = None
+        for owner in self._lookup_owners:
+            owner._redraw_requested = True
+
+    def blit_scaled(self, surface: Surface, image: Surface, pos, scale: float = 1.0, offset=(0, 0)) -> Rect:
+        """
+        Blit `image` at window position `pos` onto a surface rendered at `scale`.
+
+        The scaled image is cached until `image` or `scale` changes, or ``mark_dirty`` is called.
+
+        Args:
+            surface (Surface): The target surface.
+            image (Surface): The full-resolution image.
+            pos: Window-space ``(x, y)`` position or rect.
+            scale (float): The ``render_scale`` draw kwarg.
+            offset: The ``view_offset`` draw kwarg, added to `pos`.
+
+        Returns:
+            Rect: The area drawn on `surface`.
+        """
+        pos = (pos[0] + offset[0], pos[1] + offset[1])
+        if scale == 1:
+            return surface.blit(image, pos)
+        cache = self._scaled_cache
+        if cache is None or cache[0] is not image or cache[1] != scale:
+            size = (max(1, round(image.get_width() * scale)), max(1, round(image.get_height() * scale)))
+            cache = self._scaled_cache = (image, scale, transform.scale(image, size))
+        return surface.blit(cache[2], (round(pos[0] * scale), round(pos[1] * scale)))
+
+    def collect_dirty_rects(self) -> list[Rect] | None:
+        """
+        Report the regions that changed since the previous call.
+
+        Returns:
+            list[Rect] | None: The old and new bounds if the object moved, resized,
+            was marked dirty or toggled drawing; an empty list if nothing changed;
+            None if the bounds are unknown and the whole surface must be redrawn.
+        """
+        bounds = self.get_bounds() if self.draw_enabled and self.visible else Rect(0, 0, 0, 0)
+        if bounds is None:
+            return None
+        previous = self._drawn_bounds
+        self._drawn_bounds = bounds
+        if not self.dirty and bounds == previous:
+            return []
+        self.dirty = False
+        return [rect for rect in (previous, bounds) if rect]
+
     def before_draw(self) -> None:
         """Hook called before drawing. Override as needed."""
 
@@ -187,11 +395,13 @@ class DrawableObject(Object, ABC):
         """
         Hook called with elapsed time if draw_profile is enabled.
 
+        Records an object span in the frame profiler by default.
+
         Args:
             elapsed (float): Time in seconds spent in draw().
             surface (Surface): The Pygame surface.
         """
-        # Override to log or collect draw timing.
+        FrameProfiler().record(f"{type(self).__name__}.draw", elapsed)
 
     def on_draw_error(self, exc: Exception):
         """Hook called if an exception occurs during draw."""
@@ -214,10 +424,21 @@ class EventfulObject(Object, ABC):
     - Supports binding multiple event handlers and event filtering.
     - Event type-based handler registry.
     - Optional event profiling and error handling.
+    - Declares the event types it handles so containers only dispatch those.
+    - Containers call ``_event_dispatch_``, which skips the hooks a class does
+      not override and profiling while ``event_profile`` is off.
     """
 
     event_profile: bool = False
     event_enabled: bool = True  # Toggle Interaction on/off
+    event_types: tuple[int, ...] | None = None  # Event types to receive, e.g. (pygame.KEYDOWN,); None for all
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        if _overrides(cls, EventfulObject, "handle_xodex_event", "before_event", "after_event"):
+            cls._event_dispatch_ = cls.handle_xodex_event
+        else:
+            cls._event_dispatch_ = _event_fast
 
     def handle_xodex_event(self, event: Event, *args, **kwargs) -> None:
         """
@@ -236,6 +457,8 @@ class EventfulObject(Object, ABC):
             self.before_event()
             self.handle_event(event, *args, **kwargs)
             self.after_event()
+            if _latency_tracker.enabled:
+                _latency_tracker.handled(event)
         except Exception as exc:
             self.on_event_error(exc)
         finally:
@@ -265,11 +488,13 @@ class EventfulObject(Object, ABC):
         """
         Hook called with elapsed time if event_profile is enabled.
 
+        Records an object span in the frame profiler by default.
+
         Args:
             elapsed (float): Time in seconds spent in event().
             event (Event): The event being handled.
         """
-        # Override to log or collect event timing.
+        FrameProfiler().record(f"{type(self).__name__}.event", elapsed)
 
     def on_event_error(self, exc: Exception):
         """Hook called if an exception occurs during event handling."""
@@ -284,6 +509,35 @@ class EventfulObject(Object, ABC):
         self.event_enabled = False
 
 
+class CollidableObject(Object):
+    """
+    Mixin for objects that take part in scene collision detection.
+
+    With ``ENABLE_COLLISIONS`` on, scenes test their collidable objects after every
+    update and call ``on_collision`` for each overlapping pair. Combine with
+    LogicalObject and/or DrawableObject, and provide a ``rect``.
+
+    Layers are bit masks: an object is told about `other` when
+    ``self.collision_mask & other.collision_layer`` is non-zero.
+
+    Features:
+    - Layer/mask filtering of which objects detect each other.
+    - Optional pixel-exact tests with ``mask`` (a ``pygame.mask.Mask`` aligned with ``rect.topleft``).
+    """
+
+    collision_layer: int = 1  # Layers this object is on
+    collision_mask: int = -1  # Layers this object detects; -1 for all
+    mask: Mask | None = None  # Pixel mask for exact tests; None uses the rect
+
+    def on_collision(self, other: CollidableObject) -> None:
+        """
+        Called once per update for every detected object this one overlaps.
+
+        Args:
+            other (CollidableObject): The overlapping object.
+        """
+
+
 def make_xodex_object(
     cls=None,
     base_classes: tuple[type, ...] = (),
@@ -401,3 +655,45 @@ def make_xodex_object(
     if cls is None:
         return decorator
     return decorator(cls)
+
+
+# Dispatch for classes that keep the default wrapper and empty before/after hooks:
+# the same enabled checks and error handling, without the hook calls and timing.
+
+
+def _update_fast(self: LogicalObject, deltatime: float, *args, **kwargs) -> None:
+    if not self.update_enabled:
+        return
+    if self.update_profile:
+        self.update_xodex_object(deltatime, *args, **kwargs)
+        return
+    try:
+        self.perform_update(deltatime, *args, **kwargs)
+    except Exception as exc:
+        self.on_update_error(exc)
+
+
+def _draw_fast(self: DrawableObject, surface: Surface, *args, **kwargs) -> None:
+    if not self.draw_enabled or not self.visible:
+        return
+    if self.draw_profile:
+        self.draw_xodex_object(surface, *args, **kwargs)
+        return
+    try:
+        self.perform_draw(surface, *args, **kwargs)
+    except Exception as exc:
+        self.on_draw_error(exc)
+
+
+def _event_fast(self: EventfulObject, event: Event, *args, **kwargs) -> None:
+    if not self.event_enabled:
+        return
+    if self.event_profile:
+        self.handle_xodex_event(event, *args, **kwargs)
+        return
+    try:
+        self.handle_event(event, *args, **kwargs)
+        if _latency_tracker.enabled:
+            _latency_tracker.handled(event)
+    except Exception as exc:
+        self.on_event_error(exc)
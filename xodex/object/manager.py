@@ -12,6 +12,7 @@ from xodex.core.exceptions import AlreadyRegistered
 from xodex.core.exceptions import NotRegistered
 from xodex.core.exceptions import ObjectError
 from xodex.object.base import Object
+from xodex.object.pool import ObjectPool
 from xodex.utils.log import get_xodex_logger
 from xodex.utils.singleton import Singleton
 from xodex.utils.values import Values
@@ -30,6 +31,8 @@ class BaseManager(Singleton):
         - Registration and lookup by name, class, or index
         - Stack navigation (push, pop, replace, clear, swap, jump)
         - Hooks for before/after register/unregister
+        - Instance pools for registered classes
+        - Prefabs: prototype instances cloned on spawn
         - Async support for hooks
         - Logging for key actions
 
@@ -38,10 +41,15 @@ class BaseManager(Singleton):
         manager.register(MyObject, "MyObject")
         obj_cls = manager.get_object("MyObject")
         manager.unregister("MyObject")
+        bullets = manager.create_pool("Bullet", size=200)
+        manager.register_prefab("Goblin", Enemy("goblin.png", speed=3))
+        goblin = manager.spawn("Goblin", position=(100, 40))
     """
 
     def __init__(self):
         self.__object_classes: dict[str, type[Object]] = {}
+        self.__pools: dict[str, ObjectPool] = {}
+        self.__prefabs: dict[str, Object] = {}
         self._user_hooks: dict[str, list[Callable]] = {}
 
     # region Properties
@@ -88,6 +96,7 @@ class BaseManager(Singleton):
         if not self.is_registered(object_name):
             raise NotRegistered(f"The Object '{object_name}' is not registered.")
         del self.__object_classes[object_name]
+        self.__pools.pop(object_name, None)
         logger.info(f"Unregistered object '{object_name}'.")
         self._run_hook("after_unregister", object_name)
 
@@ -115,6 +124,8 @@ class BaseManager(Singleton):
     def clear(self) -> None:
         """Remove all registered object classes."""
         self.__object_classes.clear()
+        self.__pools.clear()
+        self.__prefabs.clear()
         logger.info("Cleared all registered objects.")
 
     # endregion
@@ -154,6 +165,105 @@ class BaseManager(Singleton):
 
     # endregion
 
+    # region Pools
+
+    def create_pool(self, object_name: str, size: int = 0, max_size: int | None = None) -> ObjectPool:
+        """
+        Create the instance pool of a registered object class, or grow the existing one.
+
+        Args:
+            object_name: Name of a registered class implementing ``reset(**kwargs)``.
+            size: Instances to preallocate.
+            max_size: Most free instances the pool keeps; None for no limit.
+
+        Raises:
+            KeyError: If the object is not registered.
+            ObjectError: If the class has no ``reset`` method.
+        """
+        pool = self.__pools.get(object_name)
+        if pool is None:
+            pool = self.__pools[object_name] = ObjectPool(self._get_object_(object_name), size, max_size)
+            logger.info(f"Created pool of {size} '{object_name}' objects.")
+        else:
+            pool.max_size = max_size
+            pool.preallocate(size)
+        return pool
+
+    def get_pool(self, object_name: str) -> ObjectPool:
+        """
+        Get the pool of a registered object class, creating an empty one if needed.
+
+        Raises:
+            KeyError: If the object is not registered.
+            ObjectError: If the class has no ``reset`` method.
+        """
+        pool = self.__pools.get(object_name)
+        return pool if pool is not None else self.create_pool(object_name)
+
+    def pool_stats(self) -> dict[str, dict]:
+        """Return ``ObjectPool.stats()`` for every pool, by object name."""
+        return {name: pool.stats() for name, pool in self.__pools.items()}
+
+    # endregion
+
+    # region Prefabs
+
+    def register_prefab(self, prefab_name: str, prototype: Object) -> None:
+        """
+        Register a fully built instance to spawn copies of.
+
+        Raises:
+            AlreadyRegistered: If a prefab is already registered under the name.
+            ObjectError: If the prototype is not an Object.
+        """
+        if not isinstance(prototype, Object):
+            raise ObjectError(f"{prototype!r} is not an Object.")
+        if prefab_name in self.__prefabs:
+            raise AlreadyRegistered(f"The prefab '{prefab_name}' is already registered.")
+        self.__prefabs[prefab_name] = prototype
+        logger.info(f"Registered prefab '{prefab_name}'.")
+
+    def unregister_prefab(self, prefab_name: str) -> None:
+        """
+        Unregister a prefab by name.
+
+        Raises:
+            NotRegistered: If the prefab is not registered.
+        """
+        if self.__prefabs.pop(prefab_name, None) is None:
+            raise NotRegistered(f"The prefab '{prefab_name}' is not registered.")
+        logger.info(f"Unregistered prefab '{prefab_name}'.")
+
+    def get_prefab(self, prefab_name: str) -> Object:
+        """
+        Get the prototype instance of a prefab.
+
+        Raises:
+            NotRegistered: If the prefab is not registered.
+        """
+        prototype = self.__prefabs.get(prefab_name)
+        if prototype is None:
+            raise NotRegistered(f"The prefab '{prefab_name}' is not registered.")
+        return prototype
+
+    def spawn(self, prefab_name: str, **overrides) -> Object:
+        """
+        Create an object from a prefab with ``Object.clone``.
+
+        The clone shares surfaces and fonts with the prototype, so no files are
+        loaded and nothing is rendered unless an override requires it.
+
+        Args:
+            prefab_name: Name of a registered prefab.
+            **overrides: Attributes or properties to set on the new object.
+
+        Raises:
+            NotRegistered: If the prefab is not registered.
+        """
+        return self.get_prefab(prefab_name).clone(**overrides)
+
+    # endregion
+
     # region Hooks
 
     def add_hook(self, event: str, callback: Callable) -> None:
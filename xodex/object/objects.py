@@ -6,35 +6,389 @@ Provides:
 - Base object types: DrawableObject, EventfulObject, LogicalObject.
 """
 
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Callable
 from collections.abc import Iterable
 
+from pygame import Rect
 from pygame import Surface
 from pygame.event import Event
 
+from xodex.object.base import CollidableObject
 from xodex.object.base import DrawableObject
 from xodex.object.base import EventfulObject
 from xodex.object.base import LogicalObject
 
 __all__ = ("Objects",)
 
+_SLOT_BITS = 32  # Low bits of a handle hold the slot, high bits its generation
+_SLOT_MASK = (1 << _SLOT_BITS) - 1
+_SPAWN = 0
+_DESPAWN = 1
+
 
 class Objects(list):
-    """A type-safe, ordered container for game objects."""
+    """
+    A type-safe, ordered container for game objects.
+
+    Each object can be in the container once; adding it again raises ValueError
+    and leaves the container unchanged.
+
+    Keeps ordered per-type views (``logical``, ``drawable``, ``eventful``,
+    ``collidable``) so the update, draw, event and collision phases only iterate
+    the objects they apply to, and a
+    ``draw_order`` list that stays sorted by ``z_index`` as objects are added,
+    removed or change layer.
+
+    Objects can be referred to by generational integer handles, which stay valid
+    while the object is in the container and never resolve to a later object.
+    ``spawn`` and ``despawn`` are buffered until ``flush`` (scenes flush after
+    every update), so they are safe while the container is being iterated and
+    all despawns of a frame are removed in one pass.
+    """
 
     _allowed_types_ = (LogicalObject, DrawableObject, EventfulObject)
+    _view_types_ = (LogicalObject, DrawableObject, EventfulObject, CollidableObject)
 
     def __init__(self):
         list.__init__(self)
+        self._erased_rects: list[Rect] = []
+        self._invalidated = True
+        self._views: dict[type, list] | None = {cls: [] for cls in self._view_types_}
+        self._draw_keys: list[tuple[float, float]] = []
+        self._draw_list: list[DrawableObject] = []
+        self._order: dict[int, float] = {}  # id(object) -> increasing key in container order
+        self._next_order = 0
+        self._version = 0
+        self._event_index: dict[int, list[EventfulObject]] | None = {}
+        self._event_all: list[EventfulObject] = []
+        self._event_version = 0
+        self._slots: list = []  # Slot -> object, or None when free
+        self._generations: list[int] = []
+        self._free_slots: list[int] = []
+        self._handles: dict[int, int] = {}  # id(object) -> handle
+        self._commands: list[tuple[int, object, Callable | None]] = []
+        self._tags: dict[str, dict[int, object]] = {}  # Tag -> {id(object): object}
+        self._names: dict[str, object] = {}
+        self._redraw_requested = False  # Set by objects' mark_dirty
 
     # region Private
     def _check_type_(self, item):
         if not isinstance(item, self._allowed_types_):
             raise ValueError(f"Object type: {type(item)}/{item} is not in {self._allowed_types_}")
+        self._check_name_(item, item.name)
+
+    def _check_new_(self, items: list) -> None:
+        """Check objects about to be added, before the container changes; each object may be added once."""
+        added = set()
+        for item in items:
+            self._check_type_(item)
+            if self in item._lookup_owners or id(item) in added:
+                raise ValueError(f"{item!r} is already in the container.")
+            added.add(id(item))
+
+    def _check_name_(self, item, name: str | None) -> None:
+        """Raise ValueError if another object in the container already has `name`."""
+        if name is not None and self._names.get(name, item) is not item:
+            raise ValueError(f"An object named '{name}' is already in the container.")
+
+    def _index_(self, item) -> None:
+        """Add an object to the tag and name indexes."""
+        item._lookup_owners += (self,)
+        for tag in item.tags:
+            tagged = self._tags.get(tag)
+            if tagged is None:
+                tagged = self._tags[tag] = {}
+            tagged[id(item)] = item
+        if item.name is not None:
+            self._names[item.name] = item
+
+    def _unindex_(self, item) -> None:
+        """Remove an object from the tag and name indexes."""
+        item._lookup_owners = tuple(owner for owner in item._lookup_owners if owner is not self)
+        for tag in item.tags:
+            tagged = self._tags.get(tag)
+            if tagged is not None:
+                tagged.pop(id(item), None)
+                if not tagged:
+                    del self._tags[tag]
+        if item.name is not None and self._names.get(item.name) is item:
+            del self._names[item.name]
+
+    def _reindex_(self, previous: list) -> None:
+        """Rebuild the tag and name indexes after a bulk change from the `previous` contents."""
+        for item in previous:
+            item._lookup_owners = tuple(owner for owner in item._lookup_owners if owner is not self)
+        self._tags = {}
+        self._names = {}
+        for item in self:
+            self._index_(item)
+
+    def _retag_(self, item, previous: frozenset[str]) -> None:
+        """Move an object whose tags changed from `previous` between tag sets."""
+        for tag in previous - item.tags:
+            tagged = self._tags.get(tag)
+            if tagged is not None:
+                tagged.pop(id(item), None)
+                if not tagged:
+                    del self._tags[tag]
+        for tag in item.tags - previous:
+            tagged = self._tags.get(tag)
+            if tagged is None:
+                tagged = self._tags[tag] = {}
+            tagged[id(item)] = item
+
+    def _rename_(self, item, previous: str | None) -> None:
+        """Re-key an object whose name changed from `previous`."""
+        if previous is not None and self._names.get(previous) is item:
+            del self._names[previous]
+        if item.name is not None:
+            self._names[item.name] = item
+
+    def _add_(self, item) -> None:
+        """Add an object appended at the end to the type views and the event-type index."""
+        self._version += 1
+        views = self._views
+        if views is not None:
+            self._order[id(item)] = self._next_order
+            self._next_order += 1
+            for cls, view in views.items():
+                if isinstance(item, cls):
+                    view.append(item)
+            if isinstance(item, DrawableObject):
+                self._draw_insert_(item)
+        self._subscribe_(item)
+        self._index_(item)
+
+    def _insert_(self, item, index: int) -> None:
+        """Add an object inserted at `index` to the type views and the event-type index."""
+        self._version += 1
+        views = self._views
+        if views is not None:
+            order = self._order
+            before = order[id(self[index - 1])] if index > 0 else None
+            after = order[id(self[index + 1])] if index + 1 < len(self) else None
+            if before is None:
+                key = self._next_order if after is None else after - 1
+            elif after is None:
+                key = before + 1
+            else:
+                key = (before + after) / 2
+            if before is not None and after is not None and not before < key < after:
+                self._renumber_()  # Keys ran out of precision between the neighbours
+            else:
+                order[id(item)] = key
+                self._next_order = max(self._next_order, key + 1)
+            for cls, view in views.items():
+                if isinstance(item, cls):
+                    self._place_(view, item)
+            if isinstance(item, DrawableObject):
+                self._draw_insert_(item)
+        self._subscribe_(item)
+        self._index_(item)
+
+    def _place_(self, view: list, item) -> None:
+        """Insert `item` into `view` (a list in container order) by its order key."""
+        order = self._order
+        key = order[id(item)]
+        low, high = 0, len(view)
+        if view and order[id(view[-1])] < key:
+            low = high  # Appended at the end
+        while low < high:
+            middle = (low + high) // 2
+            if order[id(view[middle])] < key:
+                low = middle + 1
+            else:
+                high = middle
+        view.insert(low, item)
+
+    def _renumber_(self) -> None:
+        """Reassign the order keys of every object from its container position."""
+        order = self._order
+        for position, item in enumerate(self):
+            order[id(item)] = position
+        self._next_order = len(self)
+        self._draw_keys = [(item.z_index, order[id(item)]) for item in self._draw_list]
+
+    def _erase_(self, item) -> None:
+        """Remember the last drawn area of a removed object so dirty-rect mode clears it."""
+        bounds = getattr(item, "_drawn_bounds", None)
+        if bounds:
+            self._erased_rects.append(bounds)
+        self._version += 1
+        views = self._views
+        if views is not None:
+            for cls, view in views.items():
+                if isinstance(item, cls):
+                    view.remove(item)
+            if isinstance(item, DrawableObject):
+                self._draw_remove_(item, item.z_index)
+            self._order.pop(id(item), None)
+        if isinstance(item, DrawableObject) and self in item._z_owners:
+            item._z_owners = tuple(owner for owner in item._z_owners if owner is not self)
+        self._unsubscribe_(item)
+        self._unindex_(item)
+        self._free_handle_(item)
+
+    def _free_handle_(self, item) -> None:
+        """Release the handle of an object leaving the container, invalidating it."""
+        handle = self._handles.pop(id(item), None)
+        if handle is not None:
+            slot = handle & _SLOT_MASK
+            self._slots[slot] = None
+            self._generations[slot] += 1
+            self._free_slots.append(slot)
+
+    def _prune_handles_(self) -> None:
+        """Release the handles of objects no longer in the container, after a bulk change."""
+        if not self._handles:
+            return
+        keep = {id(item) for item in self}
+        keep.update(id(item) for op, item, _ in self._commands if op == _SPAWN)
+        for item in [item for item in self._slots if item is not None and id(item) not in keep]:
+            self._free_handle_(item)
+
+    def _erase_many_(self, dead: dict[int, object]) -> None:
+        """Remove the objects in `dead` (keyed by id) in a single pass over the container and views."""
+        removed = [item for item in self if id(item) in dead]
+        if not removed:
+            return
+        super().__setitem__(slice(None), [item for item in self if id(item) not in dead])
+        self._version += 1
+        views = self._views
+        if views is not None:
+            for view in views.values():
+                view[:] = [item for item in view if id(item) not in dead]
+            keys, draw_list, order = self._draw_keys, self._draw_list, self._order
+            kept = [index for index, item in enumerate(draw_list) if id(item) not in dead]
+            self._draw_keys = [keys[index] for index in kept]
+            self._draw_list = [draw_list[index] for index in kept]
+            for item in removed:
+                order.pop(id(item), None)
+        if self._event_index is not None:
+            self._event_all[:] = [item for item in self._event_all if id(item) not in dead]
+            for subscribers in self._event_index.values():
+                subscribers[:] = [item for item in subscribers if id(item) not in dead]
+            self._event_version += 1
+        for item in removed:
+            bounds = getattr(item, "_drawn_bounds", None)
+            if bounds:
+                self._erased_rects.append(bounds)
+            if isinstance(item, DrawableObject) and self in item._z_owners:
+                item._z_owners = tuple(owner for owner in item._z_owners if owner is not self)
+            self._unindex_(item)
+            self._free_handle_(item)
+
+    def _view_(self, cls: type) -> list:
+        """Return the ordered view of objects of `cls`, rebuilding the views if needed."""
+        views = self._views
+        if views is None:
+            views = self._views = {cls: [] for cls in self._view_types_}
+            self._order = {id(item): position for position, item in enumerate(self)}
+            self._next_order = len(self)
+            for item in self:
+                for view_cls, view in views.items():
+                    if isinstance(item, view_cls):
+                        view.append(item)
+            self._draw_keys = []
+            self._draw_list = []
+            for item in views[DrawableObject]:
+                self._draw_insert_(item)
+        return views[cls]
+
+    def _draw_insert_(self, item: DrawableObject) -> None:
+        """Insert a drawable into the z-ordered draw list, ties in container order."""
+        if self not in item._z_owners:
+            item._z_owners += (self,)
+        key = (item.z_index, self._order[id(item)])
+        index = bisect_left(self._draw_keys, key)
+        self._draw_keys.insert(index, key)
+        self._draw_list.insert(index, item)
+
+    def _draw_remove_(self, item: DrawableObject, z_index: float) -> bool:
+        """Remove a drawable from the draw list; return False if it was not in it."""
+        key = self._order.get(id(item))
+        if key is None:
+            return False
+        index = bisect_left(self._draw_keys, (z_index, key))
+        if index == len(self._draw_list) or self._draw_list[index] is not item:
+            return False
+        del self._draw_keys[index]
+        del self._draw_list[index]
+        return True
+
+    def _reorder_(self, item: DrawableObject, previous: float) -> None:
+        """Move a drawable whose ``z_index`` changed from `previous` to its new position."""
+        if self._views is None:
+            return
+        if self._draw_remove_(item, previous):
+            self._draw_insert_(item)
+
+    def _invalidate_views_(self) -> None:
+        """Rebuild the type views and the event-type index on next use, after a reorder."""
+        self._version += 1
+        self._views = None
+        self.invalidate_event_index()
+
+    def _subscribe_(self, item) -> None:
+        """Add an object to the event-type index, in container order."""
+        if not isinstance(item, EventfulObject) or self._event_index is None:
+            return
+        self._event_version += 1
+        if item.event_types is None:
+            self._place_(self._event_all, item)
+            for subscribers in self._event_index.values():
+                self._place_(subscribers, item)
+        else:
+            for event_type in item.event_types:
+                if event_type not in self._event_index:
+                    self._event_index[event_type] = list(self._event_all)
+                self._place_(self._event_index[event_type], item)
+
+    def _unsubscribe_(self, item) -> None:
+        """Remove an object from the event-type index."""
+        if not isinstance(item, EventfulObject) or self._event_index is None:
+            return
+        self._event_version += 1
+        if item in self._event_all:
+            self._event_all.remove(item)
+        for subscribers in self._event_index.values():
+            if item in subscribers:
+                subscribers.remove(item)
+
+    def _build_event_index_(self) -> dict[int, list[EventfulObject]]:
+        """Rebuild the event-type index in container order."""
+        self._event_index = {}
+        self._event_all = []
+        for item in self._view_(EventfulObject):
+            self._subscribe_(item)
+        return self._event_index
 
     def __iadd__(self, other):
+        other = list(other)
+        self._check_new_(other)
+        result = super().__iadd__(other)
         for item in other:
-            self._check_type_(item)
-        return super().__iadd__(other)
+            self._add_(item)
+        return result
+
+    def __setitem__(self, index, value):
+        previous = list(self)
+        self._invalidated = True
+        self._invalidate_views_()
+        super().__setitem__(index, value)
+        self._prune_handles_()
+        self._reindex_(previous)
+
+    def __delitem__(self, index):
+        previous = list(self)
+        self._invalidated = True
+        self._invalidate_views_()
+        super().__delitem__(index)
+        self._prune_handles_()
+        self._reindex_(previous)
 
     # endregion
 
@@ -44,15 +398,18 @@ class Objects(list):
         """Append an object, enforcing allowed types or instantiating if class."""
         if isinstance(item, type) and issubclass(item, self._allowed_types_):
             item = item()
-        self._check_type_(item)
+        self._check_new_((item,))
         super().append(item)
+        self._add_(item)
 
     def insert(self, index, item) -> None:
         """Insert an object at a given index, enforcing allowed types or instantiating if class."""
         if isinstance(item, type) and issubclass(item, self._allowed_types_):
             item = item()
-        self._check_type_(item)
+        self._check_new_((item,))
+        index = max(index + len(self), 0) if index < 0 else min(index, len(self))
         super().insert(index, item)
+        self._insert_(item, index)
 
     def extend(self, iterable: Iterable) -> None:
         """Extend with an iterable, enforcing allowed types or instantiating if class."""
@@ -60,27 +417,311 @@ class Objects(list):
         for item in iterable:
             if isinstance(item, type) and issubclass(item, self._allowed_types_):
                 item = item()
-            self._check_type_(item)
             items.append(item)
+        self._check_new_(items)
         super().extend(items)
+        for item in items:
+            self._add_(item)
+
+    def remove(self, item) -> None:
+        """Remove the first occurrence of an object."""
+        super().remove(item)
+        self._erase_(item)
+
+    def pop(self, index: int = -1):
+        """Remove and return the object at index (default last)."""
+        item = super().pop(index)
+        self._erase_(item)
+        return item
+
+    def clear(self) -> None:
+        """Remove all objects, dropping pending spawns; callbacks of pending despawns still run."""
+        commands, self._commands = self._commands, []
+        self._invalidated = True
+        for item in self._view_(DrawableObject):
+            item._z_owners = tuple(owner for owner in item._z_owners if owner is not self)
+        for item in self:
+            item._lookup_owners = tuple(owner for owner in item._lookup_owners if owner is not self)
+        super().clear()
+        self._tags = {}
+        self._names = {}
+        self._views = {cls: [] for cls in self._view_types_}
+        self._draw_keys = []
+        self._draw_list = []
+        self._order = {}
+        self._next_order = 0
+        self._version += 1
+        self._event_index = {}
+        self._event_all = []
+        self._event_version += 1
+        for item in [item for item in self._slots if item is not None]:
+            self._free_handle_(item)
+        for op, item, callback in commands:
+            if op == _DESPAWN and callback is not None:
+                callback(item)
+
+    def sort(self, *args, **kwargs) -> None:
+        """Sort objects in place; forces a full redraw in dirty-rect mode."""
+        self._invalidated = True
+        self._invalidate_views_()
+        super().sort(*args, **kwargs)
+
+    def reverse(self) -> None:
+        """Reverse objects in place; forces a full redraw in dirty-rect mode."""
+        self._invalidated = True
+        self._invalidate_views_()
+        super().reverse()
+
+    @property
+    def logical(self) -> list[LogicalObject]:
+        """LogicalObjects in container order. Do not modify; change the container instead."""
+        return self._view_(LogicalObject)
+
+    @property
+    def drawable(self) -> list[DrawableObject]:
+        """DrawableObjects in container order. Do not modify; change the container instead."""
+        return self._view_(DrawableObject)
+
+    @property
+    def eventful(self) -> list[EventfulObject]:
+        """EventfulObjects in container order. Do not modify; change the container instead."""
+        return self._view_(EventfulObject)
+
+    @property
+    def collidable(self) -> list[CollidableObject]:
+        """CollidableObjects in container order. Do not modify; change the container instead."""
+        return self._view_(CollidableObject)
+
+    @property
+    def draw_order(self) -> list[DrawableObject]:
+        """DrawableObjects sorted by ``z_index``, ties in container order. Do not modify."""
+        self._view_(DrawableObject)
+        return self._draw_list
+
+    def in_draw_order(self, drawables: Iterable[DrawableObject]) -> list[DrawableObject]:
+        """Return `drawables`, which must be in the container, sorted like ``draw_order``."""
+        self._view_(DrawableObject)
+        order = self._order
+        return sorted(drawables, key=lambda obj: (obj.z_index, order[id(obj)]))
 
     def update_object(self, deltatime: float, *args, **kwargs) -> None:
         """Update all LogicalObjects."""
-        filtered: Iterable[LogicalObject] = filter(lambda x: isinstance(x, LogicalObject), self)
-        for object in filtered:
-            object.update_xodex_object(deltatime, *args, **kwargs)
+        for object in self._view_(LogicalObject):
+            object._update_dispatch_(deltatime, *args, **kwargs)
 
     def draw_object(self, surface: Surface, *args, **kwargs) -> None:
-        """Draw all DrawableObjects, sorted by z_index if present."""
-        filtered: Iterable[DrawableObject] = filter(lambda x: isinstance(x, DrawableObject), self)
-        sorted_objs = filtered  # sorted(filtered, key=lambda object: getattr(object, "z_index", 0))
-        for object in sorted_objs:
-            object.draw_xodex_object(surface, *args, **kwargs)
+        """Draw all DrawableObjects, sorted by z_index."""
+        for object in self.draw_order:
+            object._draw_dispatch_(surface, *args, **kwargs)
+
+    def consume_redraw_request(self) -> bool:
+        """Return True if an object was marked dirty since the last call."""
+        requested, self._redraw_requested = self._redraw_requested, False
+        return requested
+
+    def supports_render_scale(self) -> bool:
+        """Return True if every DrawableObject can draw at a reduced ``render_scale``."""
+        return all(obj.supports_render_scale for obj in self._view_(DrawableObject))
+
+    def draw_dirty_object(self, surface: Surface, background, *args, **kwargs) -> list[Rect] | None:
+        """
+        Redraw only the regions that changed since the last draw.
+
+        Every DrawableObject reports its old and new bounds. Each changed region is
+        restored from `background` and every object overlapping it is redrawn,
+        clipped to the region.
+
+        Args:
+            surface (Surface): The surface holding the previous frame.
+            background (Surface | tuple): Surface or color to restore regions from.
+
+        Returns:
+            list[Rect] | None: The regions that were redrawn, or None if a full redraw
+            is required (e.g. the container changed order or an object has no bounds).
+        """
+        if self._invalidated:
+            return None
+        drawables = self.draw_order
+        changed = self._erased_rects
+        self._erased_rects = []
+        for object in drawables:
+            rects = object.collect_dirty_rects()
+            if rects is None:
+                return None
+            changed.extend(rects)
+
+        area = surface.get_rect()
+        rects = [rect.clip(area) for rect in _join_spanned_rects_(_merge_rects_(changed), drawables)]
+        rects = [rect for rect in rects if rect]
+        for rect in rects:
+            surface.set_clip(rect)
+            if isinstance(background, Surface):
+                surface.blit(background, rect, rect)
+            else:
+                surface.fill(background, rect)
+            for object in drawables:
+                bounds = object._drawn_bounds
+                if bounds and bounds.colliderect(rect):
+                    object._draw_dispatch_(surface, *args, **kwargs)
+        surface.set_clip(None)
+        return rects
+
+    def reset_dirty_rects(self) -> None:
+        """Record the current bounds of all DrawableObjects as drawn, before a full redraw."""
+        self._invalidated = False
+        self._erased_rects.clear()
+        for object in self._view_(DrawableObject):
+            object.collect_dirty_rects()
 
     def handle_object(self, event: Event, *args, **kwargs) -> None:
-        """Dispatch event to all EventfulObjects."""
-        filtered: Iterable[EventfulObject] = filter(lambda x: isinstance(x, EventfulObject), self)
-        for object in filtered:
-            object.handle_xodex_event(event, *args, **kwargs)
+        """Dispatch event to the EventfulObjects subscribed to its type, in container order."""
+        index = self._event_index
+        if index is None:
+            index = self._build_event_index_()
+        for object in index.get(event.type, self._event_all):
+            object._event_dispatch_(event, *args, **kwargs)
+
+    def invalidate_event_index(self) -> None:
+        """Rebuild the event-type index before the next dispatch, e.g. after changing an object's ``event_types``."""
+        self._event_index = None
+        self._event_version += 1
+
+    @property
+    def version(self) -> int:
+        """Counter that changes whenever objects are added, removed or reordered."""
+        return self._version
+
+    @property
+    def event_version(self) -> int:
+        """Counter that changes whenever the set of event subscribers may have changed."""
+        return self._event_version
+
+    def event_types(self) -> set[int] | None:
+        """
+        Return the event types the EventfulObjects subscribe to.
+
+        Returns:
+            set[int] | None: The union of all ``event_types``, or None if any object
+            receives every event.
+        """
+        index = self._event_index
+        if index is None:
+            index = self._build_event_index_()
+        if self._event_all:
+            return None
+        return set(index)
 
     # endregion
+
+    # region Lookup
+
+    def tagged(self, tag: str) -> list:
+        """Return the objects carrying `tag`."""
+        tagged = self._tags.get(tag)
+        return list(tagged.values()) if tagged else []
+
+    def named(self, name: str):
+        """Return the object called `name`, or None."""
+        return self._names.get(name)
+
+    # endregion
+
+    # region Handles
+
+    def handle_of(self, item) -> int:
+        """Return the handle of an object in the container, assigning one if it has none."""
+        handle = self._handles.get(id(item))
+        if handle is None:
+            if self._free_slots:
+                slot = self._free_slots.pop()
+                self._slots[slot] = item
+            else:
+                slot = len(self._slots)
+                self._slots.append(item)
+                self._generations.append(0)
+            handle = self._handles[id(item)] = (self._generations[slot] << _SLOT_BITS) | slot
+        return handle
+
+    def get(self, handle: int):
+        """Return the object a handle refers to, or None if it has been removed."""
+        slot = handle & _SLOT_MASK
+        if slot < len(self._slots) and self._generations[slot] == handle >> _SLOT_BITS:
+            return self._slots[slot]
+        return None
+
+    def spawn(self, item) -> int:
+        """
+        Add an object at the next ``flush``.
+
+        Args:
+            item: An object, or an object class to instantiate.
+
+        Returns:
+            int: The object's handle, valid immediately.
+        """
+        if isinstance(item, type) and issubclass(item, self._allowed_types_):
+            item = item()
+        self._check_type_(item)
+        self._commands.append((_SPAWN, item, None))
+        return self.handle_of(item)
+
+    def despawn(self, target, callback: Callable | None = None) -> None:
+        """
+        Remove an object at the next ``flush``.
+
+        Args:
+            target: The object or its handle. Stale handles are ignored.
+            callback (Callable, optional): Called with the object once it has been removed.
+        """
+        item = self.get(target) if isinstance(target, int) else target
+        if item is not None:
+            self._commands.append((_DESPAWN, item, callback))
+
+    def flush(self) -> None:
+        """Apply pending spawns and despawns in the order they were requested."""
+        if not self._commands:
+            return
+        commands, self._commands = self._commands, []
+        dead: dict[int, object] = {}
+        for op, item, _ in commands:
+            if op == _SPAWN:
+                if id(item) in dead:
+                    self._erase_many_(dead)
+                    dead = {}
+                self.append(item)
+            else:
+                dead[id(item)] = item
+        self._erase_many_(dead)
+        for _op, item, callback in commands:
+            if callback is not None:
+                callback(item)
+
+    # endregion
+
+
+def _merge_rects_(rects: list[Rect]) -> list[Rect]:
+    """Union overlapping rects so no area is restored or redrawn twice."""
+    merged: list[Rect] = []
+    for rect in rects:
+        rect = Rect(rect)
+        index = rect.collidelist(merged)
+        while index != -1:
+            rect.union_ip(merged.pop(index))
+            index = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
+
+
+def _join_spanned_rects_(rects: list[Rect], drawables: list[DrawableObject]) -> list[Rect]:
+    """Join regions that share an object, so every object is redrawn at most once per frame."""
+    joined = True
+    while joined:
+        joined = False
+        for object in drawables:
+            bounds = object._drawn_bounds
+            hits = bounds.collidelistall(rects) if bounds else []
+            if len(hits) > 1:
+                union = rects[hits[0]].unionall([rects[index] for index in hits[1:]])
+                rects = _merge_rects_([rect for index, rect in enumerate(rects) if index not in hits] + [union])
+                joined = True
+    return rects
@@ -0,0 +1,170 @@
+"""Pool
+
+Reusable instances for objects that are spawned and discarded constantly
+(bullets, particles, pickups).
+
+- A pool preallocates instances of one object class and hands them out
+  instead of constructing new ones.
+- Handed-out objects are reinitialised through their ``reset(**kwargs)``
+  method; despawned objects go back to the pool rather than being freed,
+  once their container has flushed the despawn.
+- Hit and miss counts show whether the pool is large enough: a miss
+  constructs a new instance.
+
+Usage:
+    bullets = ObjectsManager().create_pool("Bullet", size=200)
+    bullet = bullets.spawn(scene.objects, pos=player.rect.center, velocity=(0, -8))
+    ...
+    bullets.despawn(bullet)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+from xodex.core.exceptions import ObjectError
+from xodex.object.base import Object
+
+__all__ = ("ObjectPool",)
+
+_RELEASED = object()  # State of an object that is not in use from the pool
+_DESPAWNING = object()  # State of an object waiting for its container's flush
+
+
+class ObjectPool:
+    """
+    Pool of reusable instances of one object class.
+
+    Pooled classes implement ``reset(**kwargs)``, which must fully reinitialise
+    the object, and can be constructed with no arguments (or through `factory`).
+
+    Attributes:
+        object_class (type[Object]): The pooled class.
+        max_size (int | None): Most free instances kept; extra released objects are dropped.
+        hits (int): Acquisitions served from the pool.
+        misses (int): Acquisitions that had to construct a new instance.
+    """
+
+    def __init__(
+        self,
+        object_class: type[Object],
+        size: int = 0,
+        max_size: int | None = None,
+        factory: Callable[[], Object] | None = None,
+    ):
+        if not callable(getattr(object_class, "reset", None)):
+            raise ObjectError(f"{object_class.__name__} cannot be pooled: it has no reset(**kwargs) method.")
+        self.object_class = object_class
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._factory = factory or object_class
+        self._free: list[Object] = []
+        self._active: dict[int, Any] = {}  # id(obj) -> container it was spawned into, or None
+        self.preallocate(size)
+
+    def __len__(self) -> int:
+        """Return the number of free instances."""
+        return len(self._free)
+
+    @property
+    def in_use(self) -> int:
+        """Number of instances handed out and not yet released."""
+        return len(self._active)
+
+    def preallocate(self, count: int) -> None:
+        """Construct instances until `count` are free (capped by `max_size`)."""
+        if self.max_size is not None:
+            count = min(count, self.max_size)
+        factory = self._factory
+        while len(self._free) < count:
+            self._free.append(factory())
+
+    # region Acquire/Release
+
+    def acquire(self, **kwargs) -> Object:
+        """
+        Take an instance from the pool, or construct one if it is empty.
+
+        Args:
+            **kwargs: Passed to the instance's ``reset``.
+
+        Returns:
+            Object: The reset instance.
+        """
+        if self._free:
+            obj = self._free.pop()
+            self.hits += 1
+        else:
+            obj = self._factory()
+            self.misses += 1
+        obj.reset(**kwargs)
+        self._active[id(obj)] = None
+        return obj
+
+    def release(self, obj: Object) -> None:
+        """
+        Return an acquired instance to the pool.
+
+        Raises:
+            ObjectError: If `obj` was not acquired from this pool or was already released.
+        """
+        if self._active.pop(id(obj), _RELEASED) is _RELEASED:
+            raise ObjectError(f"{obj!r} is not in use from this pool.")
+        if self.max_size is None or len(self._free) < self.max_size:
+            self._free.append(obj)
+
+    def spawn(self, container, **kwargs) -> Object:
+        """
+        Acquire an instance and spawn it into `container` (e.g. ``scene.objects``).
+
+        The instance joins the container at its next ``flush``.
+
+        Args:
+            container (Objects): The container to add the instance to.
+            **kwargs: Passed to the instance's ``reset``.
+        """
+        obj = self.acquire(**kwargs)
+        container.spawn(obj)
+        self._active[id(obj)] = container
+        return obj
+
+    def despawn(self, obj: Object) -> None:
+        """
+        Despawn an instance from its container; it returns to the pool once removed.
+
+        Raises:
+            ObjectError: If `obj` is not in use from this pool or is already despawning.
+        """
+        container = self._active.get(id(obj), _RELEASED)
+        if container is _RELEASED or container is _DESPAWNING:
+            raise ObjectError(f"{obj!r} is not in use from this pool.")
+        if container is None:
+            self.release(obj)
+            return
+        self._active[id(obj)] = _DESPAWNING
+        container.despawn(obj, self.release)
+
+    # endregion
+
+    def stats(self) -> dict[str, int | float]:
+        """
+        Return the pool's usage counters.
+
+        Returns:
+            dict: ``{"hits", "misses", "hit_rate", "free", "in_use"}``.
+        """
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 1.0,
+            "free": len(self._free),
+            "in_use": len(self._active),
+        }
+
+    def clear(self) -> None:
+        """Drop the free instances and forget handed-out ones; counters are kept."""
+        self._free.clear()
+        self._active.clear()
@@ -12,13 +12,20 @@ import pygame
 from pygame.event import Event
 
 from xodex.conf import settings
+from xodex.object import DrawableObject
 from xodex.object import Object
 from xodex.object.manager import ObjectsManager
 from xodex.object.objects import Objects
+from xodex.scene.camera import Camera
+from xodex.scene.collision import CollisionSystem
+from xodex.scene.spatial import SpatialGrid
 from xodex.utils.log import get_xodex_logger
 
 logger = get_xodex_logger(__name__)
 
+_RENDER_SCALE_STEP = 0.1  # Render scale change per adjustment
+_RENDER_SCALE_COOLDOWN = 30  # Frames to measure at a new render scale before adjusting again
+
 if TYPE_CHECKING:
     from xodex.scene.manager import SceneManager
 
@@ -49,6 +56,27 @@ class BaseScene(ABC):
         _first_entered (bool): Whether the scene has been entered at least once.
         _height (int): Scene surface height.
         _width (int): Scene surface width.
+        _dirty_rendering (bool): Redraw only changed regions (``DIRTY_RECTS`` setting).
+        _dirty_rects (list[pygame.Rect] | None): Regions redrawn by the last draw, or None if all.
+        _full_redraw (bool): Whether the next draw must repaint the whole surface.
+        direct_draw (bool): Class attribute; False keeps the scene on its offscreen
+            surface when ``DIRECT_RENDERING`` is on (e.g. for effects).
+        render_on_demand (bool): Class attribute marking a static scene that is only
+            redrawn when something changes (with ``ON_DEMAND_RENDERING``).
+        _redraw_requested (bool): Whether an on-demand scene must be drawn next frame.
+        dynamic_resolution (bool | None): Class attribute used when ``DYNAMIC_RESOLUTION``
+            is on; True lets the scene render at reduced resolution when over budget,
+            False never does, and None (default) does so if every drawable supports
+            ``render_scale``.
+        event_types (tuple[int, ...] | None): Class attribute listing event types the scene
+            handles itself besides its objects' (None for all). Used by ``EVENT_FILTERING``.
+        _render_scale (float): Scene surface resolution relative to the window.
+        _draw_time (float | None): Smoothed draw time in milliseconds at the current scale.
+        spatial_cell_size (int): Class attribute; grid cell size in pixels of the spatial index.
+        _spatial (SpatialGrid | None): Spatial index of objects with a rect, created on first use.
+        _collisions (CollisionSystem | None): Tests CollidableObjects after each update
+            (``ENABLE_COLLISIONS`` setting).
+        _camera (Camera | None): Viewport that scrolls and culls drawing, if set.
 
     Methods:
         elapsed: Elapsed time since scene started (seconds).
@@ -57,8 +85,18 @@ class BaseScene(ABC):
         get_object(object_name): Get an object by name from the manager.
         size: Returns the scene's window size.
         draw_scene: Draw all objects to the scene surface.
-        update_scene: Update all objects in the scene.
+        can_draw_direct/draw_direct: Draw straight onto the display surface.
+        dirty_rects: Regions changed by the last draw_scene (None for the whole surface).
+        invalidate: Force a full redraw on the next draw_scene.
+        request_redraw/needs_redraw: Request and query on-demand redraws.
+        render_scale: Scene surface resolution relative to the window.
+        spatial/invalidate_spatial: Spatial index for point, rect, radius and ray queries.
+        camera/set_camera: Scrolling viewport that skips drawing off-screen objects.
+        set_render_scale: Resize the scene surface to a fraction of the window.
+        update_render_scale: Adjust the render scale from a measured draw time.
+        update_scene: Update all objects in the scene, then detect collisions.
         handle_scene: Handle an event for all objects.
+        subscribed_event_types: Event types the scene and its objects handle.
         setup: Clear and regenerate scene objects.
         pause/resume/toggle_pause: Control scene pause state.
         is_paused: Check if the scene is paused.
@@ -66,7 +104,8 @@ class BaseScene(ABC):
         get_background_color: Get the background color.
         add_event: Add an event to the scene queue.
         dispatch_events: Dispatch all queued events.
-        filter_objects: Filter objects by type or predicate.
+        filter_objects: Filter objects by type, tag or predicate.
+        get_by_name: Get an object by its unique name.
         snapshot: Return a copy of the scene surface.
         export_image: Save the scene surface to an image file.
         save_state/load_state: Save/load scene state (basic).
@@ -81,6 +120,12 @@ class BaseScene(ABC):
                 yield MyEnemy()
     """
 
+    dynamic_resolution: bool | None = None
+    direct_draw: bool = True
+    render_on_demand: bool = False
+    event_types: tuple[int, ...] | None = ()
+    spatial_cell_size: int = 64
+
     def __init__(self, *args, **kwargs) -> BaseScene:
         """
         Initialize the scene, loading settings and preparing the surface and objects.
@@ -101,6 +146,20 @@ class BaseScene(ABC):
         self._width = self._size[0]
         self._event_queue: list[Event] = []
         self._debug_overlay = False
+        self._dirty_rendering = settings.DIRTY_RECTS
+        self._dirty_rects: list[pygame.Rect] | None = None
+        self._full_redraw = True
+        self._redraw_requested = True
+        self._render_scale = 1.0
+        self._draw_time: float | None = None
+        self._scale_cooldown = 0
+        self._spatial: SpatialGrid | None = None
+        self._spatial_stale = True
+        self._spatial_version = -1
+        self._spatial_moved: set[str] = set()  # Views of objects that may have moved since the last sync
+        self._unbounded: dict[int, DrawableObject] = {}  # Drawables the spatial index cannot hold
+        self._collisions = CollisionSystem() if settings.ENABLE_COLLISIONS else None
+        self._camera: Camera | None = None
 
     def __str__(self):
         """Return a string representation of the Scene."""
@@ -128,12 +187,38 @@ class BaseScene(ABC):
             size (tuple[int, int]): New window size.
         """
         self._size = size
-        self._screen = pygame.Surface(self._size)
+        self._screen = pygame.Surface(self._scaled_size())
         self._height = self._size[1]
         self._width = self._size[0]
+        self.invalidate()
         if self._debug:
             logger.info(f"SceneWindow resized to: {self._size}")
 
+    def _draw_objects_(self, surface: pygame.Surface, *args, **kwargs) -> None:
+        """Draw the objects in z order; with a camera, only those in view, offset by it."""
+        camera = self._camera
+        if camera is None:
+            self._objects.draw_object(surface, *args, **kwargs)
+            return
+        visible = [obj for obj in self.spatial.query_rect(camera.view) if isinstance(obj, DrawableObject)]
+        # Objects without bounds are not indexed and are always drawn.
+        visible.extend(self._unbounded.values())
+        kwargs["view_offset"] = camera.offset
+        for obj in self._objects.in_draw_order(visible):
+            obj._draw_dispatch_(surface, *args, **kwargs)
+
+    def _mark_moved_(self, view: str) -> None:
+        """Re-bucket the objects of `view` (and collidables, if collisions run) on the next spatial use."""
+        self._spatial_moved.add(view)
+        if self._collisions is not None:
+            self._spatial_moved.add("collidable")
+
+    def _scaled_size(self) -> tuple[int, int]:
+        """Return the scene surface size at the current render scale."""
+        if self._render_scale == 1:
+            return self._size
+        return (max(1, round(self._size[0] * self._render_scale)), max(1, round(self._size[1] * self._render_scale)))
+
     # endregion
 
     # region Public
@@ -178,6 +263,15 @@ class BaseScene(ABC):
         """Return Scene Manager."""
         return self._manager
 
+    def get_by_name(self, name: str) -> Object | None:
+        """
+        Get an object in this scene by its ``name``.
+
+        Returns:
+            Object | None: The object, or None if no object has that name.
+        """
+        return self._objects.named(name)
+
     def get_object(self, object_name: str) -> Object | None:
         """
         Get an object by name from the global object manager.
@@ -195,28 +289,231 @@ class BaseScene(ABC):
         """Return the Scene Screen Size (width, height)."""
         return self._size
 
+    @property
+    def dirty_rects(self) -> list[pygame.Rect] | None:
+        """Regions changed by the last draw_scene, or None if the whole surface changed."""
+        return self._dirty_rects
+
+    def invalidate(self) -> None:
+        """Force the next draw_scene to repaint the whole surface."""
+        self._full_redraw = True
+        self._redraw_requested = True
+
+    def request_redraw(self) -> None:
+        """Ask for the scene to be drawn on the next frame in on-demand rendering mode."""
+        self._redraw_requested = True
+
+    def needs_redraw(self) -> bool:
+        """
+        Return whether the next frame must be drawn.
+
+        With ``ON_DEMAND_RENDERING`` on, a paused scene or one with
+        ``render_on_demand`` is only redrawn after an event, ``request_redraw``,
+        ``invalidate`` or an object's ``mark_dirty``. Other scenes always redraw.
+        Calling this consumes the pending request.
+
+        Returns:
+            bool: True if the scene should be drawn.
+        """
+        if not settings.ON_DEMAND_RENDERING or not (self.render_on_demand or self._paused):
+            return True
+        redraw = self._objects.consume_redraw_request() or self._redraw_requested
+        self._redraw_requested = False
+        return redraw
+
+    @property
+    def spatial(self) -> SpatialGrid:
+        """
+        Spatial index of the objects that have a ``rect`` or bounds.
+
+        Synced on first access after a change to the container. After an update
+        or an event only the objects that could have moved (logical, eventful and
+        collidable ones) are re-bucketed. Call ``invalidate_spatial`` after moving
+        objects anywhere else.
+        """
+        if self._spatial is None:
+            self._spatial = SpatialGrid(self.spatial_cell_size)
+        objects = self._objects
+        if self._spatial_stale or self._spatial_version != objects.version:
+            unbounded = self._spatial.sync(objects)
+            self._unbounded = {id(obj): obj for obj in unbounded if isinstance(obj, DrawableObject)}
+            self._spatial_stale = False
+            self._spatial_version = objects.version
+            self._spatial_moved.clear()
+        elif self._spatial_moved:
+            moved = [obj for name in self._spatial_moved for obj in getattr(objects, name)]
+            unbounded = {id(obj) for obj in self._spatial.update(moved)}
+            for obj in moved:
+                if id(obj) in unbounded and isinstance(obj, DrawableObject):
+                    self._unbounded[id(obj)] = obj
+                else:
+                    self._unbounded.pop(id(obj), None)
+            self._spatial_moved.clear()
+        return self._spatial
+
+    @property
+    def camera(self) -> Camera | None:
+        """The scene's camera, or None when the scene is drawn unscrolled."""
+        return self._camera
+
+    def set_camera(self, camera: Camera | None) -> None:
+        """
+        Draw the scene through `camera`, or without a camera if None.
+
+        With a camera, objects are drawn with the ``view_offset`` draw kwarg and
+        objects whose bounds are outside the view are not drawn at all. The
+        camera is updated after the scene's objects.
+        """
+        if camera is not None:
+            camera.shake_enabled = settings.ENABLE_SCREEN_SHAKE
+        self._camera = camera
+        self.invalidate()
+
+    def invalidate_spatial(self) -> None:
+        """Resync the spatial index on its next use."""
+        self._spatial_stale = True
+
+    @property
+    def render_scale(self) -> float:
+        """Scene surface resolution relative to the window (1.0 is full resolution)."""
+        return self._render_scale
+
+    def set_render_scale(self, scale: float) -> None:
+        """
+        Render the scene into a surface `scale` times the window size.
+
+        The game upscales the result to the window and passes ``render_scale``
+        to ``draw_scene`` so objects can draw at the reduced size.
+
+        Args:
+            scale (float): Resolution factor in ``(0, 1]``.
+        """
+        self._render_scale = min(1.0, max(scale, _RENDER_SCALE_STEP))
+        self._screen = pygame.Surface(self._scaled_size())
+        self.invalidate()
+        self._draw_time = None
+        self._scale_cooldown = _RENDER_SCALE_COOLDOWN
+
+    def update_render_scale(self, draw_time: float) -> None:
+        """
+        Adjust the render scale from the draw time of the last frame.
+
+        Lowers the scale while the smoothed draw time exceeds
+        ``DYNAMIC_RESOLUTION_TARGET`` and raises it again once the draw time,
+        projected to the larger surface, leaves headroom. Each change is followed
+        by a cooldown so the scale does not oscillate.
+
+        Args:
+            draw_time (float): Milliseconds spent in ``draw_scene``.
+        """
+        if not settings.DYNAMIC_RESOLUTION or self.dynamic_resolution is False:
+            return
+        if self._draw_time is None:
+            self._draw_time = draw_time
+        else:
+            self._draw_time += (draw_time - self._draw_time) * 0.1
+        if self._scale_cooldown:
+            self._scale_cooldown -= 1
+            return
+
+        target = settings.DYNAMIC_RESOLUTION_TARGET
+        scale = self._render_scale
+        if self._draw_time > target and scale > settings.DYNAMIC_RESOLUTION_MIN_SCALE:
+            if self.dynamic_resolution is None and not self._objects.supports_render_scale():
+                return
+            self.set_render_scale(max(settings.DYNAMIC_RESOLUTION_MIN_SCALE, scale - _RENDER_SCALE_STEP))
+        elif scale < 1:
+            # Draw cost grows with the pixel count, i.e. with the square of the scale.
+            higher = min(1.0, scale + _RENDER_SCALE_STEP)
+            if self._draw_time * (higher / scale) ** 2 < target * 0.8:
+                self.set_render_scale(higher)
+
     def draw_scene(self, *args, **kwargs) -> pygame.Surface:
         """
         Draw all objects to the scene surface, and optionally the debug overlay.
 
+        Positional and keyword arguments are forwarded to every object's
+        ``draw_xodex_object``, e.g. ``alpha`` in fixed-timestep mode.
+
+        In dirty-rect mode only regions whose objects moved or changed are
+        repainted and listed in ``dirty_rects``. Below full render scale or with
+        a camera the whole surface is always repainted.
+
         Returns:
             pygame.Surface: The updated scene surface.
         """
+        if (
+            self._dirty_rendering
+            and not self._full_redraw
+            and not self._debug_overlay
+            and self._render_scale == 1
+            and self._camera is None
+        ):
+            rects = self._objects.draw_dirty_object(self._screen, self._background_color, *args, **kwargs)
+            if rects is not None:
+                self._dirty_rects = rects
+                return self._screen
+
+        if self._dirty_rendering:
+            self._objects.reset_dirty_rects()
+            self._full_redraw = False
         self._screen.fill(self._background_color)
-        self._objects.draw_object(self._screen, *args, **kwargs)
+        self._draw_objects_(self._screen, *args, **kwargs)
         if self._debug_overlay:
             self.draw_debug_overlay()
+        self._dirty_rects = None
         return self._screen
 
+    def can_draw_direct(self, surface: pygame.Surface) -> bool:
+        """
+        Return whether the scene can draw straight onto `surface` with ``draw_direct``.
+
+        Requires ``direct_draw``, the default ``draw_scene`` (scenes overriding it
+        may depend on their own surface, e.g. for effects), full render scale and
+        a surface of the scene's size.
+        """
+        return (
+            self.direct_draw
+            and type(self).draw_scene is BaseScene.draw_scene
+            and self._render_scale == 1
+            and surface.get_size() == self._size
+        )
+
+    def draw_direct(self, surface: pygame.Surface, *args, **kwargs) -> pygame.Surface:
+        """
+        Draw all objects straight onto `surface`, such as the display, skipping the scene surface.
+
+        Args:
+            surface (pygame.Surface): The target surface.
+
+        Returns:
+            pygame.Surface: `surface`.
+        """
+        surface.fill(self._background_color)
+        self._draw_objects_(surface, *args, **kwargs)
+        if self._debug_overlay:
+            self.draw_debug_overlay(surface)
+        self._dirty_rects = None
+        return surface
+
     def update_scene(self, deltatime: float, *args, **kwargs) -> None:
         """
         Update all objects in the scene, unless paused.
 
+        With ``ENABLE_COLLISIONS`` on, collisions between CollidableObjects are
+        detected and reported through ``on_collision`` after the update.
+
         Args:
             deltatime (float): Time since last update (ms).
         """
         if not self._paused:
+            self._mark_moved_("logical")
             self._objects.update_object(deltatime, *args, **kwargs)
+            if self._collisions is not None:
+                self._collisions.step(self._objects.collidable)
+            self._objects.flush()
+            if self._camera is not None:
+                self._camera.update(deltatime)
 
     async def async_update_scene(self, deltatime: float, *args, **kwargs) -> None:
         """
@@ -224,7 +521,13 @@ class BaseScene(ABC):
         """
         if not self._paused:
             await asyncio.sleep(0)
+            self._mark_moved_("logical")
             self._objects.update_object(deltatime, *args, **kwargs)
+            if self._collisions is not None:
+                self._collisions.step(self._objects.collidable)
+            self._objects.flush()
+            if self._camera is not None:
+                self._camera.update(deltatime)
 
     def handle_scene(self, event: Event, *args, **kwargs) -> None:
         """
@@ -233,11 +536,32 @@ class BaseScene(ABC):
         Args:
             event (pygame.event.Event): The event to handle.
         """
+        self._redraw_requested = True
         if event.type == pygame.VIDEORESIZE:
             self._on_resize(event.size)
         if not self._paused:
+            self._spatial_moved.add("eventful")
             self._objects.handle_object(event, *args, **kwargs)
 
+    def subscribed_event_types(self) -> set[int] | None:
+        """
+        Return the event types this scene and its objects handle.
+
+        A subclass that overrides ``handle_scene`` without declaring
+        ``event_types`` is assumed to need every event.
+
+        Returns:
+            set[int] | None: The event types, or None if every event is needed.
+        """
+        if self.event_types is None:
+            return None
+        if not self.event_types and type(self).handle_scene is not BaseScene.handle_scene:
+            return None
+        types = self._objects.event_types()
+        if types is None:
+            return None
+        return types | set(self.event_types) | {pygame.VIDEORESIZE}
+
     def add_event(self, event: Event) -> None:
         """
         Add an event to the scene's event queue.
@@ -259,18 +583,24 @@ class BaseScene(ABC):
         self,
         predicate: Callable[[Any], bool] | None = None,
         obj_type: type | None = None,
+        tag: str | None = None,
     ) -> list:
         """
-        Filter objects in the scene by a predicate or type.
+        Filter objects in the scene by a predicate, type or tag.
+
+        Filtering by tag only looks at the objects carrying it.
 
         Args:
             predicate: Callable that returns True for objects to include.
             obj_type: Type to filter by.
+            tag: Tag the objects must carry.
 
         Returns:
             list: Filtered objects.
         """
-        objs = list(self._objects)
+        objs = self._objects.tagged(tag) if tag is not None else self._objects
+        if not obj_type and not predicate:
+            return list(objs)
         if obj_type:
             objs = [o for o in objs if isinstance(o, obj_type)]
         if predicate:
@@ -319,17 +649,23 @@ class BaseScene(ABC):
         """
         self._paused = state.get("paused", self._paused)
         self._background_color = state.get("background_color", self._background_color)
+        self.invalidate()
 
     def toggle_debug_overlay(self) -> None:
         """
         Toggle the debug overlay on/off.
         """
         self._debug_overlay = not self._debug_overlay
+        self.invalidate()
 
-    def draw_debug_overlay(self) -> None:
+    def draw_debug_overlay(self, surface: pygame.Surface | None = None) -> None:
         """
         Draw debug information on the scene surface.
+
+        Args:
+            surface (pygame.Surface, optional): Surface to draw on instead of the scene surface.
         """
+        surface = self._screen if surface is None else surface
         font = pygame.font.SysFont("consolas", 16)
         info = [
             f"Scene: {self.__class__.__name__}",
@@ -340,7 +676,7 @@ class BaseScene(ABC):
         ]
         for i, line in enumerate(info):
             surf = font.render(line, True, (0, 0, 0))
-            self._screen.blit(surf, (8, 8 + i * 18))
+            surface.blit(surf, (8, 8 + i * 18))
 
     def setup(self):
         """
@@ -369,6 +705,7 @@ class BaseScene(ABC):
         """Pause the scene (updates and event handling will be skipped)."""
         if not self._paused:
             self._paused = True
+            self.request_redraw()
             self.on_pause()
             if self._debug:
                 logger.info(f"[{self.__class__.__name__}] Scene paused.")
@@ -377,6 +714,7 @@ class BaseScene(ABC):
         """Resume the scene (updates and event handling will continue)."""
         if self._paused:
             self._paused = False
+            self.request_redraw()
             self.on_resume()
             if self._debug:
                 logger.info(f"[{self.__class__.__name__}] Scene resumed.")
@@ -401,6 +739,7 @@ class BaseScene(ABC):
             color (tuple[int, int, int]): RGB color.
         """
         self._background_color = color
+        self.invalidate()
         if self._debug:
             logger.info(f"[{self.__class__.__name__}] Background color set to: {self._background_color}")
 
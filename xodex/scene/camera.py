@@ -0,0 +1,181 @@
+"""Camera
+
+Scrolling viewport for scenes.
+
+- Maps world coordinates to the screen with a scroll position and an optional
+  screen shake (``ENABLE_SCREEN_SHAKE``).
+- Scrolls directly, centres on a point, or smoothly follows a target with an
+  optional dead zone, clamped to the level bounds.
+- Scenes with a camera only draw objects whose bounds overlap the view and pass
+  the ``view_offset`` draw kwarg to the rest.
+
+Usage:
+    camera = Camera((720, 560), bounds=(0, 0, 8000, 560))
+    camera.follow(player, smoothing=120)
+    scene.set_camera(camera)
+    camera.shake(8, 300)
+"""
+
+from __future__ import annotations
+
+import math
+import random
+
+from pygame import Rect
+
+__all__ = ("Camera",)
+
+
+class Camera:
+    """
+    Viewport onto a scene's world.
+
+    Attributes:
+        size (tuple[int, int]): Viewport size in pixels.
+        bounds (Rect | None): World area the view is kept inside.
+        x (float): World x of the view's top-left corner.
+        y (float): World y of the view's top-left corner.
+        shake_enabled (bool): Whether ``shake`` has any effect; scenes set it from
+            ``ENABLE_SCREEN_SHAKE``.
+    """
+
+    def __init__(self, size: tuple[int, int], bounds=None, shake_enabled: bool = True):
+        self.size = tuple(size)
+        self.shake_enabled = shake_enabled
+        self.bounds = Rect(bounds) if bounds is not None else None
+        self.x = 0.0
+        self.y = 0.0
+        self._target = None
+        self._smoothing = 0.0
+        self._deadzone: Rect | None = None
+        self._shake_intensity = 0.0
+        self._shake_duration = 0.0
+        self._shake_left = 0.0
+        self._shake = (0, 0)
+
+    # region View
+
+    @property
+    def view(self) -> Rect:
+        """World area currently shown, widened by any active shake."""
+        view = Rect(round(self.x), round(self.y), *self.size)
+        if self._shake_left > 0:
+            margin = math.ceil(self._shake_intensity) * 2
+            view.inflate_ip(margin, margin)
+        return view
+
+    @property
+    def offset(self) -> tuple[int, int]:
+        """Translation from world to screen coordinates, including shake."""
+        return (self._shake[0] - round(self.x), self._shake[1] - round(self.y))
+
+    def to_screen(self, pos) -> tuple[int, int]:
+        """Convert a world position to screen coordinates."""
+        dx, dy = self.offset
+        return (pos[0] + dx, pos[1] + dy)
+
+    def to_world(self, pos) -> tuple[int, int]:
+        """Convert a screen position (e.g. the mouse) to world coordinates."""
+        dx, dy = self.offset
+        return (pos[0] - dx, pos[1] - dy)
+
+    def apply(self, rect) -> Rect:
+        """Return a world rect moved to screen coordinates."""
+        return Rect(rect).move(self.offset)
+
+    def is_visible(self, rect) -> bool:
+        """Return True if a world rect overlaps the view."""
+        return self.view.colliderect(rect)
+
+    # endregion
+
+    # region Movement
+
+    def move_to(self, x: float, y: float) -> None:
+        """Place the view's top-left corner at world ``(x, y)``."""
+        self.x, self.y = x, y
+        self._clamp()
+
+    def scroll(self, dx: float, dy: float) -> None:
+        """Move the view by ``(dx, dy)`` pixels."""
+        self.move_to(self.x + dx, self.y + dy)
+
+    def center_on(self, pos) -> None:
+        """Centre the view on a world position."""
+        self.move_to(pos[0] - self.size[0] / 2, pos[1] - self.size[1] / 2)
+
+    def follow(self, target, smoothing: float = 0.0, deadzone=None) -> None:
+        """
+        Keep `target` in view on every ``update``.
+
+        Args:
+            target: Object with a ``rect`` (world coordinates) to follow.
+            smoothing (float): Time constant in milliseconds for easing towards the
+                target; 0 snaps to it.
+            deadzone (Rect | tuple, optional): Screen area, relative to the view, the
+                target may move within without the camera moving.
+        """
+        self._target = target
+        self._smoothing = smoothing
+        self._deadzone = Rect(deadzone) if deadzone is not None else None
+
+    def stop_following(self) -> None:
+        """Stop following the current target."""
+        self._target = None
+
+    def shake(self, intensity: float, duration: float) -> None:
+        """
+        Shake the view; ignored unless `shake_enabled`.
+
+        Args:
+            intensity (float): Maximum offset in pixels, fading out over `duration`.
+            duration (float): Length of the shake in milliseconds.
+        """
+        if not self.shake_enabled:
+            return
+        self._shake_intensity = max(intensity, self._shake_intensity if self._shake_left > 0 else 0)
+        self._shake_duration = self._shake_left = duration
+
+    def update(self, deltatime: float) -> None:
+        """
+        Advance following and shake.
+
+        Args:
+            deltatime (float): Time since the last update in milliseconds.
+        """
+        if self._target is not None:
+            self._follow_target(deltatime)
+        if self._shake_left > 0:
+            self._shake_left -= deltatime
+            if self._shake_left > 0:
+                amount = self._shake_intensity * self._shake_left / self._shake_duration
+                self._shake = (round(random.uniform(-amount, amount)), round(random.uniform(-amount, amount)))
+            else:
+                self._shake = (0, 0)
+
+    # endregion
+
+    # region Private
+
+    def _follow_target(self, deltatime: float) -> None:
+        """Move towards the position that keeps the target centred or inside the dead zone."""
+        cx, cy = self._target.rect.center
+        if self._deadzone is None:
+            goal_x, goal_y = cx - self.size[0] / 2, cy - self.size[1] / 2
+        else:
+            zone = self._deadzone
+            goal_x = min(max(self.x, cx - zone.right), cx - zone.left)
+            goal_y = min(max(self.y, cy - zone.bottom), cy - zone.top)
+        blend = 1.0 if self._smoothing <= 0 else 1 - math.exp(-deltatime / self._smoothing)
+        self.move_to(self.x + (goal_x - self.x) * blend, self.y + (goal_y - self.y) * blend)
+
+    def _clamp(self) -> None:
+        """Keep the view inside `bounds`."""
+        bounds = self.bounds
+        if bounds is None:
+            return
+        width, height = self.size
+        self.x = bounds.left if bounds.width <= width else min(max(self.x, bounds.left), bounds.right - width)
+        self.y = bounds.top if bounds.height <= height else min(max(self.y, bounds.top), bounds.bottom - height)
+
+    # endregion
@@ -112,6 +112,11 @@ class BaseManager(Singleton):
         """Return True if a scene is registered by name."""
         return scene_name in self.__scene_classes
 
+    def clear_registry(self) -> None:
+        """Remove all registered scene classes."""
+        self.__scene_classes.clear()
+        logger.info("Cleared all registered scenes.")
+
     # endregion
 
     # region Registry Lookup
@@ -0,0 +1,273 @@
+"""Spatial
+
+Uniform-grid spatial index for scene objects.
+
+- Objects are bucketed by their ``rect`` (or ``get_bounds()``) into square
+  cells of ``cell_size`` pixels.
+- ``sync`` reconciles the index with a container: new objects are inserted,
+  removed ones dropped, and only objects whose rect changed are re-bucketed.
+- ``update`` does the same for just the objects that may have moved.
+- Point, rect, radius and ray queries only look at the cells they touch.
+
+Usage:
+    grid = SpatialGrid(cell_size=64)
+    grid.sync(scene.objects)
+    under_mouse = grid.query_point(pygame.mouse.get_pos())
+    nearby = grid.query_radius(player.rect.center, 200)
+    hits = grid.raycast(player.rect.center, (1, 0), 500)
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable
+from typing import Any
+
+from pygame import Rect
+
+__all__ = ("SpatialGrid",)
+
+
+class SpatialGrid:
+    """
+    Spatial hash of object rects on a uniform grid.
+
+    Objects are tracked by identity. ``sync`` reads an object's ``rect`` attribute,
+    or ``get_bounds()`` if it has none, and ignores objects with neither.
+
+    Attributes:
+        cell_size (int): Width and height of a grid cell in pixels.
+    """
+
+    def __init__(self, cell_size: int = 64):
+        self.cell_size = cell_size
+        self._cells: dict[tuple[int, int], dict[int, Any]] = {}
+        self._entries: dict[int, tuple[Any, Rect, tuple[int, int, int, int]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, obj) -> bool:
+        return id(obj) in self._entries
+
+    # region Maintenance
+
+    def insert(self, obj, rect) -> None:
+        """Add `obj` covering `rect`, or move it there if it is already indexed."""
+        if id(obj) in self._entries:
+            self.move(obj, rect)
+            return
+        rect = Rect(rect)
+        span = self._span(rect)
+        self._entries[id(obj)] = (obj, rect, span)
+        self._link(obj, span)
+
+    def move(self, obj, rect) -> None:
+        """Update the rect of an indexed object; cells are only touched if its span changed."""
+        entry = self._entries.get(id(obj))
+        if entry is None:
+            self.insert(obj, rect)
+            return
+        rect = Rect(rect)
+        span = self._span(rect)
+        if span != entry[2]:
+            self._unlink(obj, entry[2])
+            self._link(obj, span)
+        self._entries[id(obj)] = (obj, rect, span)
+
+    def remove(self, obj) -> None:
+        """Drop `obj` from the index if present."""
+        entry = self._entries.pop(id(obj), None)
+        if entry is not None:
+            self._unlink(obj, entry[2])
+
+    def clear(self) -> None:
+        """Remove all objects."""
+        self._cells.clear()
+        self._entries.clear()
+
+    def update(self, objects: Iterable) -> list:
+        """
+        Re-bucket `objects`, leaving every other indexed object alone.
+
+        Objects with a rect are inserted or, if their rect changed, moved; ones
+        without a rect are removed.
+
+        Returns:
+            list: The objects of `objects` that have no rect.
+        """
+        entries = self._entries
+        unbounded = []
+        for obj in objects:
+            rect = getattr(obj, "rect", None)
+            if rect is None:
+                get_bounds = getattr(obj, "get_bounds", None)
+                rect = get_bounds() if get_bounds is not None else None
+                if rect is None:
+                    unbounded.append(obj)
+                    if id(obj) in entries:
+                        self.remove(obj)
+                    continue
+            entry = entries.get(id(obj))
+            if entry is None:
+                self.insert(obj, rect)
+            elif entry[1] != rect:
+                self.move(obj, rect)
+        return unbounded
+
+    def sync(self, objects: Iterable) -> list:
+        """
+        Make the index match `objects`.
+
+        Like ``update``, and indexed objects no longer in `objects` are removed.
+
+        Returns:
+            list: The objects of `objects` that have no rect.
+        """
+        objects = list(objects)
+        entries = self._entries
+        unbounded = self.update(objects)
+        if len(entries) != len(objects) - len(unbounded):
+            keep = {id(obj) for obj in objects}
+            for key in [key for key in entries if key not in keep]:
+                self.remove(entries[key][0])
+        return unbounded
+
+    # endregion
+
+    # region Queries
+
+    def query_point(self, pos) -> list:
+        """Return the objects whose rect contains `pos`."""
+        x, y = pos
+        cell = self._cells.get((math.floor(x / self.cell_size), math.floor(y / self.cell_size)), {})
+        return [obj for key, obj in cell.items() if self._entries[key][1].collidepoint(x, y)]
+
+    def query_rect(self, rect) -> list:
+        """Return the objects whose rect overlaps `rect`."""
+        rect = Rect(rect)
+        entries = self._entries
+        return [obj for key, obj in self._candidates(self._span(rect)) if entries[key][1].colliderect(rect)]
+
+    def query_radius(self, center, radius: float) -> list:
+        """Return the objects whose rect comes within `radius` of `center`."""
+        cx, cy = center
+        size = math.ceil(2 * radius) + 1
+        bounds = Rect(math.floor(cx - radius), math.floor(cy - radius), size, size)
+        limit = radius * radius
+        result = []
+        for key, obj in self._candidates(self._span(bounds)):
+            rect = self._entries[key][1]
+            dx = cx - min(max(cx, rect.left), rect.right)
+            dy = cy - min(max(cy, rect.top), rect.bottom)
+            if dx * dx + dy * dy <= limit:
+                result.append(obj)
+        return result
+
+    def raycast(self, origin, direction, max_distance: float) -> list[tuple[float, Any]]:
+        """
+        Cast a ray and return the objects it hits.
+
+        Args:
+            origin: Ray start ``(x, y)``.
+            direction: Ray direction ``(dx, dy)``; need not be normalised.
+            max_distance (float): Ray length in pixels.
+
+        Returns:
+            list[tuple[float, Any]]: ``(distance, object)`` pairs, nearest first.
+        """
+        ox, oy = origin
+        length = math.hypot(*direction)
+        if not length:
+            return []
+        dx, dy = direction[0] / length, direction[1] / length
+        size = self.cell_size
+        cx, cy = math.floor(ox / size), math.floor(oy / size)
+        step_x = 1 if dx > 0 else -1
+        step_y = 1 if dy > 0 else -1
+        next_x = ((cx + (dx > 0)) * size - ox) / dx if dx else math.inf
+        next_y = ((cy + (dy > 0)) * size - oy) / dy if dy else math.inf
+        delta_x = size / abs(dx) if dx else math.inf
+        delta_y = size / abs(dy) if dy else math.inf
+
+        hits: dict[int, tuple[float, Any]] = {}
+        travelled = 0.0
+        while travelled <= max_distance:
+            for key, obj in self._cells.get((cx, cy), {}).items():
+                if key not in hits:
+                    distance = _ray_rect_distance(ox, oy, dx, dy, self._entries[key][1])
+                    if distance is not None and distance <= max_distance:
+                        hits[key] = (distance, obj)
+            if next_x < next_y:
+                travelled, next_x, cx = next_x, next_x + delta_x, cx + step_x
+            else:
+                travelled, next_y, cy = next_y, next_y + delta_y, cy + step_y
+        return sorted(hits.values(), key=lambda hit: hit[0])
+
+    # endregion
+
+    # region Private
+
+    def _span(self, rect: Rect) -> tuple[int, int, int, int]:
+        """Return the inclusive cell range ``(x0, y0, x1, y1)`` covered by `rect`."""
+        size = self.cell_size
+        return (
+            rect.left // size,
+            rect.top // size,
+            (rect.right - 1) // size if rect.width else rect.left // size,
+            (rect.bottom - 1) // size if rect.height else rect.top // size,
+        )
+
+    def _link(self, obj, span) -> None:
+        x0, y0, x1, y1 = span
+        cells = self._cells
+        for x in range(x0, x1 + 1):
+            for y in range(y0, y1 + 1):
+                cell = cells.get((x, y))
+                if cell is None:
+                    cell = cells[x, y] = {}
+                cell[id(obj)] = obj
+
+    def _unlink(self, obj, span) -> None:
+        x0, y0, x1, y1 = span
+        cells = self._cells
+        for x in range(x0, x1 + 1):
+            for y in range(y0, y1 + 1):
+                cell = cells[x, y]
+                del cell[id(obj)]
+                if not cell:
+                    del cells[x, y]
+
+    def _candidates(self, span) -> Iterable[tuple[int, Any]]:
+        """Yield each object in the cells of `span` once."""
+        x0, y0, x1, y1 = span
+        cells = self._cells
+        if x0 == x1 and y0 == y1:
+            yield from cells.get((x0, y0), {}).items()
+            return
+        seen = set()
+        for x in range(x0, x1 + 1):
+            for y in range(y0, y1 + 1):
+                for key, obj in cells.get((x, y), {}).items():
+                    if key not in seen:
+                        seen.add(key)
+                        yield key, obj
+
+    # endregion
+
+
+def _ray_rect_distance(ox: float, oy: float, dx: float, dy: float, rect: Rect) -> float | None:
+    """Return the distance along a unit ray to `rect`, or None if it misses (slab test)."""
+    near, far = 0.0, math.inf
+    for origin, direction, low, high in ((ox, dx, rect.left, rect.right), (oy, dy, rect.top, rect.bottom)):
+        if direction:
+            t1 = (low - origin) / direction
+            t2 = (high - origin) / direction
+            if t1 > t2:
+                t1, t2 = t2, t1
+            near, far = max(near, t1), min(far, t2)
+            if near > far:
+                return None
+        elif not low <= origin <= high:
+            return None
+    return near
@@ -0,0 +1,146 @@
+"""Latency
+
+Input-to-present latency measurement for the Xodex game loop.
+
+- Events are stamped with ``xodex_timestamp`` when the game pumps them.
+- ``EventfulObject.handle_xodex_event`` marks the events objects handled.
+- When the next frame has been flipped, each handled event becomes one
+  latency sample for its event type.
+- Reports per-type percentiles and a bucketed histogram.
+
+pygame 2 events carry no SDL timestamp, so time spent in SDL's queue before
+the pump (up to one frame) is not included.
+
+Usage:
+    from xodex.utils.latency import LatencyTracker
+
+    tracker = LatencyTracker()
+    tracker.enable()
+    ...
+    print(tracker.report())
+"""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from collections.abc import Iterable
+
+import pygame
+from pygame.event import Event
+
+from xodex.utils.singleton import Singleton
+from xodex.utils.stats import percentiles
+
+__all__ = ("LatencyTracker",)
+
+BUCKETS = (4, 8, 16, 33, 50, 100, 250)  # Histogram bucket upper bounds in milliseconds
+
+
+class LatencyTracker(Singleton):
+    """
+    Records input-to-present latency per event type.
+
+    Attributes:
+        enabled (bool): Whether events are stamped and samples recorded.
+    """
+
+    def __init__(self, capacity: int = 1000):
+        self.enabled = False
+        self._capacity = capacity
+        self._handled: dict[int, Event] = {}
+        self._samples: dict[int, deque[float]] = {}
+
+    def enable(self) -> None:
+        """Start measuring."""
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Stop measuring and drop events waiting for a present."""
+        self.enabled = False
+        self._handled.clear()
+
+    def clear(self) -> None:
+        """Drop all samples."""
+        self._handled.clear()
+        self._samples.clear()
+
+    # region Recording
+
+    def stamp(self, events: Iterable[Event], timestamp: float | None = None) -> None:
+        """
+        Stamp events that have no ``xodex_timestamp`` yet.
+
+        Args:
+            events (Iterable[Event]): Freshly pumped events.
+            timestamp (float, optional): ``time.perf_counter`` value; defaults to now.
+        """
+        timestamp = time.perf_counter() if timestamp is None else timestamp
+        for event in events:
+            if not hasattr(event, "xodex_timestamp"):
+                event.xodex_timestamp = timestamp
+
+    def handled(self, event: Event) -> None:
+        """Mark a stamped event as handled by an object in this frame."""
+        if hasattr(event, "xodex_timestamp"):
+            self._handled[id(event)] = event
+
+    def presented(self, timestamp: float | None = None) -> None:
+        """
+        Record a sample for every event handled since the last present.
+
+        Args:
+            timestamp (float, optional): When the flip finished; defaults to now.
+        """
+        if not self._handled:
+            return
+        timestamp = time.perf_counter() if timestamp is None else timestamp
+        for event in self._handled.values():
+            samples = self._samples.get(event.type)
+            if samples is None:
+                samples = self._samples[event.type] = deque(maxlen=self._capacity)
+            samples.append((timestamp - event.xodex_timestamp) * 1000)
+        self._handled.clear()
+
+    # endregion
+
+    # region Reporting
+
+    def samples(self, event_type: int) -> list[float]:
+        """Return the recorded latencies in milliseconds for an event type."""
+        return list(self._samples.get(event_type, ()))
+
+    def histogram(self) -> dict[str, dict]:
+        """
+        Summarise the latency of each event type.
+
+        Returns:
+            dict: ``{event name: {"count", "p50", "p95", "p99", "max", "buckets"}}`` in
+            milliseconds, where ``buckets`` maps ``"<=N ms"`` labels to sample counts.
+        """
+        result = {}
+        for event_type, samples in sorted(self._samples.items()):
+            buckets = {f"<={bound} ms": 0 for bound in BUCKETS}
+            buckets[f">{BUCKETS[-1]} ms"] = 0
+            for sample in samples:
+                bound = next((bound for bound in BUCKETS if sample <= bound), None)
+                buckets[f"<={bound} ms" if bound is not None else f">{BUCKETS[-1]} ms"] += 1
+            result[pygame.event.event_name(event_type)] = {
+                "count": len(samples),
+                **percentiles(samples),
+                "max": max(samples),
+                "buckets": buckets,
+            }
+        return result
+
+    def report(self) -> str:
+        """Return a one-line-per-type text summary of the histogram."""
+        lines = []
+        for name, entry in self.histogram().items():
+            lines.append(
+                f"{name}: n={entry['count']} p50={entry['p50']:.1f}ms "
+                f"p95={entry['p95']:.1f}ms p99={entry['p99']:.1f}ms max={entry['max']:.1f}ms"
+            )
+        return "\n".join(lines)
+
+    # endregion
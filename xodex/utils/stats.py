@@ -0,0 +1,39 @@
+"""Stats
+
+Small statistics helpers for frame timing and latency reports.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+
+__all__ = ("percentile", "percentiles")
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """
+    Return the nearest-rank `q` percentile of sorted `values`.
+
+    Args:
+        values (Sequence[float]): Values sorted in ascending order.
+        q (float): Percentile in ``[0, 100]``.
+
+    Returns:
+        float: The percentile, or 0.0 for no values.
+    """
+    if not values:
+        return 0.0
+    rank = math.ceil(q / 100 * len(values))
+    return values[min(len(values), max(rank, 1)) - 1]
+
+
+def percentiles(values: Sequence[float]) -> dict[str, float]:
+    """
+    Return the p50, p95 and p99 of unsorted `values`.
+
+    Returns:
+        dict: ``{"p50", "p95", "p99"}``.
+    """
+    values = sorted(values)
+    return {f"p{q}": percentile(values, q) for q in (50, 95, 99)}